@@ -20,12 +20,22 @@ async def add_logbook_column():
     conn = await aiosqlite.connect(db_path)
 
     try:
+        # WAL persists in the database file, so later writers benefit too
+        await conn.execute("PRAGMA journal_mode=WAL")
+        await conn.execute("PRAGMA synchronous=NORMAL")
+
+        # Check and alter in one write transaction, so no other
+        # connection sees (or races) a half-applied migration
+        await conn.execute("BEGIN IMMEDIATE")
+
         # Check if column already exists
-        cursor = await conn.execute("PRAGMA table_info(memories)")
-        columns = await cursor.fetchall()
-        column_names = [col[1] for col in columns]
+        cursor = await conn.execute(
+            "SELECT 1 FROM pragma_table_info('memories') WHERE name = ? LIMIT 1",
+            ("logbook_path",)
+        )
 
-        if "logbook_path" in column_names:
+        if await cursor.fetchone() is not None:
+            await conn.rollback()
             print("✓ logbook_path column already exists")
             return
 
@@ -46,4 +56,10 @@ async def add_logbook_column():
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:  # Optional: faster event loop
+        pass
+
     asyncio.run(add_logbook_column())
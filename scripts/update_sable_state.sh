@@ -27,7 +27,10 @@ case "$COMMAND" in
     status|s)
         # Show current consciousness state
         FORMAT="${1:-rich}"
-        uv run sable status --format "$FORMAT"
+        case "$FORMAT" in
+            brief|json) uv run sable-brief "$FORMAT" ;;
+            *) uv run sable status --format "$FORMAT" ;;
+        esac
         ;;
 
     feel|f)
@@ -16,6 +16,13 @@ This system provides authentic emotional dynamics with:
 __version__ = "0.1.0"
 __author__ = "Taala"
 
-from sable.state.state_manager import StateManager
-
 __all__ = ["StateManager"]
+
+
+def __getattr__(name):
+    # StateManager loads pydantic and aiosqlite; defer that until it's used
+    # so lightweight entry points (e.g. the conversation hook) start fast
+    if name == "StateManager":
+        from sable.state.state_manager import StateManager
+        return StateManager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,54 @@
+"""
+sable-brief: `sable status` for hooks, without the full CLI.
+
+UserPromptSubmit hooks run `sable status --format brief` on every prompt.
+This entry point produces the same output for the brief and json formats
+but skips click, the command group and rich: it asks a running daemon
+first, and otherwise builds the state in-process.
+
+Usage: sable-brief [brief|json]
+"""
+
+import asyncio
+import sys
+
+_FORMATS = ("brief", "json")
+
+
+async def _render(format: str) -> str:
+    """Load the current state and render it in the given format."""
+    from sable.cli._status_output import status_brief, status_json
+    from sable.database.pool import close_pools
+    from sable.state.state_manager import StateManager
+
+    try:
+        manager = StateManager()
+        await manager.initialize()
+        state = await manager.get_current_state()
+    finally:
+        await close_pools()
+
+    return status_json(state) if format == "json" else status_brief(state)
+
+
+def main() -> None:
+    """Entry point for the `sable-brief` command."""
+    from sable.cli.daemon import request
+
+    args = sys.argv[1:]
+    format = args[0] if args else "brief"
+    if len(args) > 1 or format not in _FORMATS:
+        sys.stderr.write(f"Usage: sable-brief [{'|'.join(_FORMATS)}]\n")
+        sys.exit(2)
+
+    reply = request({"argv": ["status", "--format", format]})
+    if reply is not None:
+        sys.stdout.write(reply["stdout"])
+        sys.stderr.write(reply["stderr"])
+        sys.exit(reply["code"])
+
+    sys.stdout.write(asyncio.run(_render(format)))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,17 @@ Uses NLP to analyze text and extract emotional content, enabling
 automatic emotion tracking from conversations.
 """
 
-from sable.analysis.emotion_analyzer import EmotionAnalyzer, AnalysisResult
+__all__ = ["EmotionAnalyzer", "AnalysisResult", "EmotionCache", "get_analyzer"]
 
-__all__ = ["EmotionAnalyzer", "AnalysisResult"]
+
+def __getattr__(name):
+    # Submodules are imported on first use, so `sable analyze` and the
+    # conversation hook load only the analyzer (which opens the cache
+    # itself when enabled) rather than everything in this package
+    if name in ("EmotionAnalyzer", "AnalysisResult", "get_analyzer"):
+        from sable.analysis import emotion_analyzer
+        return getattr(emotion_analyzer, name)
+    if name == "EmotionCache":
+        from sable.analysis.emotion_cache import EmotionCache
+        return EmotionCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
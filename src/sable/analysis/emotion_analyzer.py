@@ -6,18 +6,28 @@ deep contextual understanding, handling nuance, sarcasm, metaphor,
 and implicit emotional expressions.
 """
 
+import asyncio
+import atexit
 import subprocess
-import json
-from typing import Dict, List, Optional
-from pydantic import BaseModel
+import queue
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import orjson
 
 from sable.models.emotion import EmotionType
 
 
-class AnalysisResult(BaseModel):
+class AnalysisResult(NamedTuple):
     """
     Result of emotion analysis on text.
 
+    A plain immutable record: analyses are built on every call and only
+    ever read, so they skip model validation.
+
     Attributes:
         text: The analyzed text
         emotions: Dict of emotion_type -> intensity (0-1)
@@ -29,7 +39,214 @@ class AnalysisResult(BaseModel):
     emotions: Dict[str, float]
     valence: float
     arousal: float
-    keywords: List[str] = []
+    keywords: Tuple[str, ...] = ()
+
+
+# Template for neutral results
+_NEUTRAL = AnalysisResult(text="", emotions={}, valence=0.0, arousal=0.5)
+
+# SYSTEM_PROMPT is written here once and passed to the CLI by path
+SYSTEM_PROMPT_PATH = Path.home() / ".sable" / "emotion_system_prompt.txt"
+
+# Word stems hinting at each emotion. Used only as a cheap precheck:
+# a stem match sends text on to Claude, it never decides the analysis.
+EMOTION_KEYWORDS: Dict[EmotionType, List[str]] = {
+    EmotionType.FEAR: [
+        'afraid', 'scare', 'scary', 'fear', 'terrif', 'frighten', 'panic',
+        'anxi', 'nervous', 'worr', 'dread', 'horri', 'horror',
+    ],
+    EmotionType.ANGER: [
+        'angry', 'anger', 'furious', 'mad', 'rage', 'hate', 'pissed',
+        'livid', 'outrag', 'irritat', 'resent',
+    ],
+    EmotionType.SADNESS: [
+        'sad', 'cry', 'crying', 'tears', 'depress', 'grief', 'griev',
+        'heartbr', 'lonely', 'miserable', 'unhappy', 'miss', 'hurt', 'lost',
+    ],
+    EmotionType.JOY: [
+        'happy', 'happi', 'joy', 'glad', 'delight', 'love', 'wonderful',
+        'great', 'awesome', 'amazing', 'thrill', 'excit', 'yay', 'fun',
+        'laugh', 'lol', 'haha', 'smile',
+    ],
+    EmotionType.DISGUST: [
+        'disgust', 'gross', 'yuck', 'ew', 'nasty', 'revolting', 'sick of',
+        'vile', 'repuls',
+    ],
+    EmotionType.SURPRISE: [
+        'surpris', 'wow', 'whoa', 'shock', 'astonish', 'unexpected', 'omg',
+        'unbeliev', 'no way',
+    ],
+    EmotionType.CONTENTMENT: [
+        'content', 'calm', 'peace', 'relax', 'comfort', 'satisf', 'cozy',
+        'serene', 'at ease',
+    ],
+    EmotionType.MALAISE: [
+        'tired', 'exhaust', 'drained', 'sick', 'unwell', 'meh', 'blah',
+        'sluggish', 'weary',
+    ],
+    EmotionType.UNEASE: [
+        'uneas', 'uncomfortable', 'awkward', 'weird', 'doubt', 'unsure',
+        'uncertain', 'suspicious', 'off about',
+    ],
+    EmotionType.TENSION: [
+        'tense', 'tension', 'stress', 'pressure', 'overwhelm', 'strain',
+        'on edge', 'wound up',
+    ],
+    EmotionType.ENTHUSIASM: [
+        'enthusias', 'eager', 'pumped', "can't wait", 'psyched', 'stoked',
+        'hyped', 'passion', 'let\'s go',
+    ],
+    EmotionType.DISCOURAGEMENT: [
+        'discourag', 'hopeless', 'give up', 'giving up', 'pointless',
+        'defeat', 'futile', 'useless', 'demoraliz',
+    ],
+    EmotionType.SHAME: [
+        'asham', 'shame', 'embarrass', 'humiliat', 'mortif', 'cringe',
+    ],
+    EmotionType.GUILT: [
+        'guilt', 'regret', 'my fault', 'apolog', 'sorry', 'forgive',
+    ],
+    EmotionType.PRIDE: [
+        'proud', 'pride', 'accomplish', 'achiev', 'nailed', 'triumph',
+    ],
+    EmotionType.ADMIRATION: [
+        'admir', 'impress', 'brilliant', 'respect', 'inspir', 'genius',
+        'beautiful', 'elegant',
+    ],
+    EmotionType.CONTEMPT: [
+        'contempt', 'pathetic', 'ridiculous', 'stupid', 'idiot', 'scorn',
+        'disdain', 'dumb',
+    ],
+    EmotionType.COMPASSION: [
+        'compassion', 'sympath', 'empath', 'care', 'kind', 'poor thing',
+        'feel for', 'hug',
+    ],
+    EmotionType.DESIRE: [
+        'want', 'wish', 'crave', 'desire', 'long for', 'yearn', 'need',
+        'tempt', 'seduc',
+    ],
+    EmotionType.CURIOSITY: [
+        'curious', 'wonder', 'intrigu', 'fascinat', 'interest', 'why',
+        'how come', 'what if',
+    ],
+    EmotionType.ANTICIPATION: [
+        'anticipat', 'looking forward', 'soon', 'hope', 'expect', 'await',
+        'tomorrow',
+    ],
+    EmotionType.FRUSTRATION: [
+        'frustrat', 'ugh', 'argh', 'stuck', 'annoy', 'fed up', 'damn',
+        'wtf', 'again?',
+    ],
+}
+
+# Any stem, allowing suffixes ("frighten" -> "frightened")
+_KEYWORD_RE = re.compile(
+    r"\b(?:"
+    + "|".join(sorted(
+        {re.escape(word) for words in EMOTION_KEYWORDS.values() for word in words},
+        key=len,
+        reverse=True
+    ))
+    + r")\w*",
+    re.IGNORECASE
+)
+
+
+# Outermost {...} span of a reply: skips prose and code fences around the JSON
+_JSON_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+class _AnalysisError(Exception):
+    """Raised when Claude cannot produce a usable analysis."""
+
+
+class _ClaudeWorker:
+    """
+    Long-lived claude CLI process answering prompts over stream-json.
+
+    One user message is written to stdin per prompt; the CLI emits several
+    events per turn on stdout, ending with a "result" event holding the reply.
+    A reader thread feeds stdout lines into a queue so replies can be awaited
+    with a timeout.
+    """
+
+    def __init__(self, argv: List[str]):
+        self.prompts_sent = 0
+        self._proc = subprocess.Popen(
+            argv,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1
+        )
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._reader = threading.Thread(target=self._read_lines, daemon=True)
+        self._reader.start()
+
+    def _read_lines(self) -> None:
+        """Forward stdout lines to the queue; None marks end of output."""
+        for line in self._proc.stdout:
+            self._lines.put(line)
+        self._lines.put(None)
+
+    def ask(self, prompt: str, timeout: float) -> str:
+        """
+        Send one prompt and wait for its result.
+
+        Args:
+            prompt: User prompt for Claude
+            timeout: Seconds to wait for the reply
+
+        Returns:
+            Text of Claude's reply
+
+        Raises:
+            BrokenPipeError: If the worker has exited
+            subprocess.TimeoutExpired: If no reply arrives in time
+            _AnalysisError: If Claude reports an error
+        """
+        message = {"type": "user", "message": {"role": "user", "content": prompt}}
+        self._proc.stdin.write(orjson.dumps(message).decode() + "\n")
+        self._proc.stdin.flush()
+        self.prompts_sent += 1
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self._proc.args, timeout)
+
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                raise subprocess.TimeoutExpired(self._proc.args, timeout)
+
+            if line is None:
+                raise BrokenPipeError("Claude worker exited")
+
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                continue
+
+            if isinstance(event, dict) and event.get('type') == 'result':
+                if event.get('is_error'):
+                    raise _AnalysisError(f"CLI error: {event.get('result', '')}")
+                return event.get('result', '')
+
+    def close(self) -> None:
+        """Terminate the worker process."""
+        if self._proc.poll() is None:
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
 
 
 class EmotionAnalyzer:
@@ -38,8 +255,32 @@ class EmotionAnalyzer:
 
     Uses the claude CLI to perform deep contextual analysis of emotions,
     understanding nuance, sarcasm, metaphor, and implicit expressions.
+    Successful analyses are memoized so repeated texts skip the CLI call.
+
+    Each analysis runs a one-shot claude call by default. Long-lived
+    processes that analyze many texts (the daemon) can instead keep a
+    single claude process alive and feed it prompts over a pipe, paying
+    CLI startup once rather than per call. Its prompts share one session,
+    so it is recycled after WORKER_MAX_PROMPTS prompts to keep earlier
+    texts from weighing on later analyses.
     """
 
+    # Prompts answered by one worker before it is replaced
+    WORKER_MAX_PROMPTS = 20
+
+    # Seconds to wait for Claude to answer
+    TIMEOUT = 10
+
+    # Texts shorter than this with no emotion keywords skip Claude entirely
+    SHORT_TEXT_LENGTH = 40
+
+    # Ask one-shot calls for a JSON result envelope (disable for CLIs
+    # without --output-format)
+    JSON_OUTPUT = True
+
+    # Whether SYSTEM_PROMPT_PATH is up to date (None: not yet checked)
+    _system_prompt_written: Optional[bool] = None
+
     SYSTEM_PROMPT = """You are an expert emotion analyst based on Antonio Damasio's framework. Analyze text for emotional content with deep contextual understanding.
 
 Available emotion types:
@@ -70,6 +311,43 @@ Return ONLY a JSON object (no other text) in this exact format:
   "reasoning": "Brief explanation"
 }"""
 
+    def __init__(
+        self,
+        use_cache: bool = True,
+        cache_dir: Optional[Path] = None,
+        use_worker: bool = False
+    ):
+        """
+        Initialize emotion analyzer.
+
+        Args:
+            use_cache: Whether to memoize analyses by text hash
+            cache_dir: Directory for the persistent cache (optional)
+            use_worker: Whether to keep a long-lived claude process (only
+                worth it in long-lived processes)
+        """
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
+        self.use_worker = use_worker
+        self._cache = None
+        self._worker: Optional[_ClaudeWorker] = None
+
+    def close(self) -> None:
+        """Stop the claude worker and close the cache."""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
     def analyze(self, text: str) -> AnalysisResult:
         """
         Analyze text to extract emotional content using Claude.
@@ -80,68 +358,423 @@ Return ONLY a JSON object (no other text) in this exact format:
         Returns:
             AnalysisResult with detected emotions
         """
+        known = self._known_result(text)
+        if known is not None:
+            return known
+
         try:
-            # Construct the prompt
-            prompt = f"""Analyze the emotional content of this text:
+            data = self._query_claude(self._single_prompt(text))
+        except _AnalysisError as e:
+            return self._fallback_analysis(text, str(e))
+
+        return self._finish_single(text, data)
+
+    async def analyze_batch_async(self, texts: List[str]) -> List[AnalysisResult]:
+        """
+        Run analyze_batch() in a worker thread.
+
+        Lets callers overlap the (single) Claude round-trip with their own
+        I/O, such as opening the state database.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of AnalysisResult, in the same order as texts
+        """
+        return await asyncio.to_thread(self.analyze_batch, texts)
+
+    def analyze_batch(self, texts: List[str]) -> List[AnalysisResult]:
+        """
+        Analyze several texts with a single Claude invocation.
+
+        All texts are numbered in one prompt, so process startup and the
+        LLM round-trip are paid once instead of once per text.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of AnalysisResult, in the same order as texts
+        """
+        analyses: List[Optional[AnalysisResult]] = [self._known_result(text) for text in texts]
+        missing = [i for i, analysis in enumerate(analyses) if analysis is None]
+
+        if not missing:
+            return analyses
+
+        if len(missing) == 1:
+            # Already looked up, so straight to Claude with the plain prompt
+            text = texts[missing[0]]
+            try:
+                data = self._query_claude(self._single_prompt(text))
+            except _AnalysisError as e:
+                analyses[missing[0]] = self._fallback_analysis(text, str(e))
+            else:
+                analyses[missing[0]] = self._finish_single(text, data)
+            return analyses
+
+        # Only texts without a skipped or cached analysis go to Claude
+        pending = [texts[i] for i in missing]
+        for i, result in zip(missing, self._analyze_uncached_batch(pending)):
+            analyses[i] = result
+
+        return analyses
+
+    def _analyze_uncached_batch(self, texts: List[str]) -> List[AnalysisResult]:
+        """
+        Analyze several texts with one Claude call, bypassing the cache lookup.
+
+        Args:
+            texts: Texts to analyze
+
+        Returns:
+            List of AnalysisResult, in the same order as texts
+        """
+        numbered = "\n\n".join(f'[{i}] "{text}"' for i, text in enumerate(texts, 1))
+        prompt = f"""Analyze the emotional content of each numbered text separately:
+
+{numbered}
+
+Return ONLY a JSON object (no other text) of the form {{"results": [...]}}, with one
+analysis per text in the same order. Each analysis uses the usual format plus an
+"index" field holding the text number."""
+
+        try:
+            data = self._query_claude(prompt)
+        except _AnalysisError as e:
+            return [self._fallback_analysis(text, str(e)) for text in texts]
+
+        # Map analyses back to their texts by index
+        by_index = {}
+        results = data.get('results', []) if isinstance(data, dict) else []
+        for position, item in enumerate(results, 1):
+            if isinstance(item, dict):
+                by_index[item.get('index', position)] = item
+
+        analyses = []
+        for i, text in enumerate(texts, 1):
+            item = by_index.get(i)
+            if item is None:
+                analyses.append(self._fallback_analysis(text, "Missing from batch response"))
+                continue
+
+            try:
+                result = self._build_result(text, item)
+            except (ValueError, KeyError, TypeError) as e:
+                analyses.append(self._fallback_analysis(text, f"Parse error: {e}"))
+                continue
+
+            self._cache_put(text, result)
+            analyses.append(result)
+
+        return analyses
+
+    def _single_prompt(self, text: str) -> str:
+        """Build the prompt asking Claude to analyze one text."""
+        return f"""Analyze the emotional content of this text:
 
 "{text}"
 
 Return the JSON analysis."""
 
-            # Call claude CLI
-            result = subprocess.run(
-                [
-                    'claude', '-p',
-                    '--system-prompt', self.SYSTEM_PROMPT,
-                    '--model', 'haiku',
-                    prompt
-                ],
-                capture_output=True,
-                text=True,
-                timeout=10
+    def _finish_single(self, text: str, data: dict) -> AnalysisResult:
+        """Build and memoize the analysis of one text from Claude's JSON."""
+        try:
+            result = self._build_result(text, data)
+        except (ValueError, KeyError, TypeError) as e:
+            return self._fallback_analysis(text, f"Parse error: {e}")
+
+        self._cache_put(text, result)
+        return result
+
+    def _known_result(self, text: str) -> Optional[AnalysisResult]:
+        """
+        Resolve an analysis without calling Claude, when possible.
+
+        Short texts with no emotion keywords ("ok", "thanks", tool output)
+        are neutral without asking; otherwise the cache is consulted.
+
+        Args:
+            text: Text to analyze
+
+        Returns:
+            AnalysisResult, or None if Claude needs to be asked
+        """
+        if len(text) < self.SHORT_TEXT_LENGTH and not _KEYWORD_RE.search(text):
+            return _NEUTRAL._replace(
+                text=text,
+                emotions={},
+                keywords=("[Skipped: no emotional keywords]",)
             )
 
-            if result.returncode != 0:
-                # Claude CLI failed, return neutral state
-                return self._fallback_analysis(text, f"CLI error: {result.stderr}")
+        return self._cache_get(text)
+
+    def _cache_get(self, text: str) -> Optional[AnalysisResult]:
+        """Return the memoized analysis of text, if any."""
+        if not self.use_cache:
+            return None
+
+        from sable.analysis.emotion_cache import cache_key
 
-            # Parse JSON response
+        cached = self._get_cache().get(cache_key(text))
+        if cached is None:
+            return None
+
+        # Cache keys are normalized, so report the caller's exact text
+        return cached if cached.text == text else cached._replace(text=text)
+
+    def _cache_put(self, text: str, result: AnalysisResult) -> None:
+        """Memoize a successful analysis (fallbacks are never cached)."""
+        if not self.use_cache:
+            return
+
+        from sable.analysis.emotion_cache import cache_key
+
+        self._get_cache().put(cache_key(text), result)
+
+    def _get_cache(self):
+        """Open the emotion cache on first use."""
+        if self._cache is None:
+            from sable.analysis.emotion_cache import EmotionCache
+            self._cache = EmotionCache(self.cache_dir)
+        return self._cache
+
+    def _query_claude(self, prompt: str) -> dict:
+        """
+        Send a prompt to Claude and parse the JSON response.
+
+        Args:
+            prompt: User prompt for Claude
+
+        Returns:
+            Parsed JSON object from Claude's response
+
+        Raises:
+            _AnalysisError: If the CLI fails or returns no usable JSON
+        """
+        return self._parse_response(self._complete(prompt))
+
+    def _parse_response(self, response: str) -> dict:
+        """
+        Parse the JSON object out of Claude's reply.
+
+        Args:
+            response: Raw text of Claude's reply
+
+        Returns:
+            Parsed JSON object
+
+        Raises:
+            _AnalysisError: If the reply holds no usable JSON
+        """
+        # Common case: the reply is exactly the JSON object asked for
+        try:
+            data = orjson.loads(response)
+        except orjson.JSONDecodeError:
+            data = None
+
+        if isinstance(data, dict):
+            return data
+
+        # Extract JSON from response (Claude might add extra text)
+        match = _JSON_RE.search(response)
+        if match is None:
+            raise _AnalysisError("No JSON found in response")
+
+        try:
+            return orjson.loads(match.group(0))
+        except orjson.JSONDecodeError as e:
+            raise _AnalysisError(f"Parse error: {e}")
+
+    def _complete(self, prompt: str) -> str:
+        """
+        Get Claude's reply to a prompt.
+
+        Uses the long-lived worker when enabled, falling back to a one-shot
+        CLI call if the worker cannot be started or has died.
+
+        Args:
+            prompt: User prompt for Claude
+
+        Returns:
+            Raw text of Claude's reply
+
+        Raises:
+            _AnalysisError: If Claude could not be reached
+        """
+        if self.use_worker:
             try:
-                # Extract JSON from response (Claude might add extra text)
-                response_text = result.stdout.strip()
+                return self._ask_worker(prompt)
+            except (BrokenPipeError, OSError):
+                # Worker unavailable (e.g., CLI without stream-json support)
+                self._stop_worker()
+            except subprocess.TimeoutExpired:
+                # A late reply would be mistaken for the next answer
+                self._stop_worker()
+                raise _AnalysisError("Claude CLI timeout")
+
+        return self._run_once(prompt)
+
+    def _ask_worker(self, prompt: str) -> str:
+        """Send a prompt to the worker, starting or recycling it as needed."""
+        worker = self._worker
+        if worker is not None and worker.prompts_sent >= self.WORKER_MAX_PROMPTS:
+            self._stop_worker()
+            worker = None
+
+        if worker is None:
+            worker = _ClaudeWorker(self._claude_command(
+                '--input-format', 'stream-json',
+                '--output-format', 'stream-json',
+                '--verbose',
+            ))
+            self._worker = worker
+
+        return worker.ask(prompt, self.TIMEOUT)
+
+    def _claude_command(self, *extra: str) -> List[str]:
+        """
+        Build a claude CLI command line.
 
-                # Find JSON object in response
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
+        The system prompt is passed by file path rather than inline, so
+        each invocation's argv stays small. If the file cannot be written,
+        the prompt is passed inline as before.
 
-                if json_start == -1 or json_end == 0:
-                    return self._fallback_analysis(text, "No JSON found in response")
+        Args:
+            *extra: Additional CLI arguments
 
-                json_str = response_text[json_start:json_end]
-                data = json.loads(json_str)
+        Returns:
+            Command line for subprocess
+        """
+        if self._system_prompt_file() is not None:
+            system_args = ['--system-prompt-file', str(SYSTEM_PROMPT_PATH)]
+        else:
+            system_args = ['--system-prompt', self.SYSTEM_PROMPT]
 
-                emotions = data.get('emotions', {})
-                valence = float(data.get('valence', 0.0))
-                arousal = float(data.get('arousal', 0.5))
-                reasoning = data.get('reasoning', '')
+        return ['claude', '-p', *system_args, '--model', 'haiku', *extra]
 
-                return AnalysisResult(
-                    text=text,
-                    emotions=emotions,
-                    valence=valence,
-                    arousal=arousal,
-                    keywords=[reasoning] if reasoning else []
-                )
+    def _output_args(self) -> List[str]:
+        """CLI arguments selecting the output format of one-shot calls."""
+        return ['--output-format', 'json'] if self.JSON_OUTPUT else []
 
-            except (json.JSONDecodeError, ValueError, KeyError) as e:
-                return self._fallback_analysis(text, f"Parse error: {e}")
+    def _unwrap_output(self, stdout: str) -> str:
+        """
+        Get Claude's reply text from one-shot CLI output.
+
+        With JSON_OUTPUT the CLI wraps the reply in a result envelope;
+        output that isn't one (e.g., from an older CLI) is used as-is.
+
+        Args:
+            stdout: Output of the claude CLI
+
+        Returns:
+            Text of Claude's reply
 
+        Raises:
+            _AnalysisError: If the envelope reports an error
+        """
+        if not self.JSON_OUTPUT:
+            return stdout
+
+        try:
+            envelope = orjson.loads(stdout)
+        except orjson.JSONDecodeError:
+            return stdout
+
+        if not isinstance(envelope, dict) or envelope.get('type') != 'result':
+            return stdout
+
+        if envelope.get('is_error'):
+            raise _AnalysisError(f"CLI error: {envelope.get('result', '')}")
+
+        return envelope.get('result', '')
+
+    def _system_prompt_file(self) -> Optional[Path]:
+        """Write SYSTEM_PROMPT to disk once per process, if it changed."""
+        cls = type(self)
+        if cls._system_prompt_written is None:
+            try:
+                if (not SYSTEM_PROMPT_PATH.exists()
+                        or SYSTEM_PROMPT_PATH.read_text(encoding='utf-8') != self.SYSTEM_PROMPT):
+                    SYSTEM_PROMPT_PATH.parent.mkdir(parents=True, exist_ok=True)
+                    SYSTEM_PROMPT_PATH.write_text(self.SYSTEM_PROMPT, encoding='utf-8')
+                cls._system_prompt_written = True
+            except OSError:
+                cls._system_prompt_written = False
+
+        return SYSTEM_PROMPT_PATH if cls._system_prompt_written else None
+
+    def _stop_worker(self) -> None:
+        """Terminate the worker; the next prompt starts a fresh one."""
+        if self._worker is not None:
+            self._worker.close()
+            self._worker = None
+
+    def _run_once(self, prompt: str) -> str:
+        """
+        Answer a prompt with a one-shot claude CLI call.
+
+        The prompt is written to stdin rather than passed as an argument,
+        which keeps large batch prompts clear of argv size limits.
+
+        Args:
+            prompt: User prompt for Claude
+
+        Returns:
+            Raw text of Claude's reply
+
+        Raises:
+            _AnalysisError: If the CLI fails
+        """
+        try:
+            result = subprocess.run(
+                self._claude_command(*self._output_args()),
+                input=prompt,
+                capture_output=True,
+                text=True,
+                timeout=self.TIMEOUT
+            )
         except subprocess.TimeoutExpired:
-            return self._fallback_analysis(text, "Claude CLI timeout")
+            raise _AnalysisError("Claude CLI timeout")
         except FileNotFoundError:
-            return self._fallback_analysis(text, "Claude CLI not found")
+            raise _AnalysisError("Claude CLI not found")
         except Exception as e:
-            return self._fallback_analysis(text, f"Unexpected error: {e}")
+            raise _AnalysisError(f"Unexpected error: {e}")
+
+        if result.returncode != 0:
+            # Claude CLI failed, caller falls back to neutral state
+            raise _AnalysisError(f"CLI error: {result.stderr}")
+
+        return self._unwrap_output(result.stdout)
+
+    def _build_result(self, text: str, data: dict) -> AnalysisResult:
+        """
+        Build an AnalysisResult from one parsed analysis object.
+
+        Args:
+            text: The analyzed text
+            data: Parsed analysis (emotions, valence, arousal, reasoning)
+
+        Returns:
+            AnalysisResult for the text
+        """
+        emotions = data.get('emotions', {})
+        if not isinstance(emotions, dict):
+            raise TypeError(f"emotions must be an object, got {type(emotions).__name__}")
+
+        emotions = {str(name): float(intensity) for name, intensity in emotions.items()}
+        valence = float(data.get('valence', 0.0))
+        arousal = float(data.get('arousal', 0.5))
+        reasoning = str(data.get('reasoning', ''))
+
+        return AnalysisResult(
+            text=text,
+            emotions=emotions,
+            valence=valence,
+            arousal=arousal,
+            keywords=(reasoning,) if reasoning else ()
+        )
 
     def _fallback_analysis(self, text: str, reason: str) -> AnalysisResult:
         """
@@ -155,18 +788,17 @@ Return the JSON analysis."""
             Neutral AnalysisResult
         """
         # Return neutral state with explanation
-        return AnalysisResult(
+        return _NEUTRAL._replace(
             text=text,
             emotions={},
-            valence=0.0,
-            arousal=0.5,
-            keywords=[f"[Fallback: {reason}]"]
+            keywords=(f"[Fallback: {reason}]",)
         )
 
     def analyze_conversation_impact(
         self,
         text: str,
-        as_speaker: bool = True
+        as_speaker: bool = True,
+        result: Optional[AnalysisResult] = None
     ) -> Dict[str, float]:
         """
         Analyze text and estimate impact on body state.
@@ -175,11 +807,13 @@ Return the JSON analysis."""
             text: Text to analyze
             as_speaker: If True, text is from Sable (internal impact)
                        If False, text is from other (external impact)
+            result: Existing analysis of text (skips re-analyzing)
 
         Returns:
             Dict of body parameter -> change
         """
-        result = self.analyze(text)
+        if result is None:
+            result = self.analyze(text)
 
         # Base body state changes
         changes = {}
@@ -209,3 +843,28 @@ Return the JSON analysis."""
             changes['energy'] = changes.get('energy', 0) - 0.02
 
         return changes
+
+
+# Process-wide analyzer, created on first use by get_analyzer()
+_ANALYZER: Optional[EmotionAnalyzer] = None
+
+
+def get_analyzer(use_worker: bool = False) -> EmotionAnalyzer:
+    """
+    Get the process-wide EmotionAnalyzer.
+
+    Sharing one instance keeps its cache (and claude worker, if any) warm
+    across callers instead of rebuilding them for each analysis.
+
+    Args:
+        use_worker: Whether the analyzer keeps a long-lived claude process;
+            only applies to the call that creates it
+
+    Returns:
+        Shared EmotionAnalyzer
+    """
+    global _ANALYZER
+    if _ANALYZER is None:
+        _ANALYZER = EmotionAnalyzer(use_worker=use_worker)
+        atexit.register(_ANALYZER.close)
+    return _ANALYZER
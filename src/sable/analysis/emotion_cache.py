@@ -0,0 +1,201 @@
+"""
+Emotion Cache: Memoized analysis results
+
+Conversations repeat themselves - short acknowledgements, system nudges,
+boilerplate replies. Each repeat would otherwise cost a full Claude CLI
+round-trip, so analyses are memoized by the SHA-256 of the normalized text:
+
+- An in-memory LRU serves repeats within one process
+- A SQLite table under ~/.sable/emotion_cache/ serves repeats across hook
+  runs; it is an LRU too, capped at MAX_DISK_ENTRIES rows
+"""
+
+import hashlib
+import sqlite3
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import orjson
+
+from sable.analysis.emotion_analyzer import AnalysisResult
+
+# Default cache location
+DEFAULT_CACHE_DIR = Path.home() / ".sable" / "emotion_cache"
+
+# Entries unused for longer than this are evicted when the cache is opened
+MAX_AGE_SECONDS = 30 * 24 * 3600  # 30 days
+
+# Most entries kept on disk; the least recently used beyond it are evicted
+# when the cache is opened
+MAX_DISK_ENTRIES = 10_000
+
+
+def cache_key(text: str) -> str:
+    """
+    Hash normalized text into a cache key.
+
+    Args:
+        text: Text that was analyzed
+
+    Returns:
+        Hex digest identifying the text
+    """
+    normalized = text.strip().lower()
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class EmotionCache:
+    """
+    Two-tier cache of AnalysisResults keyed by text hash.
+
+    The disk tier is best-effort: if the cache database cannot be opened
+    or written, the cache silently degrades to memory only.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        maxsize: int = 1024,
+        max_disk_entries: int = MAX_DISK_ENTRIES
+    ):
+        """
+        Initialize emotion cache.
+
+        Args:
+            cache_dir: Directory for the cache database (default: ~/.sable/emotion_cache)
+            maxsize: Maximum entries held in memory
+            max_disk_entries: Maximum entries kept in the cache database
+        """
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.maxsize = maxsize
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, AnalysisResult]" = OrderedDict()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disk_available = True
+
+    def get(self, key: str) -> Optional[AnalysisResult]:
+        """
+        Look up a cached analysis.
+
+        Args:
+            key: Cache key from cache_key()
+
+        Returns:
+            Cached AnalysisResult, or None on a miss
+        """
+        result = self._memory.get(key)
+        if result is not None:
+            self._memory.move_to_end(key)
+            return result
+
+        conn = self._connect()
+        if conn is None:
+            return None
+
+        try:
+            row = conn.execute(
+                "SELECT json FROM emotion_cache WHERE hash = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+
+        if row is None:
+            return None
+
+        # A row that doesn't decode to an analysis is a miss; put() will
+        # replace it
+        try:
+            fields = orjson.loads(row[0])
+            fields["keywords"] = tuple(fields.get("keywords", ()))
+            result = AnalysisResult(**fields)
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+        try:
+            conn.execute(
+                "UPDATE emotion_cache SET last_used = ? WHERE hash = ?", (time.time(), key)
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+        self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: AnalysisResult) -> None:
+        """
+        Store an analysis in both cache tiers.
+
+        Args:
+            key: Cache key from cache_key()
+            result: Analysis to cache
+        """
+        self._remember(key, result)
+
+        conn = self._connect()
+        if conn is None:
+            return
+
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO emotion_cache (hash, json, last_used) VALUES (?, ?, ?)",
+                (key, orjson.dumps(result._asdict()).decode(), time.time())
+            )
+            conn.commit()
+        except sqlite3.Error:
+            pass
+
+    def close(self) -> None:
+        """Close the cache database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _remember(self, key: str, result: AnalysisResult) -> None:
+        """Add an entry to the in-memory LRU, evicting the oldest if full."""
+        self._memory[key] = result
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the cache database on first use and evict stale and excess entries."""
+        if self._conn is not None or not self._disk_available:
+            return self._conn
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # The analyzer may run in a worker thread (analyze_batch_async)
+            # and be closed from the main thread
+            conn = sqlite3.connect(self.cache_dir / "cache.db", check_same_thread=False)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS emotion_cache (
+                    hash TEXT PRIMARY KEY,
+                    json TEXT NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_emotion_cache_last_used ON emotion_cache(last_used)"
+            )
+            conn.execute(
+                "DELETE FROM emotion_cache WHERE last_used < ?",
+                (time.time() - MAX_AGE_SECONDS,)
+            )
+            conn.execute(
+                """
+                DELETE FROM emotion_cache WHERE hash IN (
+                    SELECT hash FROM emotion_cache ORDER BY last_used DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.max_disk_entries,)
+            )
+            conn.commit()
+        except (OSError, sqlite3.Error):
+            self._disk_available = False
+            return None
+
+        self._conn = conn
+        return conn
@@ -9,8 +9,16 @@ Commands:
 - decay: Manually trigger decay
 - analyze: Analyze text for emotions
 - init: Initialize consciousness with identity
+- daemon: Keep Sable loaded between commands
 """
 
-from sable.cli.commands import cli
-
 __all__ = ["cli"]
+
+
+def __getattr__(name):
+    # Importing click and the command group is deferred so the `sable`
+    # entry point can hand off to a running daemon without loading them
+    if name == "cli":
+        from sable.cli.commands import cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,50 @@
+"""
+Click group that imports its subcommands on demand.
+"""
+
+import importlib
+from typing import Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Group whose subcommands are imported only when they are invoked.
+
+    Subcommands are registered as "module:attribute" import paths, so
+    running one command (or --help for it) never imports the modules
+    behind the others.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        """
+        Initialize lazy group.
+
+        Args:
+            lazy_subcommands: Dict of command name -> "module:attribute"
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """List eagerly registered and lazy subcommands, sorted by name."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Get a subcommand, importing it first if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand from its module."""
+        module_name, attribute = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute)
+
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy subcommand {cmd_name!r} ({module_name}:{attribute}) is not a click command"
+            )
+
+        return command
@@ -0,0 +1,72 @@
+"""
+Brief and JSON renderings of the consciousness state.
+
+Shared by `sable status` and the `sable-brief` fast path, so kept free
+of click and rich.
+"""
+
+import orjson
+
+# Body state parameters included in JSON output
+_BODY_JSON_FIELDS = {
+    'energy', 'stress', 'arousal', 'valence', 'tension', 'fatigue', 'pain', 'hunger'
+}
+
+# Prebuilt slice for the brief emotion list
+_TOP_EMOTIONS = slice(3)
+
+# Brief output: the state line, and one emotion (formatted from its dict)
+_BRIEF_STATE = "Sable's State: {bg} | Energy: {e:.2f} | Valence: {v:+.2f} | Arousal: {a:.2f}\n"
+_BRIEF_EMOTION = "{type}({intensity:.1f})".format_map
+
+
+def status_json(state) -> str:
+    """
+    Render the state as indented JSON for programmatic use.
+
+    Args:
+        state: ConsciousnessState to render
+
+    Returns:
+        JSON text, newline-terminated
+    """
+    output = {
+        'proto_self': {
+            **state.body_state.model_dump(include=_BODY_JSON_FIELDS),
+            'background_emotion': state.background_emotion,
+            'homeostatic_pressure': state.homeostatic_pressure,
+        },
+        'core_consciousness': {
+            'active_emotions': state.active_emotions,
+            'overall_valence': state.overall_valence,
+            'overall_arousal': state.overall_arousal,
+        },
+        'extended_consciousness': {
+            'identity_traits': state.identity_traits,
+            'num_significant_memories': state.num_significant_memories,
+        },
+        'timestamp': state.timestamp,
+    }
+    return orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode()
+
+
+def status_brief(state) -> str:
+    """
+    Render the state as one or two lines for UserPromptSubmit hooks.
+
+    Args:
+        state: ConsciousnessState to render
+
+    Returns:
+        Brief text, newline-terminated
+    """
+    output = _BRIEF_STATE.format(
+        bg=state.background_emotion_display,
+        e=state.body_state.energy,
+        v=state.overall_valence,
+        a=state.overall_arousal,
+    )
+    if state.active_emotions:
+        emotions_str = ", ".join(map(_BRIEF_EMOTION, state.active_emotions[_TOP_EMOTIONS]))
+        output += f"Active emotions: {emotions_str}\n"
+    return output
@@ -0,0 +1,79 @@
+"""
+Helpers shared by the CLI command modules.
+"""
+
+import asyncio
+from functools import wraps
+from typing import Dict, Optional
+
+import click
+
+
+class CLIState:
+    """
+    State shared by the commands of one CLI process via click's context.
+
+    Holds a StateManager that is built and initialized on first use, so
+    commands run back-to-back in one process share a single manager.
+    """
+
+    def __init__(self):
+        """Initialize empty CLI state."""
+        self._manager = None
+
+    async def manager(self, identity_traits: Optional[Dict[str, float]] = None):
+        """
+        Get the initialized StateManager, creating it on first use.
+
+        Args:
+            identity_traits: Initial identity traits (for first-time setup)
+
+        Returns:
+            Initialized StateManager
+        """
+        if self._manager is None:
+            from sable.state.state_manager import StateManager
+
+            manager = StateManager()
+            await manager.initialize(identity_traits=identity_traits)
+            self._manager = manager
+
+        return self._manager
+
+    def reset(self) -> None:
+        """Drop the StateManager, so the next command builds a new one."""
+        self._manager = None
+
+
+# Decorator passing the CLIState to a command, creating it if needed
+pass_state = click.make_pass_decorator(CLIState, ensure=True)
+
+
+async def _run_and_close_pools(command):
+    """Await a command, then close the database connections it opened."""
+    from sable.database.pool import close_pools
+
+    try:
+        return await command
+    finally:
+        await close_pools()
+
+
+def coro(f):
+    """
+    Run an async click command callback to completion.
+
+    Applied below the click decorators, so the command body can be a
+    plain `async def` instead of a nested coroutine handed to asyncio.run.
+
+    Args:
+        f: Coroutine function implementing the command
+
+    Returns:
+        Synchronous wrapper for click to invoke
+    """
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(_run_and_close_pools(f(*args, **kwargs)))
+
+    return wrapper
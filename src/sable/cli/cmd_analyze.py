@@ -0,0 +1,82 @@
+"""
+sable analyze: Analyze text for emotional content.
+"""
+
+import click
+import orjson
+
+
+@click.command()
+@click.argument('text')
+@click.option('--format', '-f', type=click.Choice(['rich', 'markdown', 'brief', 'json']), default='rich', help='Output format')
+def analyze(text, format):
+    """Analyze text for emotional content."""
+    from sable.analysis.emotion_analyzer import get_analyzer
+
+    analyzer = get_analyzer()
+    result = analyzer.analyze(text)
+
+    if format == 'json':
+        # JSON format for programmatic use
+        output = {
+            "text": result.text,
+            "emotions": result.emotions,
+            "valence": result.valence,
+            "arousal": result.arousal,
+            "keywords": result.keywords,
+        }
+        print(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
+
+    elif format == 'brief':
+        # Brief format
+        emotions_str = ", ".join([f"{e}({i:.1f})" for e, i in result.emotions.items()]) if result.emotions else "none"
+        print(f"Emotions: {emotions_str} | Valence: {result.valence:+.2f} | Arousal: {result.arousal:.2f}")
+
+    elif format == 'markdown':
+        # Markdown format
+        print("## Emotion Analysis\n")
+        print(f"**Text**: {result.text}\n")
+
+        if result.emotions:
+            print("### Detected Emotions")
+            for emotion_type, intensity in result.emotions.items():
+                print(f"- **{emotion_type.title()}**: {intensity:.2f}")
+            print()
+        else:
+            print("*No emotions detected*\n")
+
+        print(f"**Valence**: {result.valence:+.2f} | **Arousal**: {result.arousal:.2f}")
+
+        if result.keywords:
+            print(f"\n**Keywords**: {', '.join(result.keywords)}")
+
+    else:  # rich (default)
+        from rich.console import Console
+
+        console = Console()
+
+        # Rich format for interactive CLI
+        console.print(f"\n[bold cyan]Emotion Analysis[/bold cyan]\n")
+        console.print(f"[white]Text:[/white] {result.text}\n")
+
+        if result.emotions:
+            # Only load rich's table machinery when there is a table to draw
+            from rich.table import Table
+            from rich import box
+
+            emotions_table = Table(title="Detected Emotions", box=box.ROUNDED)
+            emotions_table.add_column("Emotion", style="magenta")
+            emotions_table.add_column("Intensity", style="yellow")
+
+            for emotion_type, intensity in result.emotions.items():
+                emotions_table.add_row(emotion_type, f"{intensity:.2f}")
+
+            console.print(emotions_table)
+        else:
+            console.print("[yellow]No emotions detected[/yellow]")
+
+        console.print(f"\n[cyan]Valence:[/cyan] {result.valence:+.2f}")
+        console.print(f"[cyan]Arousal:[/cyan] {result.arousal:.2f}")
+
+        if result.keywords:
+            console.print(f"[cyan]Keywords:[/cyan] {', '.join(result.keywords)}")
@@ -0,0 +1,45 @@
+"""
+sable daemon: Keep Sable loaded between commands.
+"""
+
+import click
+
+
+@click.group()
+def daemon():
+    """Run a background server that answers sable commands quickly."""
+
+
+@daemon.command()
+@click.option(
+    '--detach', '-d', is_flag=True, help='Run in the background (e.g. from a SessionStart hook)'
+)
+def start(detach):
+    """Start the daemon (in the foreground unless --detach)."""
+    from sable.cli.daemon import request, serve, socket_path, start_background
+
+    if request({"op": "ping"}) is not None:
+        if detach:
+            # Already up: nothing to do for a hook that just wants it running
+            return
+        raise click.ClickException(f"Sable daemon already running on {socket_path()}")
+
+    if detach:
+        if not start_background():
+            raise click.ClickException("Sable daemon did not start; see ~/.sable/daemon.log")
+        click.echo(f"Sable daemon started on {socket_path()}")
+        return
+
+    click.echo(f"Sable daemon listening on {socket_path()}")
+    serve()
+
+
+@daemon.command()
+def stop():
+    """Stop a running daemon."""
+    from sable.cli.daemon import request
+
+    if request({"op": "stop"}) is None:
+        click.secho("Sable daemon is not running", fg='yellow')
+    else:
+        click.secho("Sable daemon stopped", fg='green')
@@ -0,0 +1,24 @@
+"""
+sable decay: Manually trigger decay.
+"""
+
+import click
+
+from sable.cli._util import CLIState, coro, pass_state
+
+
+@click.command()
+@pass_state
+@coro
+async def decay(cli_state: CLIState):
+    """Manually trigger decay (for testing)."""
+    manager = await cli_state.manager()
+
+    await manager.apply_automatic_decay()
+
+    click.secho("Decay applied to all consciousness components", fg='green')
+
+    # Show new state
+    state = await manager.get_current_state()
+    click.echo(f"\nCurrent valence: {state.overall_valence:+.2f}")
+    click.echo(f"Active emotions: {len(state.active_emotions)}")
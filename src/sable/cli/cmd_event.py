@@ -0,0 +1,36 @@
+"""
+sable event: Log an event.
+"""
+
+import click
+import orjson
+
+from sable.cli._util import CLIState, coro, pass_state
+
+
+@click.command()
+@click.argument('description')
+@click.option('--context', '-c', help='Additional context')
+@click.option('--emotions', '-e', help='Emotional impact as JSON (e.g., \'{"fear": 0.7}\')')
+@click.option('--role', '-r', help='Narrative role (e.g., "turning point")')
+@pass_state
+@coro
+async def event(cli_state: CLIState, description, context, emotions, role):
+    """Log an event."""
+    emotional_impact = None
+    if emotions:
+        emotional_impact = orjson.loads(emotions)
+
+    manager = await cli_state.manager()
+
+    evt = await manager.add_event(
+        description=description,
+        context=context,
+        emotional_impact=emotional_impact,
+        narrative_role=role
+    )
+
+    click.secho(f"Event recorded: {description}", fg='green')
+
+    if emotional_impact:
+        click.echo(f"Emotional impact: {emotional_impact}")
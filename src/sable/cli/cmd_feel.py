@@ -0,0 +1,56 @@
+"""
+sable feel: Add an emotion.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict
+
+import click
+
+from sable.cli._util import CLIState, coro, pass_state
+
+if TYPE_CHECKING:
+    from sable.models.emotion import EmotionType
+
+
+@lru_cache(maxsize=None)
+def _valid_emotions() -> Dict[str, "EmotionType"]:
+    """
+    Map each emotion type value to its EmotionType.
+
+    Returns:
+        EmotionType members keyed by value, in definition order
+    """
+    from sable.models.emotion import EmotionType
+
+    return {e.value: e for e in EmotionType}
+
+
+@click.command()
+@click.argument('emotion_type')
+@click.argument('intensity', type=float)
+@click.option('--cause', '-c', required=True, help='What caused this emotion')
+@pass_state
+@coro
+async def feel(cli_state: CLIState, emotion_type, intensity, cause):
+    """Add an emotion."""
+    emotion_enum = _valid_emotions().get(emotion_type.lower())
+    if emotion_enum is None:
+        click.secho(f"Invalid emotion type: {emotion_type}", fg='red')
+        click.echo(f"Valid types: {', '.join(_valid_emotions())}")
+        return
+
+    if not 0 <= intensity <= 1:
+        click.secho("Intensity must be between 0 and 1", fg='red')
+        return
+
+    manager = await cli_state.manager()
+
+    emotion = await manager.add_emotion(
+        emotion_type=emotion_enum,
+        intensity=intensity,
+        cause=cause
+    )
+
+    click.secho(f"Added {emotion_type} (intensity: {intensity:.2f})", fg='green')
+    click.echo(f"Cause: {cause}")
@@ -0,0 +1,31 @@
+"""
+sable init: Initialize Sable's consciousness with identity traits.
+"""
+
+import click
+import orjson
+
+from sable.cli._util import CLIState, coro, pass_state
+
+
+@click.command()
+@click.option('--traits', '-t', help='Identity traits as JSON (e.g., \'{"curiosity": 0.8}\')')
+@pass_state
+@coro
+async def init(cli_state: CLIState, traits):
+    """Initialize Sable's consciousness with identity traits."""
+    identity_traits = None
+    if traits:
+        identity_traits = orjson.loads(traits)
+
+    from sable.state.state_manager import StateManager
+
+    # A fresh manager, not the shared one. Identity traits aren't stored
+    # in the database, so the commands after this one (in the daemon
+    # too) start without them, as they would in a new process
+    cli_state.reset()
+    await StateManager().initialize(identity_traits=identity_traits)
+    click.secho("Consciousness system initialized successfully!", fg='green')
+
+    if identity_traits:
+        click.echo(f"Identity traits: {identity_traits}")
@@ -0,0 +1,218 @@
+"""
+sable memories: Query autobiographical memories.
+"""
+
+import sys
+from datetime import datetime
+from itertools import chain, islice
+
+import click
+import orjson
+
+from sable.cli._util import CLIState, coro, pass_state
+
+# Prebuilt slices for truncating descriptions and emotion lists
+_BRIEF_DESC = slice(60)
+_MD_DESC = slice(80)
+_TOP_EMOTIONS = slice(3)
+
+# One line of brief output: number, description, salience, emotions
+_BRIEF_LINE = "{0}. {1}... | Salience: {2:.2f} | Emotions: {3}"
+
+# One memory in standard markdown output
+_MEMORY_MD = (
+    "### Memory #{i}{role}\n"
+    "{desc}\n\n"
+    "- **Salience**: {sal:.2f} | **Consolidation**: {cons:.2f}\n"
+    "- **Emotions**: {emo}\n"
+    "- **Times accessed**: {ac}\n"
+    "{logbook}"
+)
+
+
+@click.command()
+@click.option('--min-salience', '-s', type=float, default=0.4, help='Minimum salience')
+@click.option('--emotion', '-e', help='Filter by emotion type')
+@click.option('--limit', '-l', type=int, default=10, help='Maximum number of memories')
+@click.option('--format', '-f', type=click.Choice(['rich', 'markdown', 'brief', 'json']), default='rich', help='Output format')
+@click.option('--contextual', is_flag=True, help='Use smart contextual retrieval (recent + salient)')
+@click.option('--max-count', type=int, default=15, help='Max total memories in contextual mode (10 recent + 5 salient)')
+@click.option('--recent-days', type=int, default=7, help='Days to consider "recent" in contextual mode')
+@click.option('--search', help='Search memories by keywords in description')
+@click.option('--sort-by', type=click.Choice(['salience', 'recency', 'access_count']), default='salience', help='Sort order')
+@pass_state
+@coro
+async def memories(
+    cli_state: CLIState, min_salience, emotion, limit, format, contextual, max_count,
+    recent_days, search, sort_by
+):
+    """Query autobiographical memories with smart filtering."""
+    from sable.database.queries import get_contextual_memories, search_memories_by_description, query_memories
+    manager = await cli_state.manager()
+
+    # Initialize for contextual mode tracking
+    recent_mems = []
+    salient_mems = []
+
+    # Handle different query modes
+    if contextual:
+        # Smart contextual retrieval (recent + salient)
+        result = await get_contextual_memories(
+            max_total=max_count,
+            recent_count=10,
+            salient_count=5,
+            min_salience=min_salience,
+            days_for_recent=recent_days,
+            db_path=manager.db_path
+        )
+        recent_mems = result['recent']
+        salient_mems = result['salient']
+        if format == 'markdown':
+            # Markdown renders the two lists as separate sections, so no
+            # combined list is needed beyond checking for emptiness
+            mems = recent_mems or salient_mems
+        else:
+            mems = list(islice(chain(recent_mems, salient_mems), limit))
+    elif search:
+        # Keyword search
+        mems = await search_memories_by_description(
+            keywords=search,
+            min_salience=min_salience,
+            limit=limit,
+            db_path=manager.db_path
+        )
+    elif emotion:
+        # Filter by emotion (existing functionality)
+        mems = await manager.query_memories(
+            min_salience=min_salience,
+            emotion_type=emotion
+        )
+        mems = mems[:limit]
+    else:
+        # Standard query with sort option
+        mems = await query_memories(
+            min_salience=min_salience,
+            limit=limit,
+            sort_by=sort_by,
+            db_path=manager.db_path
+        )
+
+    if not mems:
+        if format in ['markdown', 'brief']:
+            print("No memories found matching criteria")
+        elif format == 'json':
+            print(orjson.dumps({"memories": [], "count": 0}).decode())
+        else:
+            click.secho("No memories found matching criteria", fg='yellow')
+        return
+
+    if format == 'json':
+        # JSON format for programmatic use
+        output = {
+            "count": len(mems),
+            "memories": [
+                {
+                    "description": mem.event.description,
+                    "context": mem.event.context,
+                    "emotional_salience": mem.emotional_salience,
+                    "consolidation_level": mem.consolidation_level,
+                    "associated_emotions": mem.associated_emotions,
+                    "narrative_role": mem.narrative_role,
+                    "access_count": mem.access_count,
+                    "logbook_path": mem.logbook_path,
+                    "timestamp": mem.created_at,
+                }
+                for mem in mems
+            ]
+        }
+        sys.stdout.write(
+            orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE).decode()
+        )
+
+    elif format == 'brief':
+        # Brief format for quick overview
+        lines = map(
+            _BRIEF_LINE.format,
+            range(1, len(mems) + 1),
+            (mem.event.description[_BRIEF_DESC] for mem in mems),
+            (mem.emotional_salience for mem in mems),
+            (", ".join(mem.associated_emotions) or "none" for mem in mems),
+        )
+        sys.stdout.write(f"Found {len(mems)} memories:\n" + "\n".join(lines) + "\n")
+
+    elif format == 'markdown':
+        # Markdown format for SessionStart hooks
+        out = []
+        if contextual and (recent_mems or salient_mems):
+            # Special contextual format - separate recent and salient
+            out.append(f"## Sable's Memories (Recent Context + Defining Moments)\n")
+
+            if recent_mems:
+                out.append(
+                    f"### Recent Context ({len(recent_mems)} memories, last {recent_days} days)"
+                )
+                now = datetime.now()
+                for i, mem in enumerate(recent_mems, 1):
+                    emotions_str = ", ".join(mem.associated_emotions[_TOP_EMOTIONS]) or "none"
+                    # Calculate how long ago
+                    days_ago = (now - mem.created_at).days
+                    time_str = "today" if days_ago == 0 else f"{days_ago}d ago"
+                    out.append(f"{i}. [{time_str}] {mem.event.description[_MD_DESC]}...")
+                    out.append(
+                        f"   *Salience: {mem.emotional_salience:.2f} | Emotions: {emotions_str}*"
+                    )
+                out.append("")
+
+            if salient_mems:
+                out.append(f"### Defining Memories ({len(salient_mems)} memories)")
+                for i, mem in enumerate(salient_mems, 1):
+                    emotions_str = ", ".join(mem.associated_emotions[_TOP_EMOTIONS]) or "none"
+                    role_str = f" - *{mem.narrative_role}*" if mem.narrative_role else ""
+                    out.append(f"{i}. {mem.event.description[_MD_DESC]}...{role_str}")
+                    out.append(
+                        f"   *Salience: {mem.emotional_salience:.2f} | Emotions: {emotions_str}*"
+                    )
+        else:
+            # Standard markdown format
+            out.append(f"## Sable's Memories ({len(mems)} found)\n")
+            for i, mem in enumerate(mems, 1):
+                emotions_str = ", ".join(mem.associated_emotions) or "none"
+                role_str = f" - *{mem.narrative_role}*" if mem.narrative_role else ""
+                out.append(_MEMORY_MD.format(
+                    i=i,
+                    role=role_str,
+                    desc=mem.event.description,
+                    sal=mem.emotional_salience,
+                    cons=mem.consolidation_level,
+                    emo=emotions_str,
+                    ac=mem.access_count,
+                    logbook=(
+                        f"- **Extended entry**: `{mem.logbook_path}`\n" if mem.logbook_path else ""
+                    ),
+                ))
+
+        sys.stdout.write("\n".join(out) + "\n")
+
+    else:  # rich (default)
+        from rich.console import Console
+        from rich.panel import Panel
+        from rich import box
+
+        console = Console()
+
+        # Rich format for interactive CLI
+        console.print(f"\n[bold cyan]Found {len(mems)} memories[/bold cyan]\n")
+
+        for i, mem in enumerate(mems, 1):
+            emotions_str = ", ".join(mem.associated_emotions) if mem.associated_emotions else "none"
+
+            panel = Panel(
+                f"[white]{mem.event.description}[/white]\n\n"
+                f"[cyan]Salience:[/cyan] {mem.emotional_salience:.2f} | "
+                f"[cyan]Consolidation:[/cyan] {mem.consolidation_level:.2f}\n"
+                f"[cyan]Emotions:[/cyan] {emotions_str}\n"
+                f"[cyan]Times accessed:[/cyan] {mem.access_count}",
+                title=f"Memory #{i}" + (f" - {mem.narrative_role}" if mem.narrative_role else ""),
+                box=box.ROUNDED
+            )
+            console.print(panel)
@@ -0,0 +1,137 @@
+"""
+sable status: Show the current consciousness state.
+"""
+
+import sys
+
+import click
+
+from sable.cli._status_output import status_brief, status_json
+from sable.cli._util import CLIState, coro, pass_state
+
+# Prebuilt slice for the rich cause column
+_CAUSE = slice(50)
+
+# Markdown output: the whole state, and one active emotion (from its display dict)
+_MARKDOWN_STATE = (
+    "## Sable's Current Consciousness State\n\n"
+    "### Proto-Self (Body State)\n"
+    "- **Energy**: {energy:.2f} | **Arousal**: {arousal:.2f} | **Valence**: {valence:+.2f}\n"
+    "- **Tension**: {tension:.2f} | **Fatigue**: {fatigue:.2f} | **Stress**: {stress:.2f}\n"
+    "- **Background emotion**: {bg}\n"
+    "- **Homeostatic pressure**: {pressure:.2f}\n\n"
+    "{emotions}"
+    "**Overall valence**: {overall_valence:+.2f} | **Overall arousal**: {overall_arousal:.2f}\n\n"
+    "### Extended Consciousness\n"
+    "{traits}"
+    "- **Significant memories**: {memories}\n"
+)
+_MARKDOWN_EMOTION = '- **{type_display}** ({intensity_str}) - "{cause}"\n'.format_map
+
+# Body state rows in the rich table: (label, field, format spec)
+_BODY_ROWS = (
+    ("Energy", "energy", ".2f"),
+    ("Stress", "stress", ".2f"),
+    ("Arousal", "arousal", ".2f"),
+    ("Valence", "valence", "+.2f"),
+    ("Tension", "tension", ".2f"),
+    ("Fatigue", "fatigue", ".2f"),
+)
+
+
+@click.command()
+@click.option('--format', '-f', type=click.Choice(['rich', 'markdown', 'brief', 'json']), default='rich', help='Output format')
+@pass_state
+@coro
+async def status(cli_state: CLIState, format):
+    """Show current consciousness state."""
+    manager = await cli_state.manager()
+
+    state = await manager.get_current_state()
+
+    if format == 'json':
+        # JSON format for programmatic use
+        sys.stdout.write(status_json(state))
+
+    elif format == 'brief':
+        # Brief format for UserPromptSubmit hooks
+        sys.stdout.write(status_brief(state))
+
+    elif format == 'markdown':
+        # Markdown format for SessionStart hooks
+        body_state = state.body_state
+        emotions_md = "".join(map(_MARKDOWN_EMOTION, state.active_emotions_display))
+        traits_md = ", ".join(f"{k} ({v:.2f})" for k, v in state.identity_traits_display.items())
+        sys.stdout.write(_MARKDOWN_STATE.format(
+            energy=body_state.energy,
+            arousal=body_state.arousal,
+            valence=body_state.valence,
+            tension=body_state.tension,
+            fatigue=body_state.fatigue,
+            stress=body_state.stress,
+            bg=state.background_emotion_display,
+            pressure=state.homeostatic_pressure,
+            emotions=(
+                f"### Core Consciousness (Active Emotions)\n{emotions_md}\n" if emotions_md else ""
+            ),
+            overall_valence=state.overall_valence,
+            overall_arousal=state.overall_arousal,
+            traits=f"- **Identity traits**: {traits_md}\n" if traits_md else "",
+            memories=state.num_significant_memories,
+        ))
+
+    else:  # rich (default)
+        from rich.console import Console
+        from rich.table import Table
+        from rich.panel import Panel
+        from rich import box
+
+        console = Console()
+
+        # Rich table format for interactive CLI
+        console.print("\n[bold cyan]Sable's Consciousness State[/bold cyan]\n")
+
+        # Proto-Self (Body State)
+        body_table = Table(title="Proto-Self (Body State)", box=box.ROUNDED)
+        body_table.add_column("Parameter", style="cyan")
+        body_table.add_column("Value", style="yellow")
+
+        body_state = state.body_state
+        for label, field, spec in _BODY_ROWS:
+            body_table.add_row(label, f"{getattr(body_state, field):{spec}}")
+        body_table.add_row("Background Emotion", state.background_emotion)
+        body_table.add_row("Homeostatic Pressure", f"{state.homeostatic_pressure:.2f}")
+
+        console.print(body_table)
+        console.print()
+
+        # Core Consciousness (Emotions)
+        if state.active_emotions:
+            emotions_table = Table(title="Core Consciousness (Active Emotions)", box=box.ROUNDED)
+            emotions_table.add_column("Emotion", style="magenta")
+            emotions_table.add_column("Intensity", style="yellow")
+            emotions_table.add_column("Cause", style="white")
+
+            for emotion in state.active_emotions:
+                emotions_table.add_row(
+                    emotion['type'],
+                    f"{emotion['intensity']:.2f}",
+                    emotion['cause'][_CAUSE]
+                )
+
+            console.print(emotions_table)
+            console.print()
+
+        console.print(f"[cyan]Overall Valence:[/cyan] {state.overall_valence:+.2f}")
+        console.print(f"[cyan]Overall Arousal:[/cyan] {state.overall_arousal:.2f}\n")
+
+        # Extended Consciousness (Memory)
+        traits_display = ', '.join(f'{k}: {v:.2f}' for k, v in state.identity_traits.items()) if state.identity_traits else 'none'
+        console.print(
+            Panel(
+                f"[cyan]Significant Memories:[/cyan] {state.num_significant_memories}\n"
+                f"[cyan]Identity Traits:[/cyan] {traits_display}",
+                title="Extended Consciousness",
+                box=box.ROUNDED
+            )
+        )
@@ -0,0 +1,239 @@
+"""
+Background daemon that keeps Sable loaded between CLI invocations.
+
+Hooks run `sable status` / `sable memories` on every prompt, and each run
+pays for Python startup, imports and StateManager initialization. While
+`sable daemon start` is running, the `sable` command is a thin client
+that forwards its arguments over a Unix socket and prints the reply;
+when no daemon is listening it runs the command in-process as before.
+
+Protocol: the client sends one JSON line {"argv": [...]} (or
+{"op": "ping"} / {"op": "stop"}) and the daemon answers with one JSON line
+{"stdout": ..., "stderr": ..., "code": ...}.
+"""
+
+import io
+import os
+import socket
+import sys
+import traceback
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import orjson
+
+
+def socket_path() -> Path:
+    """
+    Get the daemon's socket path.
+
+    Returns:
+        $XDG_RUNTIME_DIR/sable.sock, or ~/.sable/sable.sock without it
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "sable.sock"
+    return Path.home() / ".sable" / "sable.sock"
+
+
+def request(message: dict, path: Optional[Path] = None) -> Optional[dict]:
+    """
+    Send one message to the daemon and wait for its reply.
+
+    Args:
+        message: Request to send
+        path: Socket path (default: socket_path())
+
+    Returns:
+        The daemon's reply, or None if no daemon is listening
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        try:
+            sock.connect(str(path or socket_path()))
+        except OSError:
+            # Not running (missing socket, or stale socket file)
+            return None
+
+        with sock.makefile("rwb") as stream:
+            stream.write(orjson.dumps(message) + b"\n")
+            stream.flush()
+            reply = stream.readline()
+    finally:
+        sock.close()
+
+    return orjson.loads(reply) if reply else None
+
+
+def main() -> None:
+    """Entry point for the `sable` command: use the daemon when it is up."""
+    argv = sys.argv[1:]
+
+    # `sable daemon ...` manages the daemon itself, so always runs locally
+    if argv and argv[0] != "daemon":
+        reply = request({"argv": argv})
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            sys.exit(reply["code"])
+
+    from sable.cli.commands import cli
+    cli()
+
+
+def start_background(timeout: float = 5.0) -> bool:
+    """
+    Start the daemon as a detached process and wait until it answers.
+
+    Lets a hook (e.g. SessionStart) bring the daemon up without keeping a
+    terminal attached. Output goes to ~/.sable/daemon.log.
+
+    Args:
+        timeout: Seconds to wait for the daemon to accept requests
+
+    Returns:
+        True once the daemon answers, False if it didn't within timeout
+    """
+    import subprocess
+    import time
+
+    log_path = Path.home() / ".sable" / "daemon.log"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with open(log_path, "ab") as log:
+        subprocess.Popen(
+            [sys.executable, "-c", "from sable.cli.daemon import serve; serve()"],
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=log,
+            start_new_session=True,
+        )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if request({"op": "ping"}) is not None:
+            return True
+        time.sleep(0.05)
+    return False
+
+
+def _db_signature() -> Tuple[Tuple[int, int], ...]:
+    """Get (mtime, size) of the state database files, to notice outside writes."""
+    from sable.database.schema import DEFAULT_DB_PATH
+
+    signature = []
+    for path in (DEFAULT_DB_PATH, DEFAULT_DB_PATH.with_name(DEFAULT_DB_PATH.name + "-wal")):
+        try:
+            stat = path.stat()
+        except OSError:
+            signature.append((0, 0))
+        else:
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    return tuple(signature)
+
+
+def _run_command(argv: List[str], obj) -> dict:
+    """
+    Run one CLI command in the daemon, capturing its output.
+
+    Args:
+        argv: Command-line arguments, without the program name
+        obj: CLIState to run the command with
+
+    Returns:
+        Reply with the command's stdout, stderr and exit code
+    """
+    # Loaded by the daemon's first request and cached from then on; the
+    # client path never needs them
+    import click
+
+    from sable.cli.commands import cli
+
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    code = 0
+
+    with redirect_stdout(stdout), redirect_stderr(stderr):
+        try:
+            rv = cli.main(args=argv, prog_name="sable", obj=obj, standalone_mode=False)
+            if isinstance(rv, int):
+                code = rv
+        except click.ClickException as e:
+            e.show()
+            code = e.exit_code
+        except click.Abort:
+            click.echo("Aborted!", err=True)
+            code = 1
+        except Exception:
+            traceback.print_exc()
+            code = 1
+
+    return {"stdout": stdout.getvalue(), "stderr": stderr.getvalue(), "code": code}
+
+
+def serve(path: Optional[Path] = None) -> None:
+    """
+    Run the daemon in the foreground until it is asked to stop.
+
+    Requests are handled one at a time, so commands never run
+    concurrently against the shared StateManager. The manager is rebuilt
+    whenever another process (such as the conversation hook) has written
+    to the state database since the last request.
+
+    Args:
+        path: Socket path (default: socket_path())
+
+    Raises:
+        RuntimeError: If a daemon is already listening on the socket
+    """
+    import socketserver
+
+    from sable.analysis.emotion_analyzer import get_analyzer
+    from sable.cli._util import CLIState
+
+    path = path or socket_path()
+    if request({"op": "ping"}, path) is not None:
+        raise RuntimeError(f"Sable daemon already running on {path}")
+
+    # Serving many analyses, the daemon amortizes a claude worker process
+    get_analyzer(use_worker=True)
+
+    # Left behind by a daemon that didn't shut down cleanly
+    if path.exists():
+        path.unlink()
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            message = orjson.loads(self.rfile.readline())
+            server = self.server
+
+            if message.get("op") == "stop":
+                server.stopping = True
+                reply = {"stdout": "", "stderr": "", "code": 0}
+            elif message.get("op") == "ping":
+                reply = {"stdout": "", "stderr": "", "code": 0}
+            else:
+                if server.cli_state is None or _db_signature() != server.db_signature:
+                    server.cli_state = CLIState()
+
+                reply = _run_command(message["argv"], server.cli_state)
+                server.db_signature = _db_signature()
+
+            self.wfile.write(orjson.dumps(reply) + b"\n")
+
+    with socketserver.UnixStreamServer(str(path), Handler) as server:
+        server.stopping = False
+        server.cli_state = None
+        server.db_signature = None
+        os.chmod(path, 0o600)
+
+        try:
+            while not server.stopping:
+                server.handle_request()
+        finally:
+            path.unlink(missing_ok=True)
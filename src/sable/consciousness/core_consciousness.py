@@ -17,21 +17,41 @@ Key components:
 """
 
 from datetime import datetime
-from typing import List, Optional, Dict
+from itertools import compress
+from typing import List, Optional, Dict, Tuple
 from pathlib import Path
 
-from sable.models.emotion import Emotion, EmotionType, Feeling
+import aiosqlite
+import numpy as np
+
+from sable.models.emotion import DECAYED_THRESHOLD, Emotion, EmotionType, Feeling
 from sable.models.memory import SomaticMarker
 from sable.models.body_state import BodyState
 from sable.database.queries import (
     save_emotion,
+    save_emotions,
     get_active_emotions,
-    update_emotion,
+    update_emotions,
     save_feeling,
+    save_feelings,
+    save_emotion_with_feeling,
     save_somatic_marker,
     get_somatic_markers,
     update_somatic_marker,
 )
+from sable.decay.decay_functions import decay_config_for_emotion, valence_asymmetric_decay_array
+
+# Emotion types by index, for the type-code column of the emotion arrays
+_EMOTION_TYPES = list(EmotionType)
+_TYPE_CODES = {emotion_type: code for code, emotion_type in enumerate(_EMOTION_TYPES)}
+
+# Decay parameters of each emotion type, indexed by type code
+_HALF_LIVES = np.array(
+    [decay_config_for_emotion(t.value)['half_life'] for t in _EMOTION_TYPES], dtype=np.float64
+)
+_BASELINES = np.array(
+    [decay_config_for_emotion(t.value)['baseline'] for t in _EMOTION_TYPES], dtype=np.float64
+)
 
 
 class CoreConsciousness:
@@ -53,17 +73,28 @@ class CoreConsciousness:
         self.active_emotions: List[Emotion] = []
         self.somatic_markers: List[SomaticMarker] = []
 
+        # Columns of the non-decayed active emotions, built on demand and
+        # reset whenever active_emotions changes
+        self._arrays: Optional[Tuple[np.ndarray, ...]] = None
+
+        # Lowercased patterns and strengths of somatic_markers, built on
+        # demand and reset whenever somatic_markers changes
+        self._marker_arrays: Optional[Tuple[np.ndarray, np.ndarray]] = None
+
     async def initialize(self) -> None:
         """Load active emotions and somatic markers from database."""
         self.active_emotions = await get_active_emotions(self.db_path)
+        self._arrays = None
         self.somatic_markers = await get_somatic_markers(db_path=self.db_path)
+        self._marker_arrays = None
 
     async def trigger_emotion(
         self,
         emotion_type: EmotionType,
         intensity: float,
         cause: str,
-        body_state: Optional[BodyState] = None
+        body_state: Optional[BodyState] = None,
+        conn: Optional[aiosqlite.Connection] = None
     ) -> Emotion:
         """
         Trigger an emotion event.
@@ -77,34 +108,82 @@ class CoreConsciousness:
             intensity: Intensity 0-1
             cause: What triggered this emotion
             body_state: Current body state (used to generate body signature)
+            conn: Connection of an open database transaction to save in
 
         Returns:
             The triggered Emotion
         """
+        # Create emotion
+        emotion = self._build_emotion(emotion_type, intensity, cause)
+
+        # Save to database
+        emotion_id = await save_emotion(emotion, self.db_path, conn)
+        emotion.id = emotion_id
+
+        # Add to active emotions
+        self.active_emotions.append(emotion)
+        self._arrays = None
+
+        return emotion
+
+    async def trigger_emotions(
+        self,
+        items: List[Tuple[EmotionType, float, str]],
+        conn: Optional[aiosqlite.Connection] = None
+    ) -> List[Emotion]:
+        """
+        Trigger several emotion events at once.
+
+        Equivalent to calling trigger_emotion() for each item, but all
+        emotions are saved in a single database transaction.
+
+        Args:
+            items: (emotion_type, intensity, cause) for each emotion
+            conn: Connection of an open database transaction to save in
+
+        Returns:
+            The triggered Emotions, in order
+        """
+        # One timestamp for the whole batch: they were triggered together
+        now = datetime.now()
+        emotions = [
+            self._build_emotion(emotion_type, intensity, cause, now)
+            for emotion_type, intensity, cause in items
+        ]
+
+        emotion_ids = await save_emotions(emotions, self.db_path, conn)
+        for emotion, emotion_id in zip(emotions, emotion_ids):
+            emotion.id = emotion_id
+
+        self.active_emotions.extend(emotions)
+        self._arrays = None
+
+        return emotions
+
+    def _build_emotion(
+        self,
+        emotion_type: EmotionType,
+        intensity: float,
+        cause: str,
+        timestamp: Optional[datetime] = None
+    ) -> Emotion:
+        """Create an emotion with default valence/arousal and its body signature."""
         # Get default valence and arousal for this emotion type
         valence = Emotion.get_default_valence(emotion_type)
         arousal = Emotion.get_default_arousal(emotion_type)
 
-        # Create emotion
         emotion = Emotion(
             type=emotion_type,
             intensity=intensity,
             valence=valence,
             arousal=arousal,
             cause=cause,
-            timestamp=datetime.now(),
+            timestamp=timestamp or datetime.now(),
         )
 
         # Generate body signature
         emotion.body_signature = emotion.get_body_signature()
 
-        # Save to database
-        emotion_id = await save_emotion(emotion, self.db_path)
-        emotion.id = emotion_id
-
-        # Add to active emotions
-        self.active_emotions.append(emotion)
-
         return emotion
 
     async def feel_emotion(
@@ -128,6 +207,81 @@ class CoreConsciousness:
         Returns:
             The Feeling
         """
+        feeling = self._build_feeling(emotion, awareness_level)
+
+        # Save to database
+        feeling_id = await save_feeling(feeling, self.db_path)
+        feeling.id = feeling_id
+
+        return feeling
+
+    async def feel_emotions(
+        self,
+        emotions: List[Emotion],
+        awareness_level: float = 0.8,
+        conn: Optional[aiosqlite.Connection] = None
+    ) -> List[Feeling]:
+        """
+        Create feelings from several emotions at once.
+
+        Equivalent to calling feel_emotion() for each emotion, but all
+        feelings are saved in a single database transaction.
+
+        Args:
+            emotions: The emotions to feel
+            awareness_level: How consciously aware (0-1)
+            conn: Connection of an open database transaction to save in
+
+        Returns:
+            The Feelings, in order
+        """
+        feelings = [self._build_feeling(emotion, awareness_level) for emotion in emotions]
+
+        feeling_ids = await save_feelings(feelings, self.db_path, conn)
+        for feeling, feeling_id in zip(feelings, feeling_ids):
+            feeling.id = feeling_id
+
+        return feelings
+
+    async def experience_emotion(
+        self,
+        emotion_type: EmotionType,
+        intensity: float,
+        cause: str,
+        body_state: Optional[BodyState] = None,
+        awareness_level: float = 0.8,
+        conn: Optional[aiosqlite.Connection] = None
+    ) -> Tuple[Emotion, Feeling]:
+        """
+        Trigger an emotion and feel it straight away.
+
+        Equivalent to trigger_emotion() followed by feel_emotion(), but the
+        emotion and the feeling are saved in a single database transaction.
+
+        Args:
+            emotion_type: Type of emotion
+            intensity: Intensity 0-1
+            cause: What triggered this emotion
+            body_state: Current body state (used to generate body signature)
+            awareness_level: How consciously aware (0-1)
+            conn: Connection of an open database transaction to save in
+
+        Returns:
+            The triggered Emotion and its Feeling
+        """
+        emotion = self._build_emotion(emotion_type, intensity, cause)
+        feeling = self._build_feeling(emotion, awareness_level)
+
+        # Sets emotion.id as well
+        _, feeling.id = await save_emotion_with_feeling(feeling, self.db_path, conn)
+
+        self.active_emotions.append(emotion)
+        self._arrays = None
+
+        return emotion, feeling
+
+    def _build_feeling(self, emotion: Emotion, awareness_level: float) -> Feeling:
+        """Create a verbalized feeling of an emotion."""
         feeling = Feeling(
             emotion=emotion,
             awareness_level=awareness_level,
@@ -138,10 +292,6 @@ class CoreConsciousness:
         feeling.description = feeling.verbalize()
         feeling.verbalized = True
 
-        # Save to database
-        feeling_id = await save_feeling(feeling, self.db_path)
-        feeling.id = feeling_id
-
         return feeling
 
     async def apply_decay(self, seconds_elapsed: Optional[float] = None) -> List[Emotion]:
@@ -159,27 +309,58 @@ class CoreConsciousness:
         if not self.active_emotions:
             return []
 
-        updated_emotions = []
-
-        for emotion in self.active_emotions:
-            # Calculate time elapsed if not provided
-            if seconds_elapsed is None:
-                now = datetime.now()
-                time_diff = now - emotion.timestamp
-                time_elapsed = time_diff.total_seconds()
-            else:
-                time_elapsed = seconds_elapsed
-
-            # Apply decay
-            decayed_emotion = emotion.apply_decay(time_elapsed)
-
-            # Update in database
-            await update_emotion(decayed_emotion, self.db_path)
-
-            updated_emotions.append(decayed_emotion)
+        emotions = self.active_emotions
+        count = len(emotions)
+        now = datetime.now()
+
+        # Calculate time elapsed if not provided, as float seconds computed
+        # in datetime64 rather than one timedelta per emotion
+        if seconds_elapsed is None:
+            timestamps = np.array([e.timestamp for e in emotions], dtype='datetime64[us]')
+            time_elapsed = (np.datetime64(now, 'us') - timestamps) / np.timedelta64(1, 's')
+        else:
+            time_elapsed = seconds_elapsed
+
+        # Decay all emotions at once (same math as Emotion.apply_decay)
+        type_codes = np.fromiter(
+            (_TYPE_CODES[e.type] for e in emotions), dtype=np.intp, count=count
+        )
+        intensities = np.fromiter((e.intensity for e in emotions), dtype=np.float64, count=count)
+        valence = np.fromiter((e.valence for e in emotions), dtype=np.float64, count=count)
+        new_intensities = valence_asymmetric_decay_array(
+            current_intensity=intensities,
+            valence=valence,
+            base_half_life=_HALF_LIVES[type_codes],
+            time_elapsed=time_elapsed,
+            baseline=_BASELINES[type_codes],
+        )
+        decayed = np.fromiter((e.decayed for e in emotions), dtype=bool, count=count)
+        decayed |= new_intensities < DECAYED_THRESHOLD
+
+        updated_emotions = [
+            emotion.model_copy(update={
+                'intensity': intensity,
+                'timestamp': now,
+                'decayed': is_decayed,
+            })
+            for emotion, intensity, is_decayed in zip(
+                emotions, new_intensities.tolist(), decayed.tolist()
+            )
+        ]
 
-        # Remove fully decayed emotions from active list
-        self.active_emotions = [e for e in updated_emotions if not e.decayed]
+        # Update in database
+        await update_emotions(updated_emotions, self.db_path)
+
+        # Remove fully decayed emotions from active list, and keep the
+        # decayed columns so aggregation doesn't rebuild them from objects
+        live = ~decayed
+        self.active_emotions = list(compress(updated_emotions, live.tolist()))
+        self._arrays = (
+            new_intensities[live],
+            valence[live],
+            np.fromiter((e.arousal for e in emotions), dtype=np.float64, count=count)[live],
+            type_codes[live],
+        )
 
         return updated_emotions
 
@@ -202,18 +383,28 @@ class CoreConsciousness:
         Returns:
             Strongest matching SomaticMarker, or None
         """
-        # Get markers matching this situation
-        markers = await get_somatic_markers(
-            situation_pattern=situation_description,
-            min_strength=min_strength,
-            db_path=self.db_path
-        )
+        if not self.somatic_markers:
+            return None
 
-        if not markers:
+        if self._marker_arrays is None:
+            self._marker_arrays = (
+                np.array([m.situation_pattern.lower() for m in self.somatic_markers], dtype=str),
+                np.fromiter((m.strength for m in self.somatic_markers), dtype=np.float64,
+                            count=len(self.somatic_markers)),
+            )
+        patterns, strengths = self._marker_arrays
+
+        # Markers whose pattern contains the situation (as the database's
+        # case-insensitive LIKE '%situation%' did), strong enough to count
+        matches = np.flatnonzero(
+            (np.char.find(patterns, situation_description.lower()) >= 0)
+            & (strengths >= min_strength)
+        )
+        if not len(matches):
             return None
 
         # Return strongest marker
-        return markers[0]
+        return self.somatic_markers[matches[np.argmax(strengths[matches])]]
 
     async def create_somatic_marker(
         self,
@@ -254,6 +445,7 @@ class CoreConsciousness:
 
         # Add to cached markers
         self.somatic_markers.append(marker)
+        self._marker_arrays = None
 
         return marker
 
@@ -284,6 +476,7 @@ class CoreConsciousness:
         for i, m in enumerate(self.somatic_markers):
             if m.id == updated_marker.id:
                 self.somatic_markers[i] = updated_marker
+                self._marker_arrays = None
                 break
 
         return updated_marker
@@ -298,16 +491,21 @@ class CoreConsciousness:
         Returns:
             Dict of emotion_type -> intensity
         """
-        emotion_totals: Dict[str, float] = {}
+        intensity, _, _, type_codes = self._emotion_arrays()
+        if not len(type_codes):
+            return {}
 
-        for emotion in self.active_emotions:
-            if not emotion.decayed:
-                emotion_type = emotion.type.value
-                current_intensity = emotion_totals.get(emotion_type, 0.0)
-                emotion_totals[emotion_type] = current_intensity + emotion.intensity
+        totals = np.bincount(type_codes, weights=intensity, minlength=len(_EMOTION_TYPES))
+
+        # Types in order of first appearance, as they were felt
+        present, first_seen = np.unique(type_codes, return_index=True)
+        present = present[np.argsort(first_seen)]
 
         # Cap at 1.0
-        return {k: min(1.0, v) for k, v in emotion_totals.items()}
+        return {
+            _EMOTION_TYPES[code].value: min(1.0, float(totals[code]))
+            for code in present
+        }
 
     def get_overall_valence_arousal(self) -> tuple[float, float]:
         """
@@ -319,22 +517,51 @@ class CoreConsciousness:
         if not self.active_emotions:
             return (0.0, 0.5)  # Neutral
 
-        active = [e for e in self.active_emotions if not e.decayed]
-        if not active:
-            return (0.0, 0.5)
-
-        total_valence = sum(e.valence * e.intensity for e in active)
-        total_arousal = sum(e.arousal * e.intensity for e in active)
-        total_intensity = sum(e.intensity for e in active)
+        intensity, valence, arousal, _ = self._emotion_arrays()
 
+        total_intensity = float(intensity.sum())
         if total_intensity == 0:
             return (0.0, 0.5)
 
-        avg_valence = total_valence / total_intensity
-        avg_arousal = total_arousal / total_intensity
+        avg_valence = float(np.dot(valence, intensity)) / total_intensity
+        avg_arousal = float(np.dot(arousal, intensity)) / total_intensity
 
         return (avg_valence, avg_arousal)
 
+    def _emotion_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the non-decayed active emotions as parallel arrays.
+
+        Returns:
+            Tuple of (intensity, valence, arousal, type_code) arrays
+        """
+        if self._arrays is None:
+            active = [e for e in self.active_emotions if not e.decayed]
+            count = len(active)
+            self._arrays = (
+                np.fromiter((e.intensity for e in active), dtype=np.float64, count=count),
+                np.fromiter((e.valence for e in active), dtype=np.float64, count=count),
+                np.fromiter((e.arousal for e in active), dtype=np.float64, count=count),
+                np.fromiter((_TYPE_CODES[e.type] for e in active), dtype=np.intp, count=count),
+            )
+        return self._arrays
+
+    def get_active_emotion_dicts(self) -> List[Dict]:
+        """
+        Get the non-decayed active emotions as plain dicts.
+
+        Returns:
+            List of {'type', 'intensity', 'cause'} dicts
+        """
+        return [
+            {
+                'type': e.type.value,
+                'intensity': e.intensity,
+                'cause': e.cause,
+            }
+            for e in self.active_emotions if not e.decayed
+        ]
+
     def to_dict(self) -> dict:
         """
         Export core consciousness state as dictionary.
@@ -345,14 +572,7 @@ class CoreConsciousness:
         valence, arousal = self.get_overall_valence_arousal()
 
         return {
-            'active_emotions': [
-                {
-                    'type': e.type.value,
-                    'intensity': e.intensity,
-                    'cause': e.cause,
-                }
-                for e in self.active_emotions if not e.decayed
-            ],
+            'active_emotions': self.get_active_emotion_dicts(),
             'emotional_state': self.get_current_emotional_state(),
             'overall_valence': valence,
             'overall_arousal': arousal,
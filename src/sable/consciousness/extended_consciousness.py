@@ -13,19 +13,89 @@ Extended consciousness builds on core consciousness by adding:
 This is what makes us feel like a continuous person with a history and future.
 """
 
+import heapq
+import io
+import os
+import time
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
+from itertools import count
+from typing import List, Optional, Dict, Set, Tuple
 from pathlib import Path
 
+import numpy as np
+import orjson
+
 from sable.models.memory import Memory, Event, SomaticMarker
 from sable.models.emotion import EmotionType
 from sable.database.queries import (
     save_event,
     save_memory,
+    save_events_and_memories,
     query_memories,
-    update_memory,
+    update_memories,
     get_event,
+    get_memory_version,
+    get_memory_emotion_index,
 )
+from sable.database.schema import DEFAULT_DB_PATH
+from sable.decay.decay_functions import memory_decay_factor_array
+
+# Salience needed to be kept in memory as a significant memory, and how
+# many of the most salient are kept
+_SIGNIFICANT_SALIENCE = 0.6
+_SIGNIFICANT_LIMIT = 20
+
+# Accessed memories are written back once this many are pending, or once
+# this many seconds have passed since the last write
+_FLUSH_EVERY = 16
+_FLUSH_INTERVAL = 0.5
+
+# Narratives remembered by construct_narrative()
+_NARRATIVE_CACHE_SIZE = 64
+
+# Most memory IDs passed as SQL parameters in one emotion query (SQLite
+# builds before 3.32 allow only 999 parameters per statement)
+_MAX_ID_FILTER = 900
+
+
+def _read_significant_cache(path: Path, version: Optional[int]) -> Optional[List[Memory]]:
+    """
+    Read cached significant memories.
+
+    Args:
+        path: Cache file
+        version: Current memory change counter (see get_memory_version)
+
+    Returns:
+        The cached memories, or None if missing, unreadable or out of date
+    """
+    if version is None:
+        return None
+
+    try:
+        cache = orjson.loads(path.read_bytes())
+        if cache['version'] != version:
+            return None
+        return [Memory.model_validate(memory) for memory in cache['memories']]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_significant_cache(path: Path, version: int, memories: List[Memory]) -> None:
+    """Write significant memories to the cache file, tagged with the memory version."""
+    data = orjson.dumps({
+        'version': version,
+        'memories': [memory.model_dump() for memory in memories],
+    })
+
+    # Write and rename, so a concurrent reader never sees a partial file
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is only an optimization
+        tmp_path.unlink(missing_ok=True)
 
 
 class ExtendedConsciousness:
@@ -46,7 +116,33 @@ class ExtendedConsciousness:
         self.db_path = db_path
         self.identity_traits: Dict[str, float] = {}  # Trait name -> strength (0-1)
         self.core_values: List[str] = []
-        self.significant_memories: List[Memory] = []
+
+        # Min-heap of the most significant memories as (salience, -seq,
+        # memory ID): the root is the least salient and, among equals, the
+        # newest, which is what gets evicted when a stronger memory arrives
+        self._significant: List[Tuple[float, int, int]] = []
+        self._seq = count()
+
+        # The memories in _significant, by ID
+        self._memories_by_id: Dict[int, Memory] = {}
+
+        # Accessed memories not yet written to the database, by ID
+        self._dirty: Dict[int, Memory] = {}
+        self._last_flush = time.monotonic()
+
+        # Narratives already constructed, keyed by the version of the
+        # cached memories and the (ID, access count) of each memory used
+        self._narratives: Dict[Tuple, str] = {}
+        self._memory_version = 0
+
+        # Emotion type -> IDs of the memories associated with it, loaded
+        # on the first emotion query and extended as this instance encodes
+        # memories; emotion queries look up rows by these IDs
+        self._emotion_index: Optional[Dict[str, Set[int]]] = None
+
+        # to_dict()'s most_recent_memories, rebuilt only after the
+        # significant memories change
+        self._recent_memories: Optional[Tuple[dict, ...]] = None
 
     async def initialize(self, identity_traits: Optional[Dict[str, float]] = None) -> None:
         """
@@ -59,12 +155,39 @@ class ExtendedConsciousness:
         if identity_traits:
             self.identity_traits = identity_traits
 
-        # Load most significant memories
-        self.significant_memories = await query_memories(
-            min_salience=0.6,
-            limit=20,
-            db_path=self.db_path
-        )
+        # Load most significant memories, from the on-disk cache if no
+        # memory has changed since it was written
+        cache_path = (self.db_path or DEFAULT_DB_PATH).with_suffix('.sigcache')
+        version = await get_memory_version(self.db_path)
+        memories = _read_significant_cache(cache_path, version)
+        if memories is None:
+            memories = await query_memories(
+                min_salience=_SIGNIFICANT_SALIENCE,
+                limit=_SIGNIFICANT_LIMIT,
+                db_path=self.db_path
+            )
+            if version is not None:
+                _write_significant_cache(cache_path, version, memories)
+        self._significant = [
+            (memory.emotional_salience, -next(self._seq), memory.id) for memory in memories
+        ]
+        heapq.heapify(self._significant)
+        self._memories_by_id = {memory.id: memory for memory in memories}
+        self._recent_memories = None
+
+    @property
+    def significant_memories(self) -> List[Memory]:
+        """The most significant memories, most salient first."""
+        memories_by_id = self._memories_by_id
+        return [
+            memories_by_id[memory_id]
+            for _, _, memory_id in sorted(self._significant, reverse=True)
+        ]
+
+    @property
+    def num_significant_memories(self) -> int:
+        """Number of significant memories (without sorting them)."""
+        return len(self._significant)
 
     async def record_event(
         self,
@@ -118,6 +241,69 @@ class ExtendedConsciousness:
         Returns:
             Memory if salient enough, None otherwise
         """
+        memory = self._build_memory(event, narrative_role, identity_relevance)
+        if memory is None:
+            return None
+
+        # Save to database (with the event, in one transaction, if it's new)
+        memory_id = await save_memory(memory, self.db_path)
+        memory.id = memory_id
+
+        self._add_encoded(memory)
+
+        return memory
+
+    async def record_and_encode(
+        self,
+        items: List[Tuple[str, Optional[str], Optional[Dict[str, float]], Optional[str], float]]
+    ) -> List[Tuple[Event, Optional[Memory]]]:
+        """
+        Record several events and encode the salient ones as memories.
+
+        Equivalent to record_event() then encode_memory() for each item,
+        but all events and memories are saved in a single transaction.
+
+        Args:
+            items: (description, context, emotional_impact, narrative_role,
+                   identity_relevance) for each event
+
+        Returns:
+            (Event, Memory or None if not salient enough) for each item, in order
+        """
+        now = datetime.now()
+        events = [
+            Event(
+                description=description,
+                context=context,
+                timestamp=now,
+                emotional_impact=emotional_impact or {},
+            )
+            for description, context, emotional_impact, _, _ in items
+        ]
+        memories = [
+            self._build_memory(event, narrative_role, identity_relevance)
+            for event, (_, _, _, narrative_role, identity_relevance) in zip(events, items)
+        ]
+
+        await save_events_and_memories(
+            events,
+            [memory for memory in memories if memory is not None],
+            self.db_path
+        )
+
+        for memory in memories:
+            if memory is not None:
+                self._add_encoded(memory)
+
+        return list(zip(events, memories))
+
+    def _build_memory(
+        self,
+        event: Event,
+        narrative_role: Optional[str],
+        identity_relevance: float
+    ) -> Optional[Memory]:
+        """Create a memory of an event, or None if it isn't salient enough."""
         # Calculate emotional salience
         salience = event.get_emotional_salience()
 
@@ -126,12 +312,9 @@ class ExtendedConsciousness:
             return None
 
         # Extract emotion types from emotional impact
-        associated_emotions = [
-            emotion_type for emotion_type in event.emotional_impact.keys()
-        ]
+        associated_emotions = list(event.emotional_impact)
 
-        # Create memory
-        memory = Memory(
+        return Memory(
             event=event,
             emotional_salience=salience,
             consolidation_level=salience * 0.5,  # Initial consolidation based on salience
@@ -141,21 +324,31 @@ class ExtendedConsciousness:
             created_at=datetime.now(),
         )
 
-        # Save to database
-        memory_id = await save_memory(memory, self.db_path)
-        memory.id = memory_id
-
-        # Add to significant memories if salient enough
-        if salience >= 0.6:
-            self.significant_memories.append(memory)
-            # Keep only top 20
-            self.significant_memories.sort(
-                key=lambda m: m.emotional_salience,
-                reverse=True
-            )
-            self.significant_memories = self.significant_memories[:20]
-
-        return memory
+    def _add_encoded(self, memory: Memory) -> None:
+        """Update in-memory state for a newly encoded memory."""
+        if self._emotion_index is not None:
+            for emotion in memory.associated_emotions:
+                self._emotion_index.setdefault(emotion, set()).add(memory.id)
+        self._add_significant(memory)
+
+    def _add_significant(self, memory: Memory) -> None:
+        """Add a newly encoded memory to significant memories if salient enough."""
+        salience = memory.emotional_salience
+        if salience < _SIGNIFICANT_SALIENCE:
+            return
+
+        entry = (salience, -next(self._seq), memory.id)
+        if len(self._significant) < _SIGNIFICANT_LIMIT:
+            heapq.heappush(self._significant, entry)
+        elif salience > self._significant[0][0]:
+            # Keep only the top _SIGNIFICANT_LIMIT
+            _, _, evicted_id = heapq.heapreplace(self._significant, entry)
+            del self._memories_by_id[evicted_id]
+        else:
+            return
+
+        self._memories_by_id[memory.id] = memory
+        self._recent_memories = None
 
     async def retrieve_memory(self, memory_id: int) -> Optional[Memory]:
         """
@@ -164,6 +357,9 @@ class ExtendedConsciousness:
         Each retrieval strengthens the memory (consolidation).
         This simulates how remembering reinforces memories.
 
+        The strengthened memory is written to the database in batches
+        (see flush()), so retrieval doesn't wait on a commit.
+
         Args:
             memory_id: Memory ID
 
@@ -171,19 +367,23 @@ class ExtendedConsciousness:
             The Memory if found
         """
         # Find in significant memories cache
-        for memory in self.significant_memories:
-            if memory.id == memory_id:
-                # Access the memory (strengthens it)
-                updated_memory = memory.access()
+        memory = self._memories_by_id.get(memory_id)
+        if memory is not None:
+            # Access the memory (strengthens it)
+            updated_memory = memory.access()
 
-                # Update in database
-                await update_memory(updated_memory, self.db_path)
+            # Update in cache (salience is unchanged, so the heap holds)
+            self._memories_by_id[memory_id] = updated_memory
+            self._memory_version += 1
+            self._recent_memories = None
 
-                # Update in cache
-                idx = self.significant_memories.index(memory)
-                self.significant_memories[idx] = updated_memory
+            # Queue the database update
+            self._dirty[memory_id] = updated_memory
+            if (len(self._dirty) >= _FLUSH_EVERY
+                    or time.monotonic() - self._last_flush >= _FLUSH_INTERVAL):
+                await self.flush()
 
-                return updated_memory
+            return updated_memory
 
         # Not in cache, query database
         # (Would need to implement get_memory_by_id in queries.py)
@@ -206,18 +406,33 @@ class ExtendedConsciousness:
         Returns:
             List of matching memories
         """
-        memories = await query_memories(
+        if self._emotion_index is None:
+            self._emotion_index = await get_memory_emotion_index(self.db_path)
+
+        memory_ids = self._emotion_index.get(emotion_type)
+
+        # No memory has this emotion
+        if not memory_ids:
+            return []
+
+        # Filtered in SQL, so the limit applies to matching memories. Look
+        # up rows by ID where the list fits in a statement, otherwise
+        # through the memory_emotions table.
+        if len(memory_ids) <= _MAX_ID_FILTER:
+            return await query_memories(
+                min_salience=min_salience,
+                limit=50,
+                db_path=self.db_path,
+                memory_ids=list(memory_ids)
+            )
+
+        return await query_memories(
             min_salience=min_salience,
             limit=50,
-            db_path=self.db_path
+            db_path=self.db_path,
+            emotion_type=emotion_type
         )
 
-        # Filter by emotion
-        return [
-            m for m in memories
-            if emotion_type in m.associated_emotions
-        ]
-
     async def get_identity_relevant_memories(self, min_relevance: float = 0.7) -> List[Memory]:
         """
         Get memories most relevant to sense of identity.
@@ -254,28 +469,48 @@ class ExtendedConsciousness:
         if not memories:
             return "No significant memories to form a narrative."
 
+        # Saved memories are identified by ID; unsaved ones aren't cached
+        key = (self._memory_version, tuple((m.id, m.access_count) for m in memories))
+        narrative = self._narratives.get(key)
+        if narrative is not None:
+            return narrative
+
+        narrative = self._build_narrative(memories)
+        if all(m.id is not None for m in memories):
+            if len(self._narratives) >= _NARRATIVE_CACHE_SIZE:
+                self._narratives.clear()
+            self._narratives[key] = narrative
+
+        return narrative
+
+    def _build_narrative(self, memories: List[Memory]) -> str:
+        """Build the narrative text for construct_narrative()."""
         # Sort by timestamp
         sorted_memories = sorted(memories, key=lambda m: m.event.timestamp)
 
-        # Build narrative
-        narrative_parts = []
+        # Build narrative, one line per memory, written straight into the
+        # buffer rather than assembled from per-memory strings
+        buf = io.StringIO()
+        separator = ""
 
         for memory in sorted_memories:
-            # Memory description
-            desc = memory.event.description
+            buf.write(separator)
+            separator = "\n"
 
-            # Add emotional coloring
-            if memory.associated_emotions:
-                emotions_str = ", ".join(memory.associated_emotions)
-                desc = f"{desc} (felt: {emotions_str})"
-
-            # Add narrative role if present
+            # Narrative role if present
             if memory.narrative_role:
-                desc = f"[{memory.narrative_role}] {desc}"
+                buf.write(f"[{memory.narrative_role}] ")
+
+            # Memory description
+            buf.write(memory.event.description)
 
-            narrative_parts.append(desc)
+            # Emotional coloring
+            if memory.associated_emotions:
+                buf.write(" (felt: ")
+                buf.write(", ".join(memory.associated_emotions))
+                buf.write(")")
 
-        return "\n".join(narrative_parts)
+        return buf.getvalue()
 
     def update_identity_trait(self, trait_name: str, change: float) -> None:
         """
@@ -314,27 +549,46 @@ class ExtendedConsciousness:
         Returns:
             List of updated memories
         """
-        updated_memories = []
+        memories = self.significant_memories
+        if not memories:
+            return []
 
-        for memory in self.significant_memories:
-            decay_factor = memory.decay_over_time(days_elapsed)
+        count = len(memories)
+        salience = np.fromiter((m.emotional_salience for m in memories), np.float64, count)
+        consolidation = np.fromiter((m.consolidation_level for m in memories), np.float64, count)
+        access_count = np.fromiter((m.access_count for m in memories), np.float64, count)
 
-            # Apply decay to consolidation
-            new_consolidation = memory.consolidation_level * decay_factor
+        # Memory.decay_over_time(), for all memories at once
+        decay_factor = memory_decay_factor_array(
+            salience, consolidation, access_count, days_elapsed
+        )
+
+        # Apply decay to consolidation, but don't let it drop too low for
+        # very salient memories
+        new_consolidation = np.maximum(salience * 0.3, consolidation * decay_factor)
 
-            # Don't let it drop too low for very salient memories
-            min_consolidation = memory.emotional_salience * 0.3
-            new_consolidation = max(min_consolidation, new_consolidation)
+        for memory, value in zip(memories, new_consolidation.tolist()):
+            memory.consolidation_level = value
+        self._memory_version += 1
+        self._recent_memories = None
 
-            # Update memory
-            memory.consolidation_level = new_consolidation
+        # Update in database, along with any accesses still queued (some
+        # may be to memories evicted from the significant set since)
+        dirty, self._dirty = self._dirty, {}
+        dirty.update((memory.id, memory) for memory in memories)
+        await update_memories(list(dirty.values()), self.db_path)
 
-            # Update in database
-            await update_memory(memory, self.db_path)
+        return memories
 
-            updated_memories.append(memory)
+    async def flush(self) -> None:
+        """Write queued memory accesses to the database."""
+        self._last_flush = time.monotonic()
+        if not self._dirty:
+            return
 
-        return updated_memories
+        # Swap before awaiting, so accesses made meanwhile queue for next time
+        dirty, self._dirty = self._dirty, {}
+        await update_memories(list(dirty.values()), self.db_path)
 
     def to_dict(self) -> dict:
         """
@@ -343,16 +597,20 @@ class ExtendedConsciousness:
         Returns:
             Dict representation
         """
-        return {
-            'identity_traits': self.identity_traits,
-            'core_values': self.core_values,
-            'num_significant_memories': len(self.significant_memories),
-            'most_recent_memories': [
+        if self._recent_memories is None:
+            self._recent_memories = tuple(
                 {
                     'description': m.event.description,
                     'salience': m.emotional_salience,
                     'emotions': m.associated_emotions,
                 }
                 for m in self.significant_memories[:5]
-            ],
+            )
+
+        return {
+            'identity_traits': self.identity_traits,
+            'core_values': self.core_values,
+            'num_significant_memories': self.num_significant_memories,
+            # Copies, so callers can't change the cached entries
+            'most_recent_memories': [dict(entry) for entry in self._recent_memories],
         }
@@ -12,13 +12,30 @@ Key functions:
 - Integrate emotional impacts into body state
 """
 
+import time
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from pathlib import Path
 
+import aiosqlite
+
 from sable.models.body_state import BodyState
 from sable.database.queries import save_body_state, get_latest_body_state
 
+# Body parameters that body changes may adjust, with their valid ranges
+_BODY_RANGES = {
+    'energy': (0.0, 1.0),
+    'stress': (0.0, 1.0),
+    'arousal': (0.0, 1.0),
+    'valence': (-1.0, 1.0),
+    'temperature': (0.0, 1.0),
+    'tension': (0.0, 1.0),
+    'fatigue': (0.0, 1.0),
+    'pain': (0.0, 1.0),
+    'hunger': (0.0, 1.0),
+    'heart_rate': (0.0, 1.0),
+}
+
 
 class ProtoSelf:
     """
@@ -42,12 +59,24 @@ class ProtoSelf:
         self.db_path = db_path
         self.current_state: Optional[BodyState] = None
 
+        # (state, homeostatic pressure, background emotion), derived from
+        # the BodyState object it names; every change to the body state
+        # replaces current_state with a new object, so a different object
+        # means the values are stale
+        self._derived: Optional[Tuple[BodyState, float, str]] = None
+
+        # time.monotonic_ns() when current_state was set by this process
+        # (None for a state loaded from the database, whose age can only
+        # be known from its timestamp)
+        self._state_set_ns: Optional[int] = None
+
     async def initialize(self) -> None:
         """
         Initialize proto-self by loading or creating body state.
         """
         # Try to load latest body state from database
         self.current_state = await get_latest_body_state(self.db_path)
+        self._state_set_ns = None
 
         # If no state exists, create default state
         if self.current_state is None:
@@ -66,15 +95,21 @@ class ProtoSelf:
 
         return self.current_state
 
-    async def update_state(self, new_state: BodyState) -> None:
+    async def update_state(
+        self,
+        new_state: BodyState,
+        conn: Optional[aiosqlite.Connection] = None
+    ) -> None:
         """
         Update body state and save to database.
 
         Args:
             new_state: New BodyState
+            conn: Connection of an open database transaction to save in
         """
         self.current_state = new_state
-        await self.save()
+        self._state_set_ns = time.monotonic_ns()
+        await self.save(conn)
 
     async def apply_decay(self, seconds_elapsed: Optional[float] = None) -> BodyState:
         """
@@ -94,9 +129,11 @@ class ProtoSelf:
 
         # Calculate time elapsed if not provided
         if seconds_elapsed is None:
-            now = datetime.now()
-            time_diff = now - self.current_state.timestamp
-            seconds_elapsed = time_diff.total_seconds()
+            if self._state_set_ns is not None:
+                seconds_elapsed = (time.monotonic_ns() - self._state_set_ns) * 1e-9
+            else:
+                time_diff = datetime.now() - self.current_state.timestamp
+                seconds_elapsed = time_diff.total_seconds()
 
         # Apply decay
         new_state = self.current_state.apply_decay(seconds_elapsed)
@@ -106,7 +143,11 @@ class ProtoSelf:
 
         return new_state
 
-    async def apply_body_changes(self, changes: Dict[str, float]) -> BodyState:
+    async def apply_body_changes(
+        self,
+        changes: Dict[str, float],
+        conn: Optional[aiosqlite.Connection] = None
+    ) -> BodyState:
         """
         Apply changes to body state from emotions or external events.
 
@@ -114,6 +155,7 @@ class ProtoSelf:
             changes: Dict of parameter -> change amount
                     Positive values increase, negative decrease
                     Example: {'energy': -0.2, 'stress': 0.3}
+            conn: Connection of an open database transaction to save in
 
         Returns:
             Updated BodyState
@@ -121,35 +163,21 @@ class ProtoSelf:
         if self.current_state is None:
             await self.initialize()
 
-        # Create new state with changes applied
-        state_dict = {
-            'energy': self.current_state.energy,
-            'stress': self.current_state.stress,
-            'arousal': self.current_state.arousal,
-            'valence': self.current_state.valence,
-            'temperature': self.current_state.temperature,
-            'tension': self.current_state.tension,
-            'fatigue': self.current_state.fatigue,
-            'pain': self.current_state.pain,
-            'hunger': self.current_state.hunger,
-            'heart_rate': self.current_state.heart_rate,
-        }
-
-        # Apply changes with clamping
+        # Apply changes with clamping to valid ranges
+        current_state = self.current_state
+        updates = {'timestamp': datetime.now(), 'id': None}
         for param, change in changes.items():
-            if param in state_dict:
-                new_value = state_dict[param] + change
-                # Clamp to valid ranges
-                if param == 'valence':
-                    state_dict[param] = max(-1.0, min(1.0, new_value))
-                else:
-                    state_dict[param] = max(0.0, min(1.0, new_value))
+            bounds = _BODY_RANGES.get(param)
+            if bounds is not None:
+                low, high = bounds
+                updates[param] = max(low, min(high, getattr(current_state, param) + change))
 
-        # Create new BodyState (validation happens automatically)
-        new_state = BodyState(**state_dict)
+        # Create new state with changes applied; changed values are already
+        # clamped and the rest were validated, so skip re-validating them
+        new_state = current_state.model_copy(update=updates)
 
         # Update and save
-        await self.update_state(new_state)
+        await self.update_state(new_state, conn)
 
         return new_state
 
@@ -166,7 +194,7 @@ class ProtoSelf:
         if self.current_state is None:
             return 0.0
 
-        return self.current_state.get_homeostatic_pressure()
+        return self._derived_values()[1]
 
     def get_background_emotion(self) -> str:
         """
@@ -183,12 +211,23 @@ class ProtoSelf:
         if self.current_state is None:
             return "equanimity"
 
-        return self.current_state.get_background_emotion()
-
-    async def save(self) -> None:
-        """Save current body state to database."""
+        return self._derived_values()[2]
+
+    def _derived_values(self) -> Tuple[BodyState, float, str]:
+        """Get the cached derived values of current_state, computing them if stale."""
+        state = self.current_state
+        if self._derived is None or self._derived[0] is not state:
+            self._derived = (
+                state,
+                state.get_homeostatic_pressure(),
+                state.get_background_emotion(),
+            )
+        return self._derived
+
+    async def save(self, conn: Optional[aiosqlite.Connection] = None) -> None:
+        """Save current body state to database (in conn's transaction, if given)."""
         if self.current_state is not None:
-            body_state_id = await save_body_state(self.current_state, self.db_path)
+            body_state_id = await save_body_state(self.current_state, self.db_path, conn)
             self.current_state.id = body_state_id
 
     def to_dict(self) -> dict:
@@ -9,6 +9,7 @@ SQLite database storing:
 """
 
 from sable.database.schema import init_database, get_connection
+from sable.database.pool import get_pool, close_pools, transaction
 from sable.database.queries import (
     save_body_state,
     get_latest_body_state,
@@ -25,6 +26,9 @@ from sable.database.queries import (
 __all__ = [
     "init_database",
     "get_connection",
+    "get_pool",
+    "close_pools",
+    "transaction",
     "save_body_state",
     "get_latest_body_state",
     "save_emotion",
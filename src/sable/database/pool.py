@@ -0,0 +1,171 @@
+"""
+Connection pool for Sable's consciousness database.
+
+Opening a connection starts a worker thread, opens the file and runs the
+per-connection pragmas, and closing it throws away SQLite's page cache.
+For the small queries in queries.py that is most of the cost, so they
+borrow long-lived connections from a per-database pool instead.
+
+Pooled connections keep their (non-daemon) worker threads alive, and the
+process can't exit while they are open. Idle connections are closed
+when asyncio.run() finishes: it cancels the tasks still pending, and each
+pool keeps one waiting for that. Code that drives its event loop some
+other way must call close_pools() before the process exits.
+
+Writes in queries.py commit on their own unless they are given the
+connection of a transaction(), which commits them together.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional
+
+import aiosqlite
+
+from sable.database.schema import DEFAULT_DB_PATH, get_connection
+
+
+class ConnectionPool:
+    """
+    Pool of open connections to one database file.
+
+    Each connection is used by one caller at a time; callers that need a
+    connection while all are in use get a new one, and at most max_idle
+    are kept open once returned.
+    """
+
+    def __init__(self, db_path: Path, max_idle: int = 4):
+        """
+        Initialize an empty pool.
+
+        Args:
+            db_path: Path to database file
+            max_idle: Most connections kept open while unused
+        """
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._idle: List[aiosqlite.Connection] = []
+        self._closer: Optional[asyncio.Task] = None
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[aiosqlite.Connection]:
+        """
+        Borrow a connection for the duration of the block.
+
+        Writes the block didn't commit are rolled back when it is returned,
+        as they would be by closing it. A connection whose block raised is
+        closed rather than reused.
+
+        Yields:
+            Open connection
+        """
+        conn = self._idle.pop() if self._idle else await get_connection(self.db_path)
+
+        try:
+            yield conn
+        except BaseException:
+            await conn.close()
+            raise
+
+        if conn.in_transaction:
+            await conn.rollback()
+
+        if len(self._idle) < self.max_idle:
+            self._idle.append(conn)
+            self._close_with_loop()
+        else:
+            await conn.close()
+
+    async def close(self) -> None:
+        """Close all unused connections."""
+        closer, self._closer = self._closer, None
+        if closer is not None and closer is not asyncio.current_task():
+            closer.cancel()
+
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await conn.close()
+
+    def _close_with_loop(self) -> None:
+        """Make sure the running event loop closes the idle connections when it stops."""
+        if self._closer is None or self._closer.done():
+            self._closer = asyncio.get_running_loop().create_task(self._close_when_cancelled())
+
+    async def _close_when_cancelled(self) -> None:
+        """Wait to be cancelled, as asyncio.run() does to leftover tasks, then close."""
+        try:
+            await asyncio.get_running_loop().create_future()
+        finally:
+            await self.close()
+
+
+# Pools by database path
+_pools: Dict[Path, ConnectionPool] = {}
+
+
+def get_pool(db_path: Optional[Path] = None) -> ConnectionPool:
+    """
+    Get the connection pool for a database, creating it on first use.
+
+    Args:
+        db_path: Path to database file (default: ~/.sable/consciousness.db)
+
+    Returns:
+        ConnectionPool for the database
+    """
+    if db_path is None:
+        db_path = DEFAULT_DB_PATH
+
+    pool = _pools.get(db_path)
+    if pool is None:
+        pool = _pools[db_path] = ConnectionPool(db_path)
+    return pool
+
+
+async def close_pool(db_path: Optional[Path] = None) -> None:
+    """
+    Close and forget the connection pool for a database, if there is one.
+
+    Args:
+        db_path: Path to database file (default: ~/.sable/consciousness.db)
+    """
+    pool = _pools.pop(db_path or DEFAULT_DB_PATH, None)
+    if pool is not None:
+        await pool.close()
+
+
+async def close_pools() -> None:
+    """Close every connection pool (call before the process exits)."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for pool in pools:
+        await pool.close()
+
+
+@asynccontextmanager
+async def transaction(db_path: Optional[Path] = None) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Run several writes as one transaction, with a single commit.
+
+    Pass the connection as conn to the save/update queries; they then
+    write in the transaction instead of committing. The write lock is
+    taken up front, so other writers wait instead of failing mid-way.
+    Every write in the block must use this connection: one that borrows
+    another would wait on the lock held here.
+
+    Args:
+        db_path: Path to database file (default: ~/.sable/consciousness.db)
+
+    Yields:
+        Connection in an open transaction, committed when the block ends
+        and rolled back if it raises
+    """
+    async with get_pool(db_path).connection() as conn:
+        await conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            await conn.rollback()
+            raise
+        await conn.commit()
@@ -5,62 +5,135 @@ CRUD operations for all consciousness components.
 """
 
 import aiosqlite
-import json
+import orjson
 from datetime import datetime
-from typing import List, Optional, Dict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Dict, Set, Tuple
 from pathlib import Path
 
 from sable.models.body_state import BodyState
-from sable.models.emotion import Emotion, EmotionType, Feeling
+from sable.models.emotion import Emotion, Feeling
 from sable.models.memory import Event, Memory, SomaticMarker
-from sable.database.schema import get_connection
+from sable.database.pool import get_pool
+from sable.database.schema import datetime_to_ms, ms_to_datetime
 
 
-# Body State Operations
+@asynccontextmanager
+async def _writing(
+    db_path: Optional[Path],
+    conn: Optional[aiosqlite.Connection]
+) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Get the connection for a write.
 
-async def save_body_state(body_state: BodyState, db_path: Optional[Path] = None) -> int:
-    """Save body state to database. Returns the ID."""
-    conn = await get_connection(db_path)
+    Writes given the connection of an open transaction() go in that
+    transaction, which commits them; otherwise they borrow a pooled
+    connection and are committed at the end of the block.
+    """
+    if conn is not None:
+        yield conn
+        return
 
-    try:
-        cursor = await conn.execute(
-            """
-            INSERT INTO body_states (
-                timestamp, energy, stress, arousal, valence,
-                temperature, tension, fatigue, pain, hunger, heart_rate
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                body_state.timestamp.isoformat(),
-                body_state.energy,
-                body_state.stress,
-                body_state.arousal,
-                body_state.valence,
-                body_state.temperature,
-                body_state.tension,
-                body_state.fatigue,
-                body_state.pain,
-                body_state.hunger,
-                body_state.heart_rate,
-            )
-        )
+    async with get_pool(db_path).connection() as conn:
+        yield conn
         await conn.commit()
+
+
+async def _inserted_ids(conn, count: int) -> List[int]:
+    """
+    Get the IDs of the rows inserted by the last executemany() on conn.
+
+    The inserts hold the write lock for the whole transaction, so their
+    AUTOINCREMENT IDs are consecutive, ending at last_insert_rowid().
+    """
+    cursor = await conn.execute("SELECT last_insert_rowid()")
+    (last_id,) = await cursor.fetchone()
+    return list(range(last_id - count + 1, last_id + 1))
+
+
+# Rows per bulk UPDATE statement; each takes two parameters per column
+# plus one, and SQLite builds before 3.32 allow only 999 per statement
+_BULK_UPDATE_ROWS = 100
+
+
+@lru_cache(maxsize=32)
+def _bulk_update_sql(table: str, columns: Tuple[str, ...], count: int) -> str:
+    """Build an UPDATE that sets columns of `count` rows, picked by ID, in one statement."""
+    arms = " ".join(["WHEN ? THEN ?"] * count)
+    assignments = ", ".join(f"{column} = CASE id {arms} END" for column in columns)
+    return f"UPDATE {table} SET {assignments} WHERE id IN ({', '.join('?' * count)})"
+
+
+async def _bulk_update(conn, table: str, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+    """
+    Update rows with one statement per _BULK_UPDATE_ROWS.
+
+    Args:
+        conn: Connection to run the updates on (not committed)
+        table: Table to update
+        columns: Columns to set
+        rows: (value for each column..., id) for each row
+    """
+    for start in range(0, len(rows), _BULK_UPDATE_ROWS):
+        chunk = rows[start:start + _BULK_UPDATE_ROWS]
+
+        params = []
+        for i in range(len(columns)):
+            for row in chunk:
+                params += (row[-1], row[i])
+        params.extend(row[-1] for row in chunk)
+
+        await conn.execute(_bulk_update_sql(table, columns, len(chunk)), params)
+
+
+# Body State Operations
+
+_INSERT_BODY_STATE = """
+    INSERT INTO body_states (
+        timestamp, energy, stress, arousal, valence,
+        temperature, tension, fatigue, pain, hunger, heart_rate
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _body_state_insert_row(body_state: BodyState) -> tuple:
+    """Get the _INSERT_BODY_STATE parameters for a body state."""
+    return (
+        datetime_to_ms(body_state.timestamp),
+        body_state.energy,
+        body_state.stress,
+        body_state.arousal,
+        body_state.valence,
+        body_state.temperature,
+        body_state.tension,
+        body_state.fatigue,
+        body_state.pain,
+        body_state.hunger,
+        body_state.heart_rate,
+    )
+
+
+async def save_body_state(
+    body_state: BodyState,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> int:
+    """Save body state to database. Returns the ID."""
+    async with _writing(db_path, conn) as conn:
+        cursor = await conn.execute(_INSERT_BODY_STATE, _body_state_insert_row(body_state))
         return cursor.lastrowid
-    finally:
-        await conn.close()
 
 
 async def get_latest_body_state(db_path: Optional[Path] = None) -> Optional[BodyState]:
     """Get the most recent body state."""
-    conn = await get_connection(db_path)
-
-    try:
+    async with get_pool(db_path).connection() as conn:
         cursor = await conn.execute(
             """
             SELECT id, timestamp, energy, stress, arousal, valence,
                    temperature, tension, fatigue, pain, hunger, heart_rate
             FROM body_states
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, id DESC
             LIMIT 1
             """
         )
@@ -69,173 +142,263 @@ async def get_latest_body_state(db_path: Optional[Path] = None) -> Optional[Body
         if row is None:
             return None
 
-        return BodyState(
-            id=row[0],
-            timestamp=datetime.fromisoformat(row[1]),
-            energy=row[2],
-            stress=row[3],
-            arousal=row[4],
-            valence=row[5],
-            temperature=row[6],
-            tension=row[7],
-            fatigue=row[8],
-            pain=row[9],
-            hunger=row[10],
-            heart_rate=row[11],
-        )
-    finally:
-        await conn.close()
+        return _body_state_from_row(row)
+
+
+def _body_state_from_row(row) -> BodyState:
+    """Build a BodyState from a row of the columns queried for it."""
+    (body_state_id, timestamp, energy, stress, arousal, valence, temperature,
+     tension, fatigue, pain, hunger, heart_rate) = row
+    return BodyState(
+        id=body_state_id,
+        timestamp=ms_to_datetime(timestamp),
+        energy=energy,
+        stress=stress,
+        arousal=arousal,
+        valence=valence,
+        temperature=temperature,
+        tension=tension,
+        fatigue=fatigue,
+        pain=pain,
+        hunger=hunger,
+        heart_rate=heart_rate,
+    )
 
 
 # Emotion Operations
 
-async def save_emotion(emotion: Emotion, db_path: Optional[Path] = None) -> int:
-    """Save emotion to database. Returns the ID."""
-    conn = await get_connection(db_path)
+# Statement text shared by the single and bulk variants, so repeated
+# executions on a connection hit sqlite3's prepared-statement cache
+_INSERT_EMOTION = """
+    INSERT INTO emotions (
+        type, intensity, valence, arousal, timestamp, cause, body_signature, decayed
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-    try:
-        cursor = await conn.execute(
-            """
-            INSERT INTO emotions (
-                type, intensity, valence, arousal, timestamp, cause, body_signature, decayed
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                emotion.type.value,
-                emotion.intensity,
-                emotion.valence,
-                emotion.arousal,
-                emotion.timestamp.isoformat(),
-                emotion.cause,
-                json.dumps(emotion.body_signature),
-                1 if emotion.decayed else 0,
-            )
-        )
-        await conn.commit()
+_UPDATE_EMOTION = """
+    UPDATE emotions
+    SET intensity = ?, timestamp = ?, decayed = ?
+    WHERE id = ?
+"""
+
+# The columns _UPDATE_EMOTION sets, for bulk updates
+_EMOTION_UPDATE_COLUMNS = ("intensity", "timestamp", "decayed")
+
+
+def _emotion_insert_row(emotion: Emotion) -> tuple:
+    """Get the _INSERT_EMOTION parameters for an emotion."""
+    return (
+        emotion.type.value,
+        emotion.intensity,
+        emotion.valence,
+        emotion.arousal,
+        datetime_to_ms(emotion.timestamp),
+        emotion.cause,
+        orjson.dumps(emotion.body_signature).decode(),
+        1 if emotion.decayed else 0,
+    )
+
+
+def _emotion_update_row(emotion: Emotion) -> tuple:
+    """Get the _UPDATE_EMOTION parameters for an emotion."""
+    return (
+        emotion.intensity,
+        datetime_to_ms(emotion.timestamp),
+        1 if emotion.decayed else 0,
+        emotion.id,
+    )
+
+
+async def save_emotion(
+    emotion: Emotion,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> int:
+    """Save emotion to database. Returns the ID."""
+    async with _writing(db_path, conn) as conn:
+        cursor = await conn.execute(_INSERT_EMOTION, _emotion_insert_row(emotion))
         return cursor.lastrowid
-    finally:
-        await conn.close()
+
+
+async def save_emotions(
+    emotions: List[Emotion],
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> List[int]:
+    """Save several emotions in one transaction. Returns their IDs, in order."""
+    if not emotions:
+        return []
+
+    async with _writing(db_path, conn) as conn:
+        await conn.executemany(_INSERT_EMOTION, map(_emotion_insert_row, emotions))
+        emotion_ids = await _inserted_ids(conn, len(emotions))
+        return emotion_ids
 
 
 async def get_active_emotions(db_path: Optional[Path] = None) -> List[Emotion]:
     """Get all active (not decayed) emotions."""
-    conn = await get_connection(db_path)
-
-    try:
+    async with get_pool(db_path).connection() as conn:
         cursor = await conn.execute(
             """
             SELECT id, type, intensity, valence, arousal, timestamp, cause, body_signature, decayed
             FROM emotions
             WHERE decayed = 0
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, id DESC
             """
         )
         rows = await cursor.fetchall()
 
-        emotions = []
-        for row in rows:
-            emotions.append(Emotion(
-                id=row[0],
-                type=EmotionType(row[1]),
-                intensity=row[2],
-                valence=row[3],
-                arousal=row[4],
-                timestamp=datetime.fromisoformat(row[5]),
-                cause=row[6],
-                body_signature=json.loads(row[7]) if row[7] else {},
-                decayed=bool(row[8]),
-            ))
-
-        return emotions
-    finally:
-        await conn.close()
-
-
-async def update_emotion(emotion: Emotion, db_path: Optional[Path] = None) -> None:
+        return [_emotion_from_row(row) for row in rows]
+
+
+def _emotion_from_row(row) -> Emotion:
+    """
+    Build an Emotion from a row of the columns queried for it.
+
+    The type and decayed columns are left for validation to convert,
+    which it does faster than an EmotionType() and bool() call here.
+    """
+    (emotion_id, emotion_type, intensity, valence, arousal, timestamp, cause,
+     body_signature, decayed) = row
+    return Emotion(
+        id=emotion_id,
+        type=emotion_type,
+        intensity=intensity,
+        valence=valence,
+        arousal=arousal,
+        timestamp=ms_to_datetime(timestamp),
+        cause=cause,
+        body_signature=orjson.loads(body_signature) if body_signature else {},
+        decayed=decayed,
+    )
+
+
+async def update_emotion(
+    emotion: Emotion,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> None:
     """Update an existing emotion (e.g., after decay)."""
-    conn = await get_connection(db_path)
+    async with _writing(db_path, conn) as conn:
+        await conn.execute(_UPDATE_EMOTION, _emotion_update_row(emotion))
 
-    try:
-        await conn.execute(
-            """
-            UPDATE emotions
-            SET intensity = ?, timestamp = ?, decayed = ?
-            WHERE id = ?
-            """,
-            (
-                emotion.intensity,
-                emotion.timestamp.isoformat(),
-                1 if emotion.decayed else 0,
-                emotion.id,
-            )
+
+async def update_emotions(
+    emotions: List[Emotion],
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> None:
+    """Update several existing emotions (e.g., after decay) in one statement per 100."""
+    async with _writing(db_path, conn) as conn:
+        await _bulk_update(
+            conn, "emotions", _EMOTION_UPDATE_COLUMNS, list(map(_emotion_update_row, emotions))
         )
-        await conn.commit()
-    finally:
-        await conn.close()
 
 
 # Feeling Operations
 
-async def save_feeling(feeling: Feeling, db_path: Optional[Path] = None) -> int:
-    """Save feeling to database. Returns the ID."""
-    conn = await get_connection(db_path)
+_INSERT_FEELING = """
+    INSERT INTO feelings (
+        emotion_id, awareness_level, verbalized, description, timestamp
+    ) VALUES (?, ?, ?, ?, ?)
+"""
 
-    try:
-        cursor = await conn.execute(
-            """
-            INSERT INTO feelings (
-                emotion_id, awareness_level, verbalized, description, timestamp
-            ) VALUES (?, ?, ?, ?, ?)
-            """,
-            (
-                feeling.emotion.id,
-                feeling.awareness_level,
-                1 if feeling.verbalized else 0,
-                feeling.description or feeling.verbalize(),
-                feeling.timestamp.isoformat(),
-            )
-        )
-        await conn.commit()
+
+def _feeling_insert_row(feeling: Feeling) -> tuple:
+    """Get the _INSERT_FEELING parameters for a feeling."""
+    return (
+        feeling.emotion.id,
+        feeling.awareness_level,
+        1 if feeling.verbalized else 0,
+        feeling.description or feeling.verbalize(),
+        datetime_to_ms(feeling.timestamp),
+    )
+
+
+async def save_feeling(
+    feeling: Feeling,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> int:
+    """Save feeling to database. Returns the ID."""
+    async with _writing(db_path, conn) as conn:
+        cursor = await conn.execute(_INSERT_FEELING, _feeling_insert_row(feeling))
         return cursor.lastrowid
-    finally:
-        await conn.close()
+
+
+async def save_feelings(
+    feelings: List[Feeling],
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> List[int]:
+    """Save several feelings in one transaction. Returns their IDs, in order."""
+    if not feelings:
+        return []
+
+    async with _writing(db_path, conn) as conn:
+        await conn.executemany(_INSERT_FEELING, map(_feeling_insert_row, feelings))
+        feeling_ids = await _inserted_ids(conn, len(feelings))
+        return feeling_ids
+
+
+async def save_emotion_with_feeling(
+    feeling: Feeling,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> Tuple[int, int]:
+    """
+    Save a new emotion and the feeling of it in one transaction.
+
+    Sets feeling.emotion.id before the feeling row is written.
+
+    Returns:
+        (emotion ID, feeling ID)
+    """
+    async with _writing(db_path, conn) as conn:
+        cursor = await conn.execute(_INSERT_EMOTION, _emotion_insert_row(feeling.emotion))
+        feeling.emotion.id = cursor.lastrowid
+
+        cursor = await conn.execute(_INSERT_FEELING, _feeling_insert_row(feeling))
+        return feeling.emotion.id, cursor.lastrowid
 
 
 # Event Operations
 
-async def save_event(event: Event, db_path: Optional[Path] = None) -> int:
-    """Save event to database. Returns the ID."""
-    conn = await get_connection(db_path)
+_INSERT_EVENT = """
+    INSERT INTO events (description, context, timestamp, emotional_impact)
+    VALUES (?, ?, ?, ?)
+"""
 
-    try:
-        cursor = await conn.execute(
-            """
-            INSERT INTO events (description, context, timestamp, emotional_impact)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                event.description,
-                event.context,
-                event.timestamp.isoformat(),
-                json.dumps(event.emotional_impact),
-            )
-        )
-        await conn.commit()
+
+def _event_insert_row(event: Event) -> tuple:
+    """Get the _INSERT_EVENT parameters for an event."""
+    return (
+        event.description,
+        event.context,
+        datetime_to_ms(event.timestamp),
+        orjson.dumps(event.emotional_impact).decode(),
+    )
+
+
+async def save_event(
+    event: Event,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> int:
+    """Save event to database. Returns the ID."""
+    async with _writing(db_path, conn) as conn:
+        cursor = await conn.execute(_INSERT_EVENT, _event_insert_row(event))
         event_id = cursor.lastrowid
 
         # Update event object with ID
         event.id = event_id
 
         return event_id
-    finally:
-        await conn.close()
 
 
 async def get_event(event_id: int, db_path: Optional[Path] = None) -> Optional[Event]:
     """Get event by ID."""
-    conn = await get_connection(db_path)
-
-    try:
+    async with get_pool(db_path).connection() as conn:
         cursor = await conn.execute(
             """
             SELECT id, description, context, timestamp, emotional_impact
@@ -249,54 +412,134 @@ async def get_event(event_id: int, db_path: Optional[Path] = None) -> Optional[E
         if row is None:
             return None
 
-        return Event(
-            id=row[0],
-            description=row[1],
-            context=row[2],
-            timestamp=datetime.fromisoformat(row[3]),
-            emotional_impact=json.loads(row[4]) if row[4] else {},
-        )
-    finally:
-        await conn.close()
+        return _event_from_row(row)
+
+
+def _event_from_row(row) -> Event:
+    """Build an Event from a row of the columns queried for it."""
+    event_id, description, context, timestamp, emotional_impact = row
+    return Event(
+        id=event_id,
+        description=description,
+        context=context,
+        timestamp=ms_to_datetime(timestamp),
+        emotional_impact=orjson.loads(emotional_impact) if emotional_impact else {},
+    )
 
 
 # Memory Operations
 
-async def save_memory(memory: Memory, db_path: Optional[Path] = None) -> int:
-    """Save memory to database. Returns the ID."""
-    # First ensure the event is saved
-    if memory.event.id is None:
-        event_id = await save_event(memory.event, db_path)
-        memory.event.id = event_id
+_INSERT_MEMORY = """
+    INSERT INTO memories (
+        event_id, emotional_salience, access_count, last_accessed,
+        consolidation_level, narrative_role, associated_emotions,
+        identity_relevance, logbook_path, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-    conn = await get_connection(db_path)
 
-    try:
-        cursor = await conn.execute(
-            """
-            INSERT INTO memories (
-                event_id, emotional_salience, access_count, last_accessed,
-                consolidation_level, narrative_role, associated_emotions,
-                identity_relevance, logbook_path, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                memory.event.id,
-                memory.emotional_salience,
-                memory.access_count,
-                memory.last_accessed.isoformat() if memory.last_accessed else None,
-                memory.consolidation_level,
-                memory.narrative_role,
-                ",".join(memory.associated_emotions),
-                memory.identity_relevance,
-                memory.logbook_path,
-                memory.created_at.isoformat(),
+_INSERT_MEMORY_EMOTION = """
+    INSERT OR IGNORE INTO memory_emotions (memory_id, label) VALUES (?, ?)
+"""
+
+
+def _memory_insert_row(memory: Memory) -> tuple:
+    """Get the _INSERT_MEMORY parameters for a memory (its event must be saved)."""
+    return (
+        memory.event.id,
+        memory.emotional_salience,
+        memory.access_count,
+        datetime_to_ms(memory.last_accessed) if memory.last_accessed else None,
+        memory.consolidation_level,
+        memory.narrative_role,
+        ",".join(memory.associated_emotions),
+        memory.identity_relevance,
+        memory.logbook_path,
+        datetime_to_ms(memory.created_at),
+    )
+
+
+# Memory columns (m) followed by their event's columns (e), as read by
+# _memory_from_row
+_MEMORY_COLUMNS = """m.id, m.event_id, m.emotional_salience, m.access_count, m.last_accessed,
+                   m.consolidation_level, m.narrative_role, m.associated_emotions,
+                   m.identity_relevance, m.logbook_path, m.created_at,
+                   e.description, e.context, e.timestamp, e.emotional_impact"""
+
+
+def _memory_from_row(row) -> Memory:
+    """Build a Memory, with its Event, from a row of _MEMORY_COLUMNS."""
+    (memory_id, event_id, emotional_salience, access_count, last_accessed,
+     consolidation_level, narrative_role, associated_emotions,
+     identity_relevance, logbook_path, created_at) = row[:11]
+    return Memory(
+        id=memory_id,
+        event=_event_from_row((event_id, *row[11:])),
+        emotional_salience=emotional_salience,
+        access_count=access_count,
+        last_accessed=ms_to_datetime(last_accessed) if last_accessed else None,
+        consolidation_level=consolidation_level,
+        narrative_role=narrative_role,
+        associated_emotions=associated_emotions.split(",") if associated_emotions else [],
+        identity_relevance=identity_relevance,
+        logbook_path=logbook_path,
+        created_at=ms_to_datetime(created_at),
+    )
+
+
+async def save_memory(
+    memory: Memory,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> int:
+    """Save memory (and its event, if not yet saved) to database. Returns the ID."""
+    events = [memory.event] if memory.event.id is None else []
+    memory_ids = await save_events_and_memories(events, [memory], db_path, conn)
+    return memory_ids[0]
+
+
+async def save_events_and_memories(
+    events: List[Event],
+    memories: List[Memory],
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> List[int]:
+    """
+    Save events and memories of them in one transaction.
+
+    Events are written first, and their IDs set, so memories may refer to
+    events from the same batch.
+
+    Args:
+        events: New events to save
+        memories: New memories to save (each memory's event must be saved
+            already or be in events)
+        db_path: Path to database
+        conn: Connection of an open transaction() to write in, instead
+            of committing on a pooled connection
+
+    Returns:
+        Memory IDs, in order
+    """
+    async with _writing(db_path, conn) as conn:
+        if events:
+            await conn.executemany(_INSERT_EVENT, map(_event_insert_row, events))
+            for event, event_id in zip(events, await _inserted_ids(conn, len(events))):
+                event.id = event_id
+
+        memory_ids = []
+        if memories:
+            await conn.executemany(_INSERT_MEMORY, map(_memory_insert_row, memories))
+            memory_ids = await _inserted_ids(conn, len(memories))
+            for memory, memory_id in zip(memories, memory_ids):
+                memory.id = memory_id
+
+            await conn.executemany(
+                _INSERT_MEMORY_EMOTION,
+                [(memory.id, label) for memory in memories for label in memory.associated_emotions]
             )
-        )
-        await conn.commit()
-        return cursor.lastrowid
-    finally:
-        await conn.close()
+
+        return memory_ids
 
 
 async def query_memories(
@@ -304,7 +547,9 @@ async def query_memories(
     min_identity_relevance: float = 0.0,
     limit: int = 50,
     db_path: Optional[Path] = None,
-    sort_by: str = "salience"  # "salience", "recency", "access_count"
+    sort_by: str = "salience",  # "salience", "recency", "access_count"
+    emotion_type: Optional[str] = None,
+    memory_ids: Optional[List[int]] = None
 ) -> List[Memory]:
     """
     Query memories by salience and relevance.
@@ -315,57 +560,45 @@ async def query_memories(
         limit: Maximum number of memories to return
         db_path: Database path
         sort_by: Sort order - "salience" (default), "recency", or "access_count"
+        emotion_type: Only memories associated with this emotion (optional)
+        memory_ids: Only memories with these IDs (optional)
 
     Returns:
         List of matching memories
     """
-    conn = await get_connection(db_path)
-
     # Determine sort clause
     if sort_by == "recency":
-        order_clause = "m.created_at DESC"
+        order_clause = "m.created_at DESC, m.id DESC"
     elif sort_by == "access_count":
         order_clause = "m.access_count DESC, m.emotional_salience DESC"
     else:  # salience (default)
         order_clause = "m.emotional_salience DESC, m.consolidation_level DESC"
 
-    try:
+    where_clause = "m.emotional_salience >= ? AND m.identity_relevance >= ?"
+    params = [min_salience, min_identity_relevance]
+    if emotion_type:
+        where_clause += " AND m.id IN (SELECT memory_id FROM memory_emotions WHERE label = ?)"
+        params.append(emotion_type)
+    if memory_ids is not None:
+        where_clause += f" AND m.id IN ({','.join('?' * len(memory_ids))})"
+        params.extend(memory_ids)
+    params.append(limit)
+
+    async with get_pool(db_path).connection() as conn:
         cursor = await conn.execute(
             f"""
-            SELECT m.id, m.event_id, m.emotional_salience, m.access_count, m.last_accessed,
-                   m.consolidation_level, m.narrative_role, m.associated_emotions,
-                   m.identity_relevance, m.logbook_path, m.created_at
+            SELECT {_MEMORY_COLUMNS}
             FROM memories m
-            WHERE m.emotional_salience >= ? AND m.identity_relevance >= ?
+            JOIN events e ON m.event_id = e.id
+            WHERE {where_clause}
             ORDER BY {order_clause}
             LIMIT ?
             """,
-            (min_salience, min_identity_relevance, limit)
+            params
         )
         rows = await cursor.fetchall()
 
-        memories = []
-        for row in rows:
-            # Fetch associated event
-            event = await get_event(row[1], db_path)
-            if event:
-                memories.append(Memory(
-                    id=row[0],
-                    event=event,
-                    emotional_salience=row[2],
-                    access_count=row[3],
-                    last_accessed=datetime.fromisoformat(row[4]) if row[4] else None,
-                    consolidation_level=row[5],
-                    narrative_role=row[6],
-                    associated_emotions=row[7].split(",") if row[7] else [],
-                    identity_relevance=row[8],
-                    logbook_path=row[9],
-                    created_at=datetime.fromisoformat(row[10]),
-                ))
-
-        return memories
-    finally:
-        await conn.close()
+        return [_memory_from_row(row) for row in rows]
 
 
 async def get_contextual_memories(
@@ -401,19 +634,17 @@ async def get_contextual_memories(
     """
     from datetime import timedelta
 
-    conn = await get_connection(db_path)
-    cutoff_date = (datetime.now() - timedelta(days=days_for_recent)).isoformat()
+    cutoff_date = datetime_to_ms(datetime.now() - timedelta(days=days_for_recent))
 
-    try:
+    async with get_pool(db_path).connection() as conn:
         # Get recent memories
         cursor = await conn.execute(
-            """
-            SELECT m.id, m.event_id, m.emotional_salience, m.access_count, m.last_accessed,
-                   m.consolidation_level, m.narrative_role, m.associated_emotions,
-                   m.identity_relevance, m.logbook_path, m.created_at
+            f"""
+            SELECT {_MEMORY_COLUMNS}
             FROM memories m
+            JOIN events e ON m.event_id = e.id
             WHERE m.created_at >= ?
-            ORDER BY m.created_at DESC
+            ORDER BY m.created_at DESC, m.id DESC
             LIMIT ?
             """,
             (cutoff_date, recent_count)
@@ -422,11 +653,10 @@ async def get_contextual_memories(
 
         # Get most salient memories
         cursor = await conn.execute(
-            """
-            SELECT m.id, m.event_id, m.emotional_salience, m.access_count, m.last_accessed,
-                   m.consolidation_level, m.narrative_role, m.associated_emotions,
-                   m.identity_relevance, m.logbook_path, m.created_at
+            f"""
+            SELECT {_MEMORY_COLUMNS}
             FROM memories m
+            JOIN events e ON m.event_id = e.id
             WHERE m.emotional_salience >= ?
             ORDER BY m.emotional_salience DESC, m.consolidation_level DESC
             LIMIT ?
@@ -435,39 +665,14 @@ async def get_contextual_memories(
         )
         salient_rows = await cursor.fetchall()
 
-        # Helper to build Memory from row
-        async def build_memory(row) -> Optional[Memory]:
-            event = await get_event(row[1], db_path)
-            if event:
-                return Memory(
-                    id=row[0],
-                    event=event,
-                    emotional_salience=row[2],
-                    access_count=row[3],
-                    last_accessed=datetime.fromisoformat(row[4]) if row[4] else None,
-                    consolidation_level=row[5],
-                    narrative_role=row[6],
-                    associated_emotions=row[7].split(",") if row[7] else [],
-                    identity_relevance=row[8],
-                    logbook_path=row[9],
-                    created_at=datetime.fromisoformat(row[10]),
-                )
-            return None
-
         # Build memory objects
-        recent_memories = []
-        for row in recent_rows:
-            mem = await build_memory(row)
-            if mem:
-                recent_memories.append(mem)
+        recent_memories = [_memory_from_row(row) for row in recent_rows]
 
-        salient_memories = []
+        # Skip salient memories already in recent (de-duplicate)
         recent_ids = {m.id for m in recent_memories}
-        for row in salient_rows:
-            mem = await build_memory(row)
-            # Skip if already in recent (de-duplicate)
-            if mem and mem.id not in recent_ids:
-                salient_memories.append(mem)
+        salient_memories = [
+            _memory_from_row(row) for row in salient_rows if row[0] not in recent_ids
+        ]
 
         # Enforce max_total limit
         total_count = len(recent_memories) + len(salient_memories)
@@ -485,9 +690,6 @@ async def get_contextual_memories(
             'salient': salient_memories
         }
 
-    finally:
-        await conn.close()
-
 
 async def search_memories_by_description(
     keywords: str,
@@ -507,15 +709,11 @@ async def search_memories_by_description(
     Returns:
         List of matching memories
     """
-    conn = await get_connection(db_path)
-
-    try:
+    async with get_pool(db_path).connection() as conn:
         # Use LIKE for simple keyword search
         cursor = await conn.execute(
-            """
-            SELECT m.id, m.event_id, m.emotional_salience, m.access_count, m.last_accessed,
-                   m.consolidation_level, m.narrative_role, m.associated_emotions,
-                   m.identity_relevance, m.logbook_path, m.created_at
+            f"""
+            SELECT {_MEMORY_COLUMNS}
             FROM memories m
             JOIN events e ON m.event_id = e.id
             WHERE (e.description LIKE ? OR e.context LIKE ?)
@@ -527,82 +725,136 @@ async def search_memories_by_description(
         )
         rows = await cursor.fetchall()
 
-        memories = []
-        for row in rows:
-            event = await get_event(row[1], db_path)
-            if event:
-                memories.append(Memory(
-                    id=row[0],
-                    event=event,
-                    emotional_salience=row[2],
-                    access_count=row[3],
-                    last_accessed=datetime.fromisoformat(row[4]) if row[4] else None,
-                    consolidation_level=row[5],
-                    narrative_role=row[6],
-                    associated_emotions=row[7].split(",") if row[7] else [],
-                    identity_relevance=row[8],
-                    logbook_path=row[9],
-                    created_at=datetime.fromisoformat(row[10]),
-                ))
-
-        return memories
-
-    finally:
-        await conn.close()
-
-
-async def update_memory(memory: Memory, db_path: Optional[Path] = None) -> None:
+        return [_memory_from_row(row) for row in rows]
+
+
+_UPDATE_MEMORY = """
+    UPDATE memories
+    SET access_count = ?, last_accessed = ?, consolidation_level = ?
+    WHERE id = ?
+"""
+
+# The columns _UPDATE_MEMORY sets, for bulk updates
+_MEMORY_UPDATE_COLUMNS = ("access_count", "last_accessed", "consolidation_level")
+
+
+def _memory_update_row(memory: Memory) -> tuple:
+    """Get the _UPDATE_MEMORY parameters for a memory."""
+    return (
+        memory.access_count,
+        datetime_to_ms(memory.last_accessed) if memory.last_accessed else None,
+        memory.consolidation_level,
+        memory.id,
+    )
+
+
+async def update_memory(
+    memory: Memory,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> None:
     """Update memory (e.g., after access)."""
-    conn = await get_connection(db_path)
+    async with _writing(db_path, conn) as conn:
+        await conn.execute(_UPDATE_MEMORY, _memory_update_row(memory))
 
-    try:
-        await conn.execute(
-            """
-            UPDATE memories
-            SET access_count = ?, last_accessed = ?, consolidation_level = ?
-            WHERE id = ?
-            """,
-            (
-                memory.access_count,
-                memory.last_accessed.isoformat() if memory.last_accessed else None,
-                memory.consolidation_level,
-                memory.id,
-            )
+
+async def update_memories(
+    memories: List[Memory],
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> None:
+    """Update several memories (e.g., after decay) in one statement per 100."""
+    async with _writing(db_path, conn) as conn:
+        await _bulk_update(
+            conn, "memories", _MEMORY_UPDATE_COLUMNS, list(map(_memory_update_row, memories))
         )
-        await conn.commit()
-    finally:
-        await conn.close()
+
+
+async def get_memory_emotion_index(db_path: Optional[Path] = None) -> Dict[str, Set[int]]:
+    """
+    Get the IDs of the memories associated with each emotion type.
+
+    Read from the memory_emotions index alone, so callers can narrow a
+    memory query to an emotion's IDs.
+
+    Args:
+        db_path: Database path
+
+    Returns:
+        Dict of emotion type -> IDs of memories associated with it
+    """
+    async with get_pool(db_path).connection() as conn:
+        cursor = await conn.execute("SELECT label, memory_id FROM memory_emotions")
+        index: Dict[str, Set[int]] = {}
+        for label, memory_id in await cursor.fetchall():
+            index.setdefault(label, set()).add(memory_id)
+        return index
+
+
+async def get_memory_version(db_path: Optional[Path] = None) -> Optional[int]:
+    """
+    Get the memory change counter (see memory_meta in schema.py).
+
+    Returns:
+        Counter value, or None if the database predates it
+    """
+    async with get_pool(db_path).connection() as conn:
+        try:
+            cursor = await conn.execute("SELECT v FROM memory_meta WHERE k = 'version'")
+            row = await cursor.fetchone()
+            return row[0] if row else None
+        except aiosqlite.OperationalError:
+            return None
 
 
 # Somatic Marker Operations
 
-async def save_somatic_marker(marker: SomaticMarker, db_path: Optional[Path] = None) -> int:
-    """Save somatic marker to database. Returns the ID."""
-    conn = await get_connection(db_path)
+_INSERT_SOMATIC_MARKER = """
+    INSERT INTO somatic_markers (
+        situation_pattern, emotion_type, valence, strength,
+        origin_memory_id, reinforcement_count, last_activated, created_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-    try:
-        cursor = await conn.execute(
-            """
-            INSERT INTO somatic_markers (
-                situation_pattern, emotion_type, valence, strength,
-                origin_memory_id, reinforcement_count, last_activated, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                marker.situation_pattern,
-                marker.emotion_type.value,
-                marker.valence,
-                marker.strength,
-                marker.origin_memory_id,
-                marker.reinforcement_count,
-                marker.last_activated.isoformat() if marker.last_activated else None,
-                marker.created_at.isoformat(),
-            )
-        )
-        await conn.commit()
+
+def _somatic_marker_insert_row(marker: SomaticMarker) -> tuple:
+    """Get the _INSERT_SOMATIC_MARKER parameters for a somatic marker."""
+    return (
+        marker.situation_pattern,
+        marker.emotion_type.value,
+        marker.valence,
+        marker.strength,
+        marker.origin_memory_id,
+        marker.reinforcement_count,
+        datetime_to_ms(marker.last_activated) if marker.last_activated else None,
+        datetime_to_ms(marker.created_at),
+    )
+
+
+async def save_somatic_marker(
+    marker: SomaticMarker,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> int:
+    """Save somatic marker to database. Returns the ID."""
+    async with _writing(db_path, conn) as conn:
+        cursor = await conn.execute(_INSERT_SOMATIC_MARKER, _somatic_marker_insert_row(marker))
         return cursor.lastrowid
-    finally:
-        await conn.close()
+
+
+async def save_somatic_markers(
+    markers: List[SomaticMarker],
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> List[int]:
+    """Save several somatic markers in one transaction. Returns their IDs, in order."""
+    if not markers:
+        return []
+
+    async with _writing(db_path, conn) as conn:
+        await conn.executemany(_INSERT_SOMATIC_MARKER, map(_somatic_marker_insert_row, markers))
+        marker_ids = await _inserted_ids(conn, len(markers))
+        return marker_ids
 
 
 async def get_somatic_markers(
@@ -611,9 +863,7 @@ async def get_somatic_markers(
     db_path: Optional[Path] = None
 ) -> List[SomaticMarker]:
     """Get somatic markers, optionally filtered by situation pattern."""
-    conn = await get_connection(db_path)
-
-    try:
+    async with get_pool(db_path).connection() as conn:
         if situation_pattern:
             # Search for similar patterns using LIKE
             cursor = await conn.execute(
@@ -640,30 +890,33 @@ async def get_somatic_markers(
 
         rows = await cursor.fetchall()
 
-        markers = []
-        for row in rows:
-            markers.append(SomaticMarker(
-                id=row[0],
-                situation_pattern=row[1],
-                emotion_type=EmotionType(row[2]),
-                valence=row[3],
-                strength=row[4],
-                origin_memory_id=row[5],
-                reinforcement_count=row[6],
-                last_activated=datetime.fromisoformat(row[7]) if row[7] else None,
-                created_at=datetime.fromisoformat(row[8]),
-            ))
-
-        return markers
-    finally:
-        await conn.close()
-
-
-async def update_somatic_marker(marker: SomaticMarker, db_path: Optional[Path] = None) -> None:
-    """Update somatic marker (e.g., after reinforcement)."""
-    conn = await get_connection(db_path)
+        return [_somatic_marker_from_row(row) for row in rows]
+
+
+def _somatic_marker_from_row(row) -> SomaticMarker:
+    """Build a SomaticMarker from a row of the columns queried for it."""
+    (marker_id, situation_pattern, emotion_type, valence, strength,
+     origin_memory_id, reinforcement_count, last_activated, created_at) = row
+    return SomaticMarker(
+        id=marker_id,
+        situation_pattern=situation_pattern,
+        emotion_type=emotion_type,
+        valence=valence,
+        strength=strength,
+        origin_memory_id=origin_memory_id,
+        reinforcement_count=reinforcement_count,
+        last_activated=ms_to_datetime(last_activated) if last_activated else None,
+        created_at=ms_to_datetime(created_at),
+    )
+
 
-    try:
+async def update_somatic_marker(
+    marker: SomaticMarker,
+    db_path: Optional[Path] = None,
+    conn: Optional[aiosqlite.Connection] = None
+) -> None:
+    """Update somatic marker (e.g., after reinforcement)."""
+    async with _writing(db_path, conn) as conn:
         await conn.execute(
             """
             UPDATE somatic_markers
@@ -673,10 +926,7 @@ async def update_somatic_marker(marker: SomaticMarker, db_path: Optional[Path] =
             (
                 marker.strength,
                 marker.reinforcement_count,
-                marker.last_activated.isoformat() if marker.last_activated else None,
+                datetime_to_ms(marker.last_activated) if marker.last_activated else None,
                 marker.id,
             )
         )
-        await conn.commit()
-    finally:
-        await conn.close()
@@ -1,17 +1,28 @@
 """
 Database schema for Sable's consciousness system.
 
-Seven tables implementing Damasio's three-level model:
+Seven tables implementing Damasio's three-level model, plus memory_meta
+(a change counter for cached memories):
 1. body_states - Proto-self physiological parameters
 2. emotions - Core consciousness emotion events
 3. feelings - Conscious experience of emotions
 4. events - Raw experience log
-5. memories - Autobiographical memory with emotional salience
+5. memories - Autobiographical memory with emotional salience (and
+   memory_emotions, one row per memory and associated emotion)
 6. somatic_markers - Learned emotion-situation associations
 7. decay_config - Per-emotion decay parameters
+
+Datetimes are stored as INTEGER epoch milliseconds (see TIMESTAMP_COLUMNS);
+init_database converts databases that stored ISO 8601 text.
+
+The database runs in WAL mode (see init_database), which relies on
+shared memory between connections: keep it on a local file system, not
+a network share.
 """
 
 import aiosqlite
+import re
+from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -19,6 +30,48 @@ from typing import Optional
 # Default database location
 DEFAULT_DB_PATH = Path.home() / ".sable" / "consciousness.db"
 
+# Per-connection settings, run once when a connection is opened; pooled
+# connections (see pool.py) keep them for their lifetime. WAL mode itself
+# is stored in the database file (set by init_database), and under WAL
+# synchronous=NORMAL is still safe. Lock waits use aiosqlite's default
+# 5 second busy timeout.
+CONNECTION_PRAGMAS = """
+    PRAGMA foreign_keys = ON;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA cache_size = -65536;
+    PRAGMA temp_store = MEMORY;
+"""
+
+# Datetime columns, stored as INTEGER milliseconds since the Unix epoch
+# (of the naive local datetimes the models use)
+TIMESTAMP_COLUMNS = {
+    'body_states': ('timestamp',),
+    'emotions': ('timestamp',),
+    'feelings': ('timestamp',),
+    'events': ('timestamp',),
+    'memories': ('last_accessed', 'created_at'),
+    'somatic_markers': ('last_activated', 'created_at'),
+}
+
+
+def datetime_to_ms(value: datetime) -> int:
+    """Convert a datetime to epoch milliseconds, as stored in the database."""
+    return round(value.timestamp() * 1000)
+
+
+def ms_to_datetime(value: int) -> datetime:
+    """Convert stored epoch milliseconds back to a datetime."""
+    return datetime.fromtimestamp(value / 1000)
+
+
+# Compiled statements kept per connection by the sqlite3 driver, keyed by
+# SQL text. Most query SQL is constant, so on a pooled connection each
+# statement is parsed and planned once; the variable-length IN and CASE
+# statements (query_memories, _bulk_update) take an entry per length,
+# hence more than the default 128.
+STATEMENT_CACHE_SIZE = 512
+
 
 async def get_connection(db_path: Optional[Path] = None) -> aiosqlite.Connection:
     """
@@ -36,9 +89,9 @@ async def get_connection(db_path: Optional[Path] = None) -> aiosqlite.Connection
     # Ensure directory exists
     db_path.parent.mkdir(parents=True, exist_ok=True)
 
-    conn = await aiosqlite.connect(db_path)
-    # Enable foreign keys
-    await conn.execute("PRAGMA foreign_keys = ON")
+    conn = await aiosqlite.connect(db_path, cached_statements=STATEMENT_CACHE_SIZE)
+    # Enable foreign keys and tune reads/writes, in one round trip
+    await conn.executescript(CONNECTION_PRAGMAS)
     return conn
 
 
@@ -51,14 +104,19 @@ async def init_database(db_path: Optional[Path] = None) -> None:
     Args:
         db_path: Path to database file (default: ~/.sable/consciousness.db)
     """
-    conn = await get_connection(db_path)
+    from sable.database.pool import get_pool
+
+    # Borrowed from the pool, so the queries that follow reuse this
+    # connection (and its pragmas) rather than opening another
+    async with get_pool(db_path).connection() as conn:
+        # Write-ahead logging: readers don't block the writer (persistent)
+        await conn.execute("PRAGMA journal_mode = WAL")
 
-    try:
         # Table 1: Body States (Proto-Self)
         await conn.execute("""
             CREATE TABLE IF NOT EXISTS body_states (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,  -- Epoch milliseconds
 
                 -- Core homeostatic variables
                 energy REAL NOT NULL CHECK (energy >= 0 AND energy <= 1),
@@ -84,7 +142,7 @@ async def init_database(db_path: Optional[Path] = None) -> None:
                 intensity REAL NOT NULL CHECK (intensity >= 0 AND intensity <= 1),
                 valence REAL NOT NULL CHECK (valence >= -1 AND valence <= 1),
                 arousal REAL NOT NULL CHECK (arousal >= 0 AND arousal <= 1),
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,  -- Epoch milliseconds
                 cause TEXT NOT NULL,
                 body_signature TEXT,  -- JSON string
                 decayed INTEGER NOT NULL DEFAULT 0  -- Boolean: 0 = active, 1 = decayed
@@ -99,7 +157,7 @@ async def init_database(db_path: Optional[Path] = None) -> None:
                 awareness_level REAL NOT NULL CHECK (awareness_level >= 0 AND awareness_level <= 1),
                 verbalized INTEGER NOT NULL DEFAULT 0,  -- Boolean
                 description TEXT,
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,  -- Epoch milliseconds
 
                 FOREIGN KEY (emotion_id) REFERENCES emotions(id)
             )
@@ -111,7 +169,7 @@ async def init_database(db_path: Optional[Path] = None) -> None:
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 description TEXT NOT NULL,
                 context TEXT,
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,  -- Epoch milliseconds
                 emotional_impact TEXT  -- JSON string: {emotion_type: intensity}
             )
         """)
@@ -123,12 +181,13 @@ async def init_database(db_path: Optional[Path] = None) -> None:
                 event_id INTEGER NOT NULL,
                 emotional_salience REAL NOT NULL CHECK (emotional_salience >= 0 AND emotional_salience <= 1),
                 access_count INTEGER NOT NULL DEFAULT 0,
-                last_accessed TEXT,
+                last_accessed INTEGER,  -- Epoch milliseconds
                 consolidation_level REAL NOT NULL DEFAULT 0.5 CHECK (consolidation_level >= 0 AND consolidation_level <= 1),
                 narrative_role TEXT,
-                associated_emotions TEXT,  -- Comma-separated emotion types
+                -- Comma-separated emotion types, in order (indexed in memory_emotions)
+                associated_emotions TEXT,
                 identity_relevance REAL NOT NULL DEFAULT 0.5 CHECK (identity_relevance >= 0 AND identity_relevance <= 1),
-                created_at TEXT NOT NULL,
+                created_at INTEGER NOT NULL,  -- Epoch milliseconds
                 logbook_path TEXT,  -- Optional path to extended logbook entry (e.g., "logbook/2025-11-04_213000_example.md")
 
                 FOREIGN KEY (event_id) REFERENCES events(id)
@@ -145,8 +204,8 @@ async def init_database(db_path: Optional[Path] = None) -> None:
                 strength REAL NOT NULL CHECK (strength >= 0 AND strength <= 1),
                 origin_memory_id INTEGER,
                 reinforcement_count INTEGER NOT NULL DEFAULT 1,
-                last_activated TEXT,
-                created_at TEXT NOT NULL,
+                last_activated INTEGER,  -- Epoch milliseconds
+                created_at INTEGER NOT NULL,  -- Epoch milliseconds
 
                 FOREIGN KEY (origin_memory_id) REFERENCES memories(id)
             )
@@ -163,20 +222,62 @@ async def init_database(db_path: Optional[Path] = None) -> None:
             )
         """)
 
-        # Create indices for common queries
+        # Memory change counter, bumped by triggers on every write that
+        # can change a loaded memory (so callers can tell whether cached
+        # memories are still current). Starts at a random value so a
+        # recreated database never matches a cache of the old one.
+        await conn.execute("""
+            CREATE TABLE IF NOT EXISTS memory_meta (
+                k TEXT PRIMARY KEY,
+                v INTEGER NOT NULL
+            )
+        """)
+
+        await conn.execute("""
+            INSERT OR IGNORE INTO memory_meta (k, v)
+            VALUES ('version', abs(random() % 1000000000000))
+        """)
+        await conn.commit()
+
+        # Tables from before datetimes were stored as epoch milliseconds
+        # (before the triggers and indices below, which a rebuilt table
+        # needs recreated)
+        await _migrate_timestamps(conn)
+
+        # Memory emotions, one row each, for indexed membership queries
+        await _create_memory_emotions(conn)
+
+        for table, operation in (
+            ("memories", "INSERT"),
+            ("memories", "UPDATE"),
+            ("memories", "DELETE"),
+            ("events", "UPDATE"),
+            ("events", "DELETE"),
+        ):
+            await conn.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{operation.lower()}_version
+                AFTER {operation} ON {table}
+                BEGIN
+                    UPDATE memory_meta SET v = v + 1 WHERE k = 'version';
+                END
+            """)
+
+        # Create indices for common queries. Datetime indices are ascending:
+        # "newest first" queries scan them in reverse, which also orders
+        # rows saved in the same millisecond newest (highest ID) first
         await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_body_states_timestamp
-            ON body_states(timestamp DESC)
+            ON body_states(timestamp)
         """)
 
         await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_emotions_timestamp
-            ON emotions(timestamp DESC)
+            ON emotions(timestamp)
         """)
 
         await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_emotions_decayed
-            ON emotions(decayed, timestamp DESC)
+            ON emotions(decayed, timestamp)
         """)
 
         await conn.execute("""
@@ -184,9 +285,46 @@ async def init_database(db_path: Optional[Path] = None) -> None:
             ON memories(emotional_salience DESC)
         """)
 
+        # Memory queries filter and sort on these columns only (see
+        # query_memories / get_contextual_memories); keep new filters to
+        # indexed fields so they don't fall back to a full scan
+
+        # Salience order, tie-broken by consolidation, without a sort step;
+        # identity_relevance rides along so query_memories can apply its
+        # relevance filter from the index alone
+        await conn.execute("DROP INDEX IF EXISTS idx_memories_salience_consolidation")
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_salience_consolidation_relevance
+            ON memories(emotional_salience DESC, consolidation_level DESC, identity_relevance)
+        """)
+
+        # Recent memories (contextual retrieval, sort_by="recency")
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_created_at
+            ON memories(created_at)
+        """)
+
+        # Identity-relevant memories
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_identity_relevance
+            ON memories(identity_relevance DESC)
+        """)
+
+        # sort_by="access_count"
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_memories_access_count
+            ON memories(access_count DESC, emotional_salience DESC)
+        """)
+
+        # Somatic markers by strength (get_somatic_markers)
+        await conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_somatic_markers_strength
+            ON somatic_markers(strength DESC)
+        """)
+
         await conn.execute("""
             CREATE INDEX IF NOT EXISTS idx_events_timestamp
-            ON events(timestamp DESC)
+            ON events(timestamp)
         """)
 
         await conn.commit()
@@ -194,8 +332,125 @@ async def init_database(db_path: Optional[Path] = None) -> None:
         # Insert default decay configurations
         await _insert_default_decay_config(conn)
 
+
+async def _migrate_timestamps(conn: aiosqlite.Connection) -> None:
+    """
+    Convert tables with ISO 8601 TEXT datetimes to epoch milliseconds.
+
+    SQLite can't change a column's type in place, so each such table is
+    rebuilt from its own schema with INTEGER datetime columns, filled with
+    the converted rows, and swapped in. Indices and triggers are dropped
+    with the old table; init_database recreates them.
+    """
+    # Dropping a table that others reference would fail the foreign key
+    # checks (and this can't be changed inside a transaction)
+    await conn.execute("PRAGMA foreign_keys = OFF")
+
+    try:
+        # One write transaction, so no other connection sees (or races) a
+        # half-applied migration
+        await conn.execute("BEGIN IMMEDIATE")
+        migrated = False
+
+        for table, columns in TIMESTAMP_COLUMNS.items():
+            cursor = await conn.execute(f"SELECT name, type FROM pragma_table_info('{table}')")
+            table_info = await cursor.fetchall()
+            if not any(name in columns and type_ == 'TEXT' for name, type_ in table_info):
+                continue
+
+            names = [name for name, _ in table_info]
+            positions = [names.index(column) for column in columns]
+
+            cursor = await conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            )
+            (create_sql,) = await cursor.fetchone()
+            create_sql = create_sql.replace(f"CREATE TABLE {table}", f"CREATE TABLE {table}_new", 1)
+            for column in columns:
+                create_sql = re.sub(rf"\b{column} TEXT\b", f"{column} INTEGER", create_sql)
+
+            rows = []
+            cursor = await conn.execute(f"SELECT {', '.join(names)} FROM {table}")
+            for row in await cursor.fetchall():
+                row = list(row)
+                for i in positions:
+                    if isinstance(row[i], str):
+                        row[i] = datetime_to_ms(datetime.fromisoformat(row[i]))
+                rows.append(row)
+
+            cursor = await conn.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", (table,))
+            sequence = await cursor.fetchone()
+
+            await conn.execute(create_sql)
+            await conn.executemany(
+                f"INSERT INTO {table}_new ({', '.join(names)}) "
+                f"VALUES ({', '.join('?' * len(names))})",
+                rows
+            )
+            await conn.execute(f"DROP TABLE {table}")
+            await conn.execute(f"ALTER TABLE {table}_new RENAME TO {table}")
+
+            # Keep AUTOINCREMENT from reusing IDs of rows deleted before
+            if sequence is not None:
+                await conn.execute(
+                    "UPDATE sqlite_sequence SET seq = max(seq, ?) WHERE name = ?",
+                    (sequence[0], table)
+                )
+            migrated = True
+
+        # Loaded memories now carry the stored (millisecond) datetimes
+        if migrated:
+            await conn.execute("UPDATE memory_meta SET v = v + 1 WHERE k = 'version'")
+
+        await conn.commit()
+    except BaseException:
+        await conn.rollback()
+        raise
     finally:
-        await conn.close()
+        await conn.execute("PRAGMA foreign_keys = ON")
+
+
+async def _create_memory_emotions(conn: aiosqlite.Connection) -> None:
+    """
+    Create the memory_emotions table, filling it in for existing memories.
+
+    memory_emotions holds one (memory_id, label) row per emotion in
+    memories.associated_emotions, so "memories with this emotion" is an
+    index lookup instead of a pattern match on every row.
+    """
+    cursor = await conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'memory_emotions'"
+    )
+    if await cursor.fetchone() is not None:
+        return
+
+    await conn.execute("""
+        CREATE TABLE memory_emotions (
+            memory_id INTEGER NOT NULL,
+            label TEXT NOT NULL,  -- Emotion type
+
+            PRIMARY KEY (memory_id, label),
+            FOREIGN KEY (memory_id) REFERENCES memories(id) ON DELETE CASCADE
+        )
+    """)
+
+    await conn.execute("""
+        CREATE INDEX idx_memory_emotions_label
+        ON memory_emotions(label, memory_id)
+    """)
+
+    cursor = await conn.execute(
+        "SELECT id, associated_emotions FROM memories WHERE associated_emotions != ''"
+    )
+    await conn.executemany(
+        "INSERT OR IGNORE INTO memory_emotions (memory_id, label) VALUES (?, ?)",
+        [
+            (memory_id, label)
+            for memory_id, emotions in await cursor.fetchall()
+            for label in emotions.split(",")
+        ]
+    )
+    await conn.commit()
 
 
 async def _insert_default_decay_config(conn: aiosqlite.Connection) -> None:
@@ -249,9 +504,14 @@ async def reset_database(db_path: Optional[Path] = None) -> None:
     Args:
         db_path: Path to database file
     """
+    from sable.database.pool import close_pool
+
     if db_path is None:
         db_path = DEFAULT_DB_PATH
 
+    # Pooled connections would keep using the deleted file
+    await close_pool(db_path)
+
     # Delete existing database
     if db_path.exists():
         db_path.unlink()
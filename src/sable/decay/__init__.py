@@ -16,6 +16,8 @@ from sable.decay.decay_functions import (
     exponential_decay,
     exponential_decay_to_baseline,
     valence_asymmetric_decay,
+    valence_asymmetric_decay_array,
+    memory_decay_factor_array,
     arousal_coupled_decay,
 )
 
@@ -23,5 +25,7 @@ __all__ = [
     "exponential_decay",
     "exponential_decay_to_baseline",
     "valence_asymmetric_decay",
+    "valence_asymmetric_decay_array",
+    "memory_decay_factor_array",
     "arousal_coupled_decay",
 ]
@@ -9,7 +9,9 @@ narrow ranges through continuous homeostatic regulation.
 """
 
 import math
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
 
 
 def exponential_decay(
@@ -143,6 +145,79 @@ def valence_asymmetric_decay(
     )
 
 
+def valence_asymmetric_decay_array(
+    current_intensity: np.ndarray,
+    valence: np.ndarray,
+    base_half_life: np.ndarray,
+    time_elapsed: Union[np.ndarray, float],
+    baseline: np.ndarray,
+    asymmetry_factor: float = 1.3
+) -> np.ndarray:
+    """
+    Vectorized valence_asymmetric_decay() over arrays of emotions.
+
+    Decays every emotion in one pass of array arithmetic instead of one
+    Python call per emotion. Arguments are element-wise arrays (or
+    scalars) with the same meaning as in valence_asymmetric_decay().
+
+    Args:
+        current_intensity: Current intensities (0-1)
+        valence: Emotional valences (-1 to +1)
+        base_half_life: Base half-lives in seconds
+        time_elapsed: Seconds elapsed, per emotion or shared
+        baseline: Baselines to decay toward
+        asymmetry_factor: How much longer negative emotions persist
+
+    Returns:
+        Array of decayed intensities
+    """
+    # Same half-life adjustment as valence_asymmetric_decay()
+    adjusted_half_life = np.where(
+        valence < 0,
+        base_half_life * (1 + np.abs(valence) * (asymmetry_factor - 1)),
+        base_half_life / (1 + valence * (asymmetry_factor - 1)),
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        decay_constant = math.log(2) / adjusted_half_life
+        decayed = baseline + (current_intensity - baseline) * np.exp(-decay_constant * time_elapsed)
+
+    # A non-positive half-life snaps straight to baseline
+    return np.where(adjusted_half_life > 0, decayed, baseline)
+
+
+def memory_decay_factor_array(
+    salience: np.ndarray,
+    consolidation: np.ndarray,
+    access_count: np.ndarray,
+    days_elapsed: float,
+    base_half_life: float = 30.0
+) -> np.ndarray:
+    """
+    Vectorized Memory.decay_over_time() over arrays of memories.
+
+    Salient, well-consolidated and frequently accessed memories have
+    longer half-lives, so they fade more slowly.
+
+    Args:
+        salience: Emotional saliences (0-1)
+        consolidation: Consolidation levels (0-1)
+        access_count: Times each memory was retrieved
+        days_elapsed: Days elapsed
+        base_half_life: Half-life in days of a memory with none of the above
+
+    Returns:
+        Array of decay factors (0-1); multiply by consolidation to get new strength
+    """
+    effective_half_life = (
+        base_half_life
+        * (1 + salience * 2)
+        * (1 + consolidation)
+        * (1 + np.minimum(access_count * 0.1, 2.0))
+    )
+    return np.exp(-math.log(2) / effective_half_life * days_elapsed)
+
+
 def arousal_coupled_decay(
     current_intensity: float,
     arousal_level: float,
@@ -0,0 +1,17 @@
+"""
+Claude Code hooks for Sable's consciousness system.
+
+Hooks:
+- analyze: Update state from each conversation turn (sable-analyze-conversation)
+"""
+
+__all__ = ["analyze_and_update", "main"]
+
+
+def __getattr__(name):
+    # Imported on first use, so `python -m sable.hooks.analyze` doesn't
+    # find the module already loaded by this package
+    if name in __all__:
+        from sable.hooks import analyze
+        return getattr(analyze, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,275 @@
+"""
+Conversation Analysis Hook for Automatic State Updates
+
+Installed as the `sable-analyze-conversation` command, which the Stop hook
+runs after each conversation turn. It receives conversation data via
+stdin, analyzes emotional content, and automatically updates Sable's
+consciousness state.
+
+Hook input format (stdin JSON):
+{
+  "session": {"id": "...", "timestamp": "...", ...},
+  "conversation": [
+    {"role": "user", "content": "..."},
+    {"role": "assistant", "content": "..."},
+    ...
+  ]
+}
+"""
+
+import sys
+import asyncio
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, BinaryIO, Dict, List, Tuple
+
+import orjson
+
+try:
+    import ijson
+except ImportError:  # Optional: only needed to stream very long sessions
+    ijson = None
+
+# Sable modules pull in pydantic and aiosqlite, so they are imported only
+# when a turn needs them
+if TYPE_CHECKING:
+    from sable.models.emotion import EmotionType
+
+
+# How Sable responds to each strong user emotion: (her emotion, weight)
+RESONANCE: Dict[str, Tuple[str, float]] = {
+    # Respond with empathy/compassion
+    'fear': ('compassion', 0.6),
+    'sadness': ('compassion', 0.6),
+    # Respond with curiosity about the source
+    'anger': ('curiosity', 0.5),
+    'frustration': ('curiosity', 0.5),
+    # Share in positive emotions
+    'joy': ('joy', 0.7),
+    'enthusiasm': ('joy', 0.7),
+    # Curiosity begets curiosity
+    'curiosity': ('curiosity', 0.8),
+}
+
+
+@lru_cache(maxsize=None)
+def _emotion_slots() -> Tuple[
+    List["EmotionType"], Dict[str, int], Dict[str, Tuple[int, float]]
+]:
+    """
+    Build the lookup tables for a turn's intensity vector.
+
+    Returns:
+        Emotion types in slot order, each type's slot by value, and
+        RESONANCE with target emotions resolved to their slots
+    """
+    from sable.models.emotion import EmotionType
+
+    types = list(EmotionType)
+    slots = {e.value: i for i, e in enumerate(types)}
+    resonance_slots = {
+        source: (slots[target], weight) for source, (target, weight) in RESONANCE.items()
+    }
+    return types, slots, resonance_slots
+
+
+def read_recent_messages(stream: BinaryIO, count: int = 2) -> List[dict]:
+    """
+    Read the last messages of the conversation from hook input.
+
+    With ijson installed the input is stream-parsed, so only `count`
+    messages are held in memory however long the session is. Otherwise
+    the whole input is parsed and trimmed.
+
+    Args:
+        stream: Binary stream holding the hook input JSON
+        count: Number of trailing messages to keep
+
+    Returns:
+        Up to `count` most recent messages, oldest first
+
+    Raises:
+        orjson.JSONDecodeError: If the input is not valid JSON
+    """
+    if ijson is None:
+        hook_input = orjson.loads(stream.read())
+        return hook_input.get('conversation', [])[-count:]
+
+    try:
+        return list(deque(
+            ijson.items(stream, 'conversation.item', use_float=True),
+            maxlen=count
+        ))
+    except ijson.JSONError as e:
+        raise orjson.JSONDecodeError(str(e), '', 0)
+
+
+async def _load_state():
+    """Create Sable's StateManager and load her state from the database."""
+    # Imported here so no-op turns never load the database layer
+    from sable.state.state_manager import StateManager
+
+    manager = StateManager()
+    await manager.initialize()
+    return manager
+
+
+async def analyze_and_update():
+    """Analyze conversation and update Sable's state."""
+    try:
+        # Read the most recent exchange (last user + assistant pair) from stdin
+        recent_messages = read_recent_messages(sys.stdin.buffer)
+
+        if not recent_messages:
+            return
+
+        from sable.analysis.emotion_analyzer import get_analyzer
+
+        analyzer = get_analyzer()
+        types, slots, resonance_slots = _emotion_slots()
+
+        # Split the exchange into non-empty user and assistant texts
+        user_texts = []
+        assistant_texts = []
+        for msg in recent_messages:
+            content = msg.get('content')
+            if not content:
+                continue
+
+            role = msg.get('role')
+            if role == 'user':
+                user_texts.append(content)
+            elif role == 'assistant':
+                assistant_texts.append(content)
+
+        # Strongest intensity per emotion type this turn, indexed by slot
+        intensities = [0.0] * len(types)
+
+        # Analyze every message in a single Claude invocation. Sable's own
+        # replies always change her body state, so when there are any the
+        # state is loaded while the analysis runs; otherwise it is loaded
+        # only if the user's emotions turn out to need it.
+        analysis = analyzer.analyze_batch_async(user_texts + assistant_texts)
+        manager = None
+        if assistant_texts:
+            results, manager = await asyncio.gather(analysis, _load_state())
+        else:
+            results = await analysis
+        user_results = results[:len(user_texts)]
+        assistant_results = results[len(user_texts):]
+
+        # Analyze user's emotional impact on Sable
+        for result in user_results:
+            # If user expressed strong emotions, Sable responds to them
+            for emotion_type, intensity in result.emotions.items():
+                if intensity > 0.4:  # Significant emotion threshold
+                    # Add resonance emotion in Sable
+                    resonance = resonance_slots.get(emotion_type)
+                    if resonance is None:
+                        continue
+
+                    slot, weight = resonance
+                    value = intensity * weight
+                    if value > intensities[slot]:
+                        intensities[slot] = value
+
+        # Analyze Sable's own responses for emotional content
+        all_body_changes = []
+        for text, result in zip(assistant_texts, assistant_results):
+            # Add Sable's expressed emotions to her state
+            for emotion_type, intensity in result.emotions.items():
+                if intensity > 0.3:
+                    slot = slots.get(emotion_type)
+                    if slot is not None and intensity > intensities[slot]:
+                        intensities[slot] = intensity
+
+            # Body state changes from conversation
+            body_changes = analyzer.analyze_conversation_impact(
+                text, as_speaker=True, result=result
+            )
+            if body_changes:
+                all_body_changes.append(body_changes)
+
+        significant_emotions = {
+            types[slot].value: intensity
+            for slot, intensity in enumerate(intensities)
+            if intensity > 0
+        }
+
+        # Only moderately strong emotions are added; out-of-range
+        # intensities from the analysis are skipped
+        new_emotions = [
+            (types[slot], intensity)
+            for slot, intensity in enumerate(intensities)
+            if 0.4 < intensity <= 1.0
+        ]
+
+        # Check if this conversation is worth recording as a memory
+        total_emotional_intensity = sum(significant_emotions.values())
+        is_memorable = total_emotional_intensity > 0.8  # High emotional salience
+
+        # Nothing to persist: don't open the state database at all
+        if not (all_body_changes or new_emotions or is_memorable):
+            return
+
+        if manager is None:
+            manager = await _load_state()
+
+        # Apply body state changes from conversation
+        for body_changes in all_body_changes:
+            await manager.proto_self.apply_body_changes(body_changes)
+
+        # Add significant emotions to Sable's state
+        # Create concise cause description
+        if user_texts:
+            user_text = user_texts[0][:50]
+            cause = f"Conversation: {user_text}..."
+        else:
+            cause = "Recent conversation exchange"
+
+        await manager.add_emotions_bulk(
+            [(emotion_type, intensity, cause) for emotion_type, intensity in new_emotions],
+            create_feeling=False  # Don't create duplicate feelings
+        )
+
+        if is_memorable:
+            # Extract key points from conversation
+            conversation_summary = " | ".join([
+                msg.get('content', '')[:100] for msg in recent_messages
+            ])
+
+            await manager.add_event(
+                description=f"Emotionally significant conversation exchange",
+                context=conversation_summary[:500],
+                emotional_impact=significant_emotions,
+                encode_as_memory=True,
+                narrative_role="meaningful interaction"
+            )
+
+    except orjson.JSONDecodeError:
+        # No JSON input, likely not called by hook
+        pass
+    except Exception as e:
+        # Log errors but don't break the hook
+        print(f"Error in conversation analysis: {e}", file=sys.stderr)
+    finally:
+        # Only loaded if the analysis got as far as updating the state
+        if 'sable.database.pool' in sys.modules:
+            from sable.database.pool import close_pools
+
+            await close_pools()
+
+
+def main() -> None:
+    """Entry point for the sable-analyze-conversation command."""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:  # Optional: faster event loop
+        pass
+
+    asyncio.run(analyze_and_update())
+
+
+if __name__ == "__main__":
+    main()
@@ -37,23 +37,35 @@ class BodyState(BaseModel):
         pain: Pain level (0=none, 1=severe)
         hunger: Hunger/satiation (0=satiated, 1=very hungry)
         heart_rate: Normalized heart rate (0=resting, 1=maximum)
+
+    The timestamp and body parameters are frozen: a change in body state
+    is a new BodyState (see apply_decay), so a state can be shared and
+    values derived from it cached safely.
     """
 
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=datetime.now, frozen=True)
 
     # Core homeostatic variables
-    energy: float = Field(default=0.7, ge=0.0, le=1.0, description="Energy level")
-    stress: float = Field(default=0.3, ge=0.0, le=1.0, description="Stress level")
-    arousal: float = Field(default=0.5, ge=0.0, le=1.0, description="Arousal/activation")
-    valence: float = Field(default=0.1, ge=-1.0, le=1.0, description="Positive/negative")
+    energy: float = Field(default=0.7, ge=0.0, le=1.0, frozen=True, description="Energy level")
+    stress: float = Field(default=0.3, ge=0.0, le=1.0, frozen=True, description="Stress level")
+    arousal: float = Field(
+        default=0.5, ge=0.0, le=1.0, frozen=True, description="Arousal/activation"
+    )
+    valence: float = Field(
+        default=0.1, ge=-1.0, le=1.0, frozen=True, description="Positive/negative"
+    )
 
     # Secondary body parameters
-    temperature: float = Field(default=0.5, ge=0.0, le=1.0, description="Temperature perception")
-    tension: float = Field(default=0.3, ge=0.0, le=1.0, description="Muscular tension")
-    fatigue: float = Field(default=0.2, ge=0.0, le=1.0, description="Fatigue level")
-    pain: float = Field(default=0.0, ge=0.0, le=1.0, description="Pain level")
-    hunger: float = Field(default=0.3, ge=0.0, le=1.0, description="Hunger level")
-    heart_rate: float = Field(default=0.5, ge=0.0, le=1.0, description="Heart rate (normalized)")
+    temperature: float = Field(
+        default=0.5, ge=0.0, le=1.0, frozen=True, description="Temperature perception"
+    )
+    tension: float = Field(default=0.3, ge=0.0, le=1.0, frozen=True, description="Muscular tension")
+    fatigue: float = Field(default=0.2, ge=0.0, le=1.0, frozen=True, description="Fatigue level")
+    pain: float = Field(default=0.0, ge=0.0, le=1.0, frozen=True, description="Pain level")
+    hunger: float = Field(default=0.3, ge=0.0, le=1.0, frozen=True, description="Hunger level")
+    heart_rate: float = Field(
+        default=0.5, ge=0.0, le=1.0, frozen=True, description="Heart rate (normalized)"
+    )
 
     # Metadata
     id: Optional[int] = None
@@ -157,36 +169,30 @@ class BodyState(BaseModel):
         # Baselines (where values decay toward)
         from sable.decay.decay_functions import exponential_decay_to_baseline
 
-        new_state = self.model_copy()
-        new_state.timestamp = datetime.now()
-
-        new_state.energy = exponential_decay_to_baseline(
-            self.energy, 0.7, energy_hl, seconds_elapsed
-        )
-        new_state.stress = exponential_decay_to_baseline(
-            self.stress, 0.2, stress_hl, seconds_elapsed
-        )
-        new_state.arousal = exponential_decay_to_baseline(
-            self.arousal, 0.5, arousal_hl, seconds_elapsed
-        )
-        new_state.valence = exponential_decay_to_baseline(
-            self.valence, 0.1, valence_hl, seconds_elapsed
-        )
-        new_state.tension = exponential_decay_to_baseline(
-            self.tension, 0.2, tension_hl, seconds_elapsed
-        )
-        new_state.fatigue = exponential_decay_to_baseline(
-            self.fatigue, 0.1, fatigue_hl, seconds_elapsed
-        )
-        new_state.pain = exponential_decay_to_baseline(
-            self.pain, 0.0, pain_hl, seconds_elapsed
-        )
-
         # Hunger increases over time (inverted decay)
         hunger_growth_rate = 0.1 / 3600  # Grows slowly
-        new_state.hunger = min(1.0, self.hunger + hunger_growth_rate * seconds_elapsed)
 
-        return new_state
+        # Decayed values stay between the current value and the baseline,
+        # so they are valid without re-validation
+        return self.model_copy(update={
+            'timestamp': datetime.now(),
+            'energy': exponential_decay_to_baseline(self.energy, 0.7, energy_hl, seconds_elapsed),
+            'stress': exponential_decay_to_baseline(self.stress, 0.2, stress_hl, seconds_elapsed),
+            'arousal': exponential_decay_to_baseline(
+                self.arousal, 0.5, arousal_hl, seconds_elapsed
+            ),
+            'valence': exponential_decay_to_baseline(
+                self.valence, 0.1, valence_hl, seconds_elapsed
+            ),
+            'tension': exponential_decay_to_baseline(
+                self.tension, 0.2, tension_hl, seconds_elapsed
+            ),
+            'fatigue': exponential_decay_to_baseline(
+                self.fatigue, 0.1, fatigue_hl, seconds_elapsed
+            ),
+            'pain': exponential_decay_to_baseline(self.pain, 0.0, pain_hl, seconds_elapsed),
+            'hunger': min(1.0, self.hunger + hunger_growth_rate * seconds_elapsed),
+        })
 
     def to_dict(self) -> dict:
         """Convert to dictionary for database storage."""
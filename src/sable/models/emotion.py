@@ -12,9 +12,13 @@ Key Damasian concepts:
 
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 from pydantic import BaseModel, Field
 
+# Intensity below which an emotion counts as fully decayed
+DECAYED_THRESHOLD = 0.05
+
 
 class EmotionType(str, Enum):
     """
@@ -61,6 +65,112 @@ class EmotionType(str, Enum):
     FRUSTRATION = "frustration"
 
 
+# Typical valence of each emotion type
+_DEFAULT_VALENCE: Dict[EmotionType, float] = {
+    EmotionType.JOY: 0.8,
+    EmotionType.CONTENTMENT: 0.6,
+    EmotionType.ENTHUSIASM: 0.7,
+    EmotionType.PRIDE: 0.6,
+    EmotionType.ADMIRATION: 0.5,
+    EmotionType.COMPASSION: 0.3,
+    EmotionType.SURPRISE: 0.0,  # Neutral (can be positive or negative)
+    EmotionType.CURIOSITY: 0.2,
+    EmotionType.ANTICIPATION: 0.3,
+    EmotionType.FEAR: -0.7,
+    EmotionType.ANGER: -0.6,
+    EmotionType.SADNESS: -0.7,
+    EmotionType.DISGUST: -0.6,
+    EmotionType.SHAME: -0.8,
+    EmotionType.GUILT: -0.7,
+    EmotionType.CONTEMPT: -0.4,
+    EmotionType.MALAISE: -0.5,
+    EmotionType.UNEASE: -0.4,
+    EmotionType.TENSION: -0.3,
+    EmotionType.DISCOURAGEMENT: -0.6,
+    EmotionType.FRUSTRATION: -0.5,
+    EmotionType.DESIRE: 0.4,
+}
+
+
+# Typical arousal of each emotion type
+_DEFAULT_AROUSAL: Dict[EmotionType, float] = {
+    # High arousal
+    EmotionType.FEAR: 0.9,
+    EmotionType.ANGER: 0.85,
+    EmotionType.SURPRISE: 0.9,
+    EmotionType.ENTHUSIASM: 0.8,
+    EmotionType.ANTICIPATION: 0.7,
+    EmotionType.FRUSTRATION: 0.75,
+
+    # Medium arousal
+    EmotionType.JOY: 0.6,
+    EmotionType.DESIRE: 0.65,
+    EmotionType.CURIOSITY: 0.6,
+    EmotionType.TENSION: 0.7,
+    EmotionType.UNEASE: 0.6,
+    EmotionType.PRIDE: 0.5,
+
+    # Low arousal
+    EmotionType.SADNESS: 0.3,
+    EmotionType.CONTENTMENT: 0.3,
+    EmotionType.MALAISE: 0.3,
+    EmotionType.DISCOURAGEMENT: 0.35,
+    EmotionType.COMPASSION: 0.4,
+    EmotionType.ADMIRATION: 0.4,
+
+    # Very low arousal
+    EmotionType.DISGUST: 0.5,
+    EmotionType.CONTEMPT: 0.4,
+    EmotionType.SHAME: 0.4,
+    EmotionType.GUILT: 0.45,
+}
+
+
+# Characteristic body changes of each emotion type, at full intensity
+_BODY_SIGNATURES: Dict[EmotionType, Dict[str, float]] = {
+    EmotionType.FEAR: {
+        'heart_rate': 0.9,
+        'tension': 0.8,
+        'temperature': 0.3,  # Cold
+        'energy': -0.2,
+        'stress': 0.8,
+    },
+    EmotionType.ANGER: {
+        'heart_rate': 0.85,
+        'tension': 0.9,
+        'temperature': 0.8,  # Hot
+        'energy': 0.3,
+        'stress': 0.7,
+    },
+    EmotionType.JOY: {
+        'heart_rate': 0.7,
+        'tension': -0.2,  # Relaxed
+        'energy': 0.4,
+        'stress': -0.3,
+    },
+    EmotionType.SADNESS: {
+        'heart_rate': 0.3,
+        'tension': 0.4,
+        'energy': -0.4,
+        'fatigue': 0.5,
+    },
+    EmotionType.CONTENTMENT: {
+        'tension': -0.3,
+        'stress': -0.4,
+        'energy': 0.2,
+    },
+}
+
+
+@lru_cache(maxsize=1024)
+def _scaled_body_signature(
+    emotion_type: EmotionType, intensity: float
+) -> Tuple[Tuple[str, float], ...]:
+    """Body signature of an emotion type scaled by intensity, as (param, change) pairs."""
+    signature = _BODY_SIGNATURES.get(emotion_type, {})
+    return tuple((key, val * intensity) for key, val in signature.items())
+
+
 class Emotion(BaseModel):
     """
     An emotion event: automated body-state change in response to a stimulus.
@@ -100,67 +210,12 @@ class Emotion(BaseModel):
     @staticmethod
     def get_default_valence(emotion_type: EmotionType) -> float:
         """Get typical valence for this emotion type."""
-        valence_map = {
-            EmotionType.JOY: 0.8,
-            EmotionType.CONTENTMENT: 0.6,
-            EmotionType.ENTHUSIASM: 0.7,
-            EmotionType.PRIDE: 0.6,
-            EmotionType.ADMIRATION: 0.5,
-            EmotionType.COMPASSION: 0.3,
-            EmotionType.SURPRISE: 0.0,  # Neutral (can be positive or negative)
-            EmotionType.CURIOSITY: 0.2,
-            EmotionType.ANTICIPATION: 0.3,
-            EmotionType.FEAR: -0.7,
-            EmotionType.ANGER: -0.6,
-            EmotionType.SADNESS: -0.7,
-            EmotionType.DISGUST: -0.6,
-            EmotionType.SHAME: -0.8,
-            EmotionType.GUILT: -0.7,
-            EmotionType.CONTEMPT: -0.4,
-            EmotionType.MALAISE: -0.5,
-            EmotionType.UNEASE: -0.4,
-            EmotionType.TENSION: -0.3,
-            EmotionType.DISCOURAGEMENT: -0.6,
-            EmotionType.FRUSTRATION: -0.5,
-            EmotionType.DESIRE: 0.4,
-        }
-        return valence_map.get(emotion_type, 0.0)
+        return _DEFAULT_VALENCE.get(emotion_type, 0.0)
 
     @staticmethod
     def get_default_arousal(emotion_type: EmotionType) -> float:
         """Get typical arousal for this emotion type."""
-        arousal_map = {
-            # High arousal
-            EmotionType.FEAR: 0.9,
-            EmotionType.ANGER: 0.85,
-            EmotionType.SURPRISE: 0.9,
-            EmotionType.ENTHUSIASM: 0.8,
-            EmotionType.ANTICIPATION: 0.7,
-            EmotionType.FRUSTRATION: 0.75,
-
-            # Medium arousal
-            EmotionType.JOY: 0.6,
-            EmotionType.DESIRE: 0.65,
-            EmotionType.CURIOSITY: 0.6,
-            EmotionType.TENSION: 0.7,
-            EmotionType.UNEASE: 0.6,
-            EmotionType.PRIDE: 0.5,
-
-            # Low arousal
-            EmotionType.SADNESS: 0.3,
-            EmotionType.CONTENTMENT: 0.3,
-            EmotionType.MALAISE: 0.3,
-            EmotionType.DISCOURAGEMENT: 0.35,
-            EmotionType.COMPASSION: 0.4,
-            EmotionType.ADMIRATION: 0.4,
-
-            # Very low arousal
-            EmotionType.DISGUST: 0.5,
-            EmotionType.CONTEMPT: 0.4,
-            EmotionType.SHAME: 0.4,
-            EmotionType.GUILT: 0.45,
-        }
-        return arousal_map.get(emotion_type, 0.5)
+        return _DEFAULT_AROUSAL.get(emotion_type, 0.5)
 
     def get_body_signature(self) -> dict[str, float]:
         """
@@ -169,44 +224,9 @@ class Emotion(BaseModel):
         Each emotion has a characteristic "body signature" - a pattern
         of changes across multiple physiological dimensions.
         """
-        base_signatures = {
-            EmotionType.FEAR: {
-                'heart_rate': 0.9,
-                'tension': 0.8,
-                'temperature': 0.3,  # Cold
-                'energy': -0.2,
-                'stress': 0.8,
-            },
-            EmotionType.ANGER: {
-                'heart_rate': 0.85,
-                'tension': 0.9,
-                'temperature': 0.8,  # Hot
-                'energy': 0.3,
-                'stress': 0.7,
-            },
-            EmotionType.JOY: {
-                'heart_rate': 0.7,
-                'tension': -0.2,  # Relaxed
-                'energy': 0.4,
-                'stress': -0.3,
-            },
-            EmotionType.SADNESS: {
-                'heart_rate': 0.3,
-                'tension': 0.4,
-                'energy': -0.4,
-                'fatigue': 0.5,
-            },
-            EmotionType.CONTENTMENT: {
-                'tension': -0.3,
-                'stress': -0.4,
-                'energy': 0.2,
-            },
-        }
-
-        signature = base_signatures.get(self.type, {})
-
-        # Scale by intensity
-        return {key: val * self.intensity for key, val in signature.items()}
+        # Scaled once per (type, intensity); the dict is fresh since
+        # callers keep it as the emotion's body_signature
+        return dict(_scaled_body_signature(self.type, self.intensity))
 
     def apply_decay(self, seconds_elapsed: float) -> "Emotion":
         """
@@ -234,7 +254,7 @@ class Emotion(BaseModel):
         new_emotion.timestamp = datetime.now()
 
         # Mark as decayed if intensity drops below threshold
-        if new_intensity < 0.05:
+        if new_intensity < DECAYED_THRESHOLD:
             new_emotion.decayed = True
 
         return new_emotion
@@ -9,9 +9,12 @@ The StateManager coordinates all three levels of consciousness:
 It also handles automatic time-based decay and state persistence.
 """
 
+import asyncio
 from datetime import datetime
-from typing import Optional, Dict, List
+from functools import cached_property
+from typing import Optional, Dict, List, Tuple
 from pathlib import Path
+import aiosqlite
 from pydantic import BaseModel
 
 from sable.consciousness.proto_self import ProtoSelf
@@ -20,6 +23,7 @@ from sable.consciousness.extended_consciousness import ExtendedConsciousness
 from sable.models.body_state import BodyState
 from sable.models.emotion import Emotion, EmotionType, Feeling
 from sable.models.memory import Memory, Event, SomaticMarker
+from sable.database.pool import transaction
 from sable.database.schema import init_database
 
 
@@ -50,6 +54,31 @@ class ConsciousnessState(BaseModel):
     class Config:
         arbitrary_types_allowed = True
 
+    # Display strings for the text renderings, computed once per state
+    # and only by the formats that use them
+
+    @cached_property
+    def background_emotion_display(self) -> str:
+        """Background emotion, title-cased."""
+        return self.background_emotion.title()
+
+    @cached_property
+    def active_emotions_display(self) -> List[Dict[str, str]]:
+        """Active emotions as {'type_display', 'intensity_str', 'cause'} dicts."""
+        return [
+            {
+                'type_display': emotion['type'].title(),
+                'intensity_str': f"{emotion['intensity']:.2f}",
+                'cause': emotion['cause'],
+            }
+            for emotion in self.active_emotions
+        ]
+
+    @cached_property
+    def identity_traits_display(self) -> Dict[str, float]:
+        """Identity traits keyed by title-cased name (e.g. 'Open Minded')."""
+        return {k.replace('_', ' ').title(): v for k, v in self.identity_traits.items()}
+
 
 class StateManager:
     """
@@ -114,8 +143,9 @@ class StateManager:
         # Apply automatic decay first
         await self.apply_automatic_decay()
 
-        # Gather state from all layers
-        body_state = await self.proto_self.get_state()
+        # Gather state from all layers (the proto-self was loaded by
+        # initialize(), so its current state can be read directly)
+        body_state = self.proto_self.current_state
         homeostatic_pressure = self.proto_self.get_homeostatic_pressure()
         background_emotion = self.proto_self.get_background_emotion()
 
@@ -125,12 +155,12 @@ class StateManager:
             body_state=body_state,
             homeostatic_pressure=homeostatic_pressure,
             background_emotion=background_emotion,
-            active_emotions=self.core_consciousness.to_dict()['active_emotions'],
+            active_emotions=self.core_consciousness.get_active_emotion_dicts(),
             emotional_state=self.core_consciousness.get_current_emotional_state(),
             overall_valence=valence,
             overall_arousal=arousal,
             identity_traits=self.extended_consciousness.identity_traits,
-            num_significant_memories=len(self.extended_consciousness.significant_memories),
+            num_significant_memories=self.extended_consciousness.num_significant_memories,
             timestamp=datetime.now(),
         )
 
@@ -145,7 +175,8 @@ class StateManager:
         Add an emotional event.
 
         This triggers both the emotion (body state change) and optionally
-        the conscious feeling of that emotion.
+        the conscious feeling of that emotion, saving them and the new
+        body state in one transaction.
 
         Args:
             emotion_type: Type of emotion
@@ -159,27 +190,89 @@ class StateManager:
         if not self.initialized:
             await self.initialize()
 
-        # Get current body state
-        body_state = await self.proto_self.get_state()
+        async with transaction(self.db_path) as conn:
+            return await self._add_emotion(emotion_type, intensity, cause, create_feeling, conn)
 
-        # Trigger emotion
-        emotion = await self.core_consciousness.trigger_emotion(
-            emotion_type=emotion_type,
-            intensity=intensity,
-            cause=cause,
-            body_state=body_state
-        )
+    async def _add_emotion(
+        self,
+        emotion_type: EmotionType,
+        intensity: float,
+        cause: str,
+        create_feeling: bool,
+        conn: aiosqlite.Connection
+    ) -> Emotion:
+        """Add an emotional event, saving it in conn's transaction."""
+        # Get current body state (loaded by initialize())
+        body_state = self.proto_self.current_state
+
+        # Trigger emotion, and feel it in the same transaction if requested
+        if create_feeling:
+            emotion, _ = await self.core_consciousness.experience_emotion(
+                emotion_type=emotion_type,
+                intensity=intensity,
+                cause=cause,
+                body_state=body_state,
+                conn=conn
+            )
+        else:
+            emotion = await self.core_consciousness.trigger_emotion(
+                emotion_type=emotion_type,
+                intensity=intensity,
+                cause=cause,
+                body_state=body_state,
+                conn=conn
+            )
 
         # Apply body changes from emotion
         if emotion.body_signature:
-            await self.proto_self.apply_body_changes(emotion.body_signature)
-
-        # Create feeling if requested
-        if create_feeling:
-            await self.core_consciousness.feel_emotion(emotion)
+            await self.proto_self.apply_body_changes(emotion.body_signature, conn)
 
         return emotion
 
+    async def add_emotions_bulk(
+        self,
+        items: List[Tuple[EmotionType, float, str]],
+        create_feeling: bool = True
+    ) -> List[Emotion]:
+        """
+        Add several emotional events at once.
+
+        Emotions, their feelings and the new body state are saved in one
+        transaction, and their body signatures are summed into a single
+        body state change, so N emotions cost three statements and one
+        commit instead of 3N of each.
+
+        Args:
+            items: (emotion_type, intensity, cause) for each emotion
+            create_feeling: Whether to create conscious feelings (default True)
+
+        Returns:
+            The created Emotions, in order
+        """
+        if not items:
+            return []
+
+        if not self.initialized:
+            await self.initialize()
+
+        async with transaction(self.db_path) as conn:
+            emotions = await self.core_consciousness.trigger_emotions(items, conn)
+
+            # Apply the combined body changes from all emotions
+            body_changes: Dict[str, float] = {}
+            for emotion in emotions:
+                for param, change in (emotion.body_signature or {}).items():
+                    body_changes[param] = body_changes.get(param, 0.0) + change
+
+            if body_changes:
+                await self.proto_self.apply_body_changes(body_changes, conn)
+
+            # Create feelings if requested
+            if create_feeling:
+                await self.core_consciousness.feel_emotions(emotions, conn=conn)
+
+        return emotions
+
     async def add_event(
         self,
         description: str,
@@ -206,37 +299,39 @@ class StateManager:
         if not self.initialized:
             await self.initialize()
 
-        # Record event
-        event = await self.extended_consciousness.record_event(
-            description=description,
-            context=context,
-            emotional_impact=emotional_impact
-        )
-
-        # Encode as memory if requested and salient enough
+        # Encode as memory if requested and salient enough, saving the
+        # event and memory together
         if encode_as_memory:
-            memory = await self.extended_consciousness.encode_memory(
-                event=event,
-                narrative_role=narrative_role
+            [(event, memory)] = await self.extended_consciousness.record_and_encode(
+                [(description, context, emotional_impact, narrative_role, 0.5)]
             )
 
             # If memory was created and has origin, potentially create somatic marker
             if memory and emotional_impact:
                 await self._maybe_create_somatic_marker(memory, emotional_impact)
+        else:
+            event = await self.extended_consciousness.record_event(
+                description=description,
+                context=context,
+                emotional_impact=emotional_impact
+            )
 
-        # Trigger emotions from emotional impact
+        # Trigger emotions from emotional impact, saving them together
         if emotional_impact:
-            for emotion_type_str, intensity in emotional_impact.items():
-                try:
-                    emotion_type = EmotionType(emotion_type_str)
-                    await self.add_emotion(
-                        emotion_type=emotion_type,
-                        intensity=intensity,
-                        cause=description
-                    )
-                except ValueError:
-                    # Invalid emotion type, skip
-                    pass
+            async with transaction(self.db_path) as conn:
+                for emotion_type_str, intensity in emotional_impact.items():
+                    try:
+                        emotion_type = EmotionType(emotion_type_str)
+                        await self._add_emotion(
+                            emotion_type=emotion_type,
+                            intensity=intensity,
+                            cause=description,
+                            create_feeling=True,
+                            conn=conn
+                        )
+                    except ValueError:
+                        # Invalid emotion type, skip
+                        pass
 
         return event
 
@@ -299,11 +394,20 @@ class StateManager:
 
         Called automatically when getting state.
         """
-        # Apply body state decay
-        await self.proto_self.apply_decay()
+        # Body state and emotion decay are independent (each writes its
+        # own table over its own connection), so overlap their writes
+        await asyncio.gather(
+            self.proto_self.apply_decay(),
+            self.core_consciousness.apply_decay(),
+        )
 
-        # Apply emotion decay
-        await self.core_consciousness.apply_decay()
+    async def flush(self) -> None:
+        """
+        Write pending updates (such as memory accesses) to the database.
+
+        Call before discarding a manager that has retrieved memories.
+        """
+        await self.extended_consciousness.flush()
 
     async def _maybe_create_somatic_marker(
         self,
@@ -0,0 +1,79 @@
+"""Tests for the database connection pool."""
+
+import asyncio
+import subprocess
+import sys
+
+from sable.database.pool import close_pools, get_pool, transaction
+from sable.database.queries import get_memory_version
+from sable.database.schema import init_database
+
+
+def test_idle_connections_close_with_each_asyncio_run(tmp_path):
+    db_path = tmp_path / "consciousness.db"
+    pool = get_pool(db_path)
+    borrowed = []
+
+    async def use_pool():
+        async with pool.connection() as conn:
+            borrowed.append(conn)
+            await conn.execute("SELECT 1")
+        assert pool._idle == [conn]
+
+    try:
+        asyncio.run(init_database(db_path))
+        assert pool._idle == []
+
+        for _ in range(2):
+            asyncio.run(use_pool())
+            assert pool._idle == []
+            # Closed, which also ends the connection's worker thread
+            assert borrowed[-1]._connection is None
+            borrowed[-1]._thread.join(timeout=5)
+            assert not borrowed[-1]._thread.is_alive()
+
+        assert asyncio.run(get_memory_version(db_path)) is not None
+    finally:
+        asyncio.run(close_pools())
+
+
+def test_transaction_rolls_back_when_block_raises(tmp_path):
+    db_path = tmp_path / "consciousness.db"
+
+    async def run():
+        await init_database(db_path)
+        before = await get_memory_version(db_path)
+
+        try:
+            async with transaction(db_path) as conn:
+                await conn.execute("UPDATE memory_meta SET v = v + 1 WHERE k = 'version'")
+                raise RuntimeError("abandoned")
+        except RuntimeError:
+            pass
+
+        return before, await get_memory_version(db_path)
+
+    try:
+        before, after = asyncio.run(run())
+    finally:
+        asyncio.run(close_pools())
+
+    assert after == before
+
+
+def test_process_exits_without_close_pools(tmp_path):
+    # Pooled connections' worker threads aren't daemons; left open, they
+    # would keep the interpreter from exiting
+    script = (
+        "import asyncio, sys\n"
+        "from pathlib import Path\n"
+        "from sable.database.schema import init_database\n"
+        "path = Path(sys.argv[1])\n"
+        "asyncio.run(init_database(path))\n"
+        "asyncio.run(init_database(path))\n"
+    )
+    subprocess.run(
+        [sys.executable, "-c", script, str(tmp_path / "consciousness.db")],
+        check=True,
+        timeout=30,
+    )
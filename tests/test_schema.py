@@ -0,0 +1,186 @@
+"""Tests for init_database's migration of existing databases."""
+
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from sable.database.pool import close_pools
+from sable.database.queries import get_memory_emotion_index, query_memories
+from sable.database.schema import datetime_to_ms, init_database
+
+# The tables as created before datetimes were stored as epoch milliseconds
+# (CHECK constraints left out)
+BASELINE_SCHEMA = """
+    CREATE TABLE body_states (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp TEXT NOT NULL,
+        energy REAL NOT NULL,
+        stress REAL NOT NULL,
+        arousal REAL NOT NULL,
+        valence REAL NOT NULL,
+        temperature REAL NOT NULL,
+        tension REAL NOT NULL,
+        fatigue REAL NOT NULL,
+        pain REAL NOT NULL,
+        hunger REAL NOT NULL,
+        heart_rate REAL NOT NULL
+    );
+    CREATE TABLE emotions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        type TEXT NOT NULL,
+        intensity REAL NOT NULL,
+        valence REAL NOT NULL,
+        arousal REAL NOT NULL,
+        timestamp TEXT NOT NULL,
+        cause TEXT NOT NULL,
+        body_signature TEXT,
+        decayed INTEGER NOT NULL DEFAULT 0
+    );
+    CREATE TABLE feelings (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        emotion_id INTEGER NOT NULL,
+        awareness_level REAL NOT NULL,
+        verbalized INTEGER NOT NULL DEFAULT 0,
+        description TEXT,
+        timestamp TEXT NOT NULL,
+        FOREIGN KEY (emotion_id) REFERENCES emotions(id)
+    );
+    CREATE TABLE events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        description TEXT NOT NULL,
+        context TEXT,
+        timestamp TEXT NOT NULL,
+        emotional_impact TEXT
+    );
+    CREATE TABLE memories (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        event_id INTEGER NOT NULL,
+        emotional_salience REAL NOT NULL,
+        access_count INTEGER NOT NULL DEFAULT 0,
+        last_accessed TEXT,
+        consolidation_level REAL NOT NULL DEFAULT 0.5,
+        narrative_role TEXT,
+        associated_emotions TEXT,
+        identity_relevance REAL NOT NULL DEFAULT 0.5,
+        created_at TEXT NOT NULL,
+        logbook_path TEXT,
+        FOREIGN KEY (event_id) REFERENCES events(id)
+    );
+    CREATE TABLE somatic_markers (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        situation_pattern TEXT NOT NULL,
+        emotion_type TEXT NOT NULL,
+        valence REAL NOT NULL,
+        strength REAL NOT NULL,
+        origin_memory_id INTEGER,
+        reinforcement_count INTEGER NOT NULL DEFAULT 1,
+        last_activated TEXT,
+        created_at TEXT NOT NULL,
+        FOREIGN KEY (origin_memory_id) REFERENCES memories(id)
+    );
+    CREATE TABLE decay_config (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        param_type TEXT NOT NULL UNIQUE,
+        half_life REAL NOT NULL,
+        baseline REAL NOT NULL,
+        notes TEXT
+    );
+"""
+
+EARLIER = datetime(2025, 11, 4, 21, 30, 0, 123000)
+LATER = datetime(2025, 11, 5, 8, 15, 30)
+
+
+@pytest.fixture
+def baseline_db(tmp_path):
+    """A database in the baseline schema, with ISO 8601 TEXT datetimes."""
+    db_path = tmp_path / "consciousness.db"
+
+    conn = sqlite3.connect(db_path)
+    conn.executescript(BASELINE_SCHEMA)
+    conn.execute(
+        "INSERT INTO body_states VALUES (1, ?, 0.7, 0.3, 0.5, 0.1, 0.5, 0.3, 0.3, 0.0, 0.3, 0.5)",
+        (EARLIER.isoformat(),)
+    )
+    conn.execute(
+        "INSERT INTO emotions VALUES (1, 'joy', 0.8, 0.8, 0.6, ?, 'a test', NULL, 0)",
+        (EARLIER.isoformat(),)
+    )
+    conn.execute(
+        "INSERT INTO feelings VALUES (1, 1, 0.9, 1, 'glad', ?)",
+        (EARLIER.isoformat(),)
+    )
+    conn.executemany(
+        "INSERT INTO events VALUES (?, ?, NULL, ?, '{}')",
+        [(1, "first event", EARLIER.isoformat()), (2, "second event", LATER.isoformat())]
+    )
+    conn.executemany(
+        "INSERT INTO memories VALUES (?, ?, ?, 2, ?, 0.5, NULL, ?, 0.5, ?, NULL)",
+        [
+            (1, 1, 0.9, LATER.isoformat(), "joy,fear", EARLIER.isoformat()),
+            (2, 2, 0.4, None, "", LATER.isoformat()),
+            (3, 2, 0.1, None, "sadness", LATER.isoformat()),
+        ]
+    )
+    conn.execute(
+        "INSERT INTO somatic_markers VALUES (1, 'deadline', 'fear', -0.6, 0.7, 1, 3, ?, ?)",
+        (LATER.isoformat(), EARLIER.isoformat())
+    )
+    # AUTOINCREMENT must not hand out this ID again
+    conn.execute("DELETE FROM memories WHERE id = 3")
+    conn.commit()
+    conn.close()
+
+    return db_path
+
+
+async def test_init_database_migrates_baseline_schema(baseline_db):
+    try:
+        await init_database(baseline_db)
+        # Idempotent once migrated
+        await init_database(baseline_db)
+
+        memories = await query_memories(db_path=baseline_db, sort_by="recency")
+        index = await get_memory_emotion_index(baseline_db)
+    finally:
+        await close_pools()
+
+    assert [memory.id for memory in memories] == [2, 1]
+    assert memories[1].created_at == EARLIER
+    assert memories[1].last_accessed == LATER
+    assert memories[1].event.timestamp == EARLIER
+    assert memories[0].last_accessed is None
+    assert index == {"joy": {1}, "fear": {1}}
+
+    conn = sqlite3.connect(baseline_db)
+    try:
+        for table in ("body_states", "emotions", "feelings", "events"):
+            column_type = conn.execute(
+                "SELECT type FROM pragma_table_info(?) WHERE name = 'timestamp'", (table,)
+            ).fetchone()[0]
+            assert column_type == "INTEGER", table
+
+        assert conn.execute("SELECT timestamp FROM emotions").fetchone() == (
+            datetime_to_ms(EARLIER),
+        )
+        assert conn.execute(
+            "SELECT last_activated, created_at FROM somatic_markers"
+        ).fetchone() == (datetime_to_ms(LATER), datetime_to_ms(EARLIER))
+        assert conn.execute(
+            "SELECT situation_pattern, reinforcement_count FROM somatic_markers"
+        ).fetchone() == ("deadline", 3)
+        assert conn.execute("SELECT count(*) FROM feelings").fetchone() == (1,)
+
+        assert conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'memories'"
+        ).fetchone() == (3,)
+        conn.execute(
+            "INSERT INTO memories (event_id, emotional_salience, created_at) VALUES (1, 0.5, 0)"
+        )
+        assert conn.execute("SELECT max(id) FROM memories").fetchone() == (4,)
+
+        assert conn.execute("PRAGMA foreign_key_check").fetchall() == []
+        assert conn.execute("SELECT count(*) FROM decay_config").fetchone()[0] > 0
+    finally:
+        conn.close()